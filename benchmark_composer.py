@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Offline render benchmark for VideoComposer.
+
+Synthesizes N segments without any API (solid and gradient images, stock
+clips from predefined_media/, sine-wave MP3 narration of fixed length), then
+runs create_slideshow_with_subtitles under every render mode and encoding
+profile. Wall time, CPU time, peak RSS and output size are reported per
+ffmpeg stage and per run, and written to a JSON report.
+
+Examples:
+    python benchmark_composer.py
+    python benchmark_composer.py --segments 8 --modes single_pass --profiles draft,publish --repeat 3
+    python benchmark_composer.py --no-stock-media --warm-cache --output benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+
+import ffmpeg
+import structlog
+from PIL import Image
+
+from src.config import Config, ENCODING_PROFILES
+from src.video_composer import VideoComposer
+
+
+SAMPLE_TEXTS = [
+    "테슬라 주가가 이점오 퍼센트 상승하며 시장의 관심을 받았습니다",
+    "삼 분기 매출은 오천억 원으로 전년 대비 크게 늘었습니다",
+    "엔비디아는 백억 달러 규모의 자사주 매입을 발표했습니다",
+    "전문가들은 금리 인하가 성장주에 유리하다고 분석합니다",
+]
+
+
+class StageRecorder:
+    """structlog processor that collects the ffmpeg_completed metrics of every stage."""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, logger, method_name, event_dict):
+        if event_dict.get("event") in ("ffmpeg_completed", "ffmpeg_failed"):
+            self.events.append(dict(event_dict))
+        return event_dict
+
+    def summarize(self) -> dict:
+        """Aggregate the collected events per ffmpeg step."""
+        stages = {}
+        for event in self.events:
+            stage = stages.setdefault(event["step"], {
+                "runs": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_rss_mb": 0.0, "output_mb": 0.0
+            })
+            stage["runs"] += 1
+            stage["wall_seconds"] += event.get("wall_seconds", 0.0)
+            stage["cpu_seconds"] += event.get("cpu_seconds", 0.0)
+            stage["peak_rss_mb"] = max(stage["peak_rss_mb"], event.get("peak_rss_mb", 0.0))
+            stage["output_mb"] += event.get("output_mb", 0.0)
+        for stage in stages.values():
+            for key in ("wall_seconds", "cpu_seconds", "output_mb"):
+                stage[key] = round(stage[key], 3)
+        return stages
+
+
+def create_inputs(work_dir: Path, num_segments: int, segment_seconds: float, use_stock_media: bool) -> list:
+    """Synthesize images, stock clips and sine-wave narration for the benchmark segments."""
+    width, height = VideoComposer.OUTPUT_SIZES["9:16"]
+    stock_clips = sorted(Path("predefined_media").rglob("*.mp4")) if use_stock_media else []
+
+    segments = []
+    for i in range(num_segments):
+        # Every third segment is a stock clip (when available), the others alternate solid/gradient images
+        if stock_clips and i % 3 == 2:
+            media_path = stock_clips[(i // 3) % len(stock_clips)]
+        elif i % 2 == 0:
+            media_path = work_dir / f"solid_{i}.png"
+            Image.new("RGB", (width, height), ((40 * i) % 256, 90, 160)).save(media_path)
+        else:
+            media_path = work_dir / f"gradient_{i}.png"
+            gradient = Image.linear_gradient("L").resize((width, height))
+            Image.merge("RGB", (gradient, gradient.rotate(90), Image.new("L", (width, height), 120))).save(media_path)
+
+        audio_path = work_dir / f"narration_{i}.mp3"
+        subprocess.run([
+            'ffmpeg', '-y', '-v', 'error',
+            '-f', 'lavfi', '-i', f'sine=frequency={220 + 55 * i}:duration={segment_seconds}',
+            '-ac', '2', '-c:a', 'libmp3lame', '-b:a', '128k',
+            str(audio_path)
+        ], check=True)
+
+        segments.append({
+            "segment_number": i + 1,
+            "text": SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)],
+            "title": f"벤치마크 구간 {i + 1}",
+            "image_path": str(media_path),
+            "audio_path": str(audio_path),
+            "audio_duration": segment_seconds,
+        })
+
+    return segments
+
+
+def probe_duration(video_path: str) -> float:
+    """Get the duration of a rendered video in seconds."""
+    return round(float(ffmpeg.probe(video_path)["format"]["duration"]), 3)
+
+
+def parse_overrides(assignments: list) -> dict:
+    """Parse KEY=VALUE Config overrides, converting values to the field's type."""
+    defaults = {field.name: field.default for field in fields(Config)}
+    overrides = {}
+    for assignment in assignments:
+        key, _, value = assignment.partition("=")
+        if key not in defaults:
+            raise ValueError(f"Unknown Config field: {key}")
+        default = defaults[key]
+        if isinstance(default, bool):
+            overrides[key] = value.lower() == "true"
+        elif isinstance(default, (int, float)):
+            overrides[key] = type(default)(value)
+        else:
+            overrides[key] = value
+    return overrides
+
+
+def run_benchmark(segments: list, render_mode: str, encoding_profile: str, cache_dir: str, output_dir: Path,
+                  background_music: bool, overrides: dict, verbose: bool) -> dict:
+    """Render the benchmark segments once and measure the run."""
+    recorder = StageRecorder()
+    logger = structlog.wrap_logger(
+        structlog.PrintLogger() if verbose else structlog.ReturnLogger(),
+        processors=[recorder, structlog.processors.KeyValueRenderer()]
+    )
+
+    config = Config(
+        claude_api_key="benchmark",
+        google_api_key="benchmark",
+        elevenlabs_api_key="benchmark",
+        **dict(
+            overrides,
+            render_mode=render_mode,
+            encoding_profile=encoding_profile,
+            cache_dir=cache_dir,
+            output_dir=str(output_dir),
+            enable_background_music=background_music,
+        )
+    )
+    composer = VideoComposer(config, logger)
+
+    usage_before = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    video_path = composer.create_slideshow_with_subtitles(segments, output_dir=str(output_dir))
+    wall_seconds = time.perf_counter() - started
+    usage_after = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    cpu_seconds = sum(
+        (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
+        for before, after in zip(usage_before, usage_after)
+    )
+    stages = recorder.summarize()
+
+    return {
+        "render_mode": render_mode,
+        "encoding_profile": encoding_profile,
+        "wall_seconds": round(wall_seconds, 3),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "peak_rss_mb": max((stage["peak_rss_mb"] for stage in stages.values()), default=0.0),
+        "python_peak_rss_mb": round(usage_after[0].ru_maxrss / 1024, 1),
+        "output_mb": round(Path(video_path).stat().st_size / (1024 * 1024), 3),
+        "output_duration": probe_duration(str(video_path)),
+        "stages": stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VideoComposer renders on synthetic inputs")
+    parser.add_argument("--segments", type=int, default=6, help="Number of segments")
+    parser.add_argument("--segment-seconds", type=float, default=4.0, help="Narration length of each segment")
+    parser.add_argument("--modes", default="multi_pass,single_pass", help="Comma-separated render modes")
+    parser.add_argument("--profiles", default="draft,publish", help="Comma-separated encoding profiles")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per mode/profile combination")
+    parser.add_argument("--no-stock-media", action="store_true", help="Use generated images only")
+    parser.add_argument("--no-background-music", action="store_true", help="Render without background music")
+    parser.add_argument("--warm-cache", action="store_true", help="Share one cache between runs (measures cache hits)")
+    parser.add_argument(
+        "--set", action="append", default=[], metavar="KEY=VALUE",
+        help="Config override for every run (e.g. --set title_overlay_mode=png), repeatable"
+    )
+    parser.add_argument("--output", help="JSON report path (default: benchmarks/benchmark_<timestamp>.json)")
+    parser.add_argument("--verbose", action="store_true", help="Print the composer logs")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    profiles = [profile.strip() for profile in args.profiles.split(",") if profile.strip()]
+    unknown = [profile for profile in profiles if profile not in ENCODING_PROFILES]
+    if unknown:
+        print(f"❌ Unknown encoding profile(s): {', '.join(unknown)}")
+        return 1
+    try:
+        overrides = parse_overrides(args.set)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("=" * 70)
+    print("⏱️  VIDEO COMPOSER BENCHMARK")
+    print("=" * 70)
+    print(f"Segments: {args.segments} x {args.segment_seconds}s  |  Modes: {', '.join(modes)}  |  Profiles: {', '.join(profiles)}")
+    print(f"Repeat: {args.repeat}  |  Cache: {'shared' if args.warm_cache else 'fresh per run'}")
+    if overrides:
+        print(f"Overrides: {overrides}")
+    print()
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="composer_benchmark_") as temp_dir:
+        work_dir = Path(temp_dir)
+        segments = create_inputs(work_dir, args.segments, args.segment_seconds, not args.no_stock_media)
+        print(f"✓ Synthesized {len(segments)} segments in {work_dir}")
+        print()
+
+        for profile in profiles:
+            for mode in modes:
+                for repeat in range(args.repeat):
+                    cache_dir = work_dir / "cache" if args.warm_cache else work_dir / f"cache_{profile}_{mode}_{repeat}"
+                    output_dir = work_dir / f"output_{profile}_{mode}_{repeat}"
+                    try:
+                        result = run_benchmark(
+                            segments, mode, profile, str(cache_dir), output_dir,
+                            background_music=not args.no_background_music,
+                            overrides=overrides,
+                            verbose=args.verbose
+                        )
+                    except Exception as e:
+                        print(f"✗ {profile:<8} {mode:<12} run {repeat + 1}: {type(e).__name__}: {e}")
+                        runs.append({"render_mode": mode, "encoding_profile": profile, "error": str(e)})
+                        continue
+
+                    result["repeat"] = repeat + 1
+                    runs.append(result)
+                    print(
+                        f"✓ {profile:<8} {mode:<12} run {repeat + 1}: "
+                        f"{result['wall_seconds']:7.2f}s wall  {result['cpu_seconds']:7.2f}s CPU  "
+                        f"{result['peak_rss_mb']:7.1f} MB peak  {result['output_mb']:6.2f} MB"
+                    )
+                    for step, stage in sorted(result["stages"].items(), key=lambda item: -item[1]["wall_seconds"]):
+                        print(
+                            f"    {step:<28} x{stage['runs']:<3} {stage['wall_seconds']:7.2f}s wall  "
+                            f"{stage['cpu_seconds']:7.2f}s CPU  {stage['peak_rss_mb']:7.1f} MB"
+                        )
+
+    ffmpeg_version = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True).stdout.split("\n")[0]
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "ffmpeg": ffmpeg_version,
+        },
+        "parameters": {
+            "segments": args.segments,
+            "segment_seconds": args.segment_seconds,
+            "stock_media": not args.no_stock_media,
+            "background_music": not args.no_background_music,
+            "warm_cache": args.warm_cache,
+            "config_overrides": overrides,
+        },
+        "runs": runs,
+    }
+
+    report_path = Path(args.output) if args.output else Path("benchmarks") / f"benchmark_{int(time.time())}.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print()
+    print("=" * 70)
+    print(f"📊 Report saved: {report_path}")
+    print("=" * 70)
+
+    return 0 if all("error" not in run for run in runs) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -25,6 +25,8 @@ Examples:
   python main.py --keyword Tesla    # Generate video about Tesla
   python main.py --keyword 금리인상   # Generate video about interest rate hikes
   python main.py --keyword 암호화폐   # Generate video about cryptocurrency
+  python main.py --videos 3         # Generate videos for the top 3 articles
+  python main.py --resume <run_id>  # Continue a failed run from its last completed step
         """
     )
     parser.add_argument(
@@ -32,6 +34,18 @@ Examples:
         type=str,
         help='Custom keyword for topic search (e.g., "Tesla", "Nvidia", "금리인상", "암호화폐")'
     )
+    parser.add_argument(
+        '--videos',
+        type=int,
+        metavar='COUNT',
+        help='Number of videos to generate, one per top article (overrides VIDEOS_PER_RUN)'
+    )
+    parser.add_argument(
+        '--resume',
+        type=str,
+        metavar='RUN_ID',
+        help='Resume a failed run, skipping the steps it already completed'
+    )
     args = parser.parse_args()
 
     exit_code = 0
@@ -50,6 +64,8 @@ Examples:
         print("Loading configuration...")
         try:
             config = Config.from_env()
+            if args.videos is not None:
+                config.videos_per_run = args.videos
             config.validate()
             print("✓ Configuration loaded successfully")
             print()
@@ -68,9 +84,12 @@ Examples:
 
         print("Running pipeline (this may take several minutes)...")
         print("-" * 60)
-        result = pipeline.run(keyword=args.keyword)
+        result = pipeline.run(keyword=args.keyword, resume_run_id=args.resume)
         print("-" * 60)
         print()
+        if result.run_id:
+            print(f"Run ID: {result.run_id}")
+            print()
 
         # Display results
         if result.success:
@@ -117,6 +136,8 @@ Examples:
             print(f"Execution time: {result.execution_time_seconds:.1f} seconds")
             print()
             print("Check the logs for more details.")
+            if result.run_id:
+                print(f"Resume with: python main.py --resume {result.run_id}")
 
             # Set appropriate exit code based on error category
             error_codes = {
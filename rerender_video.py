@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Re-render a finished video after editing one or more segments.
+
+Uses the render manifest saved next to the video (final_shorts_*.manifest.json):
+only the edited segments are encoded again, every other clip comes from the
+clip cache.
+
+Examples:
+    python rerender_video.py output/final_shorts_1734567890_3f9a1c2e.manifest.json --segment 3 --title "수정된 제목"
+    python rerender_video.py output/final_shorts_1734567890_3f9a1c2e.manifest.json --segment 2 --image new_image.png
+"""
+import argparse
+import time
+
+from dotenv import load_dotenv
+
+from src.config import Config
+from src.utils.error_handler import VideoCompositionError
+from src.utils.logger import setup_logger
+from src.video_composer import VideoComposer
+
+
+def rerender_video(manifest_path: str, segment_number: int, title: str, image_path: str, output_dir: str):
+    """Apply a segment edit and re-render the video from its manifest."""
+    updates = {}
+    if title is not None:
+        updates["title"] = title
+    if image_path is not None:
+        updates["image_path"] = image_path
+
+    if not updates:
+        print("❌ Nothing to change: pass --title and/or --image")
+        return None
+
+    config = Config.from_env()
+    logger = setup_logger(log_level=config.log_level, log_dir=config.log_dir)
+    composer = VideoComposer(config, logger)
+
+    print("=" * 60)
+    print("🔁 RE-RENDER VIDEO")
+    print("=" * 60)
+    print(f"Manifest: {manifest_path}")
+    print(f"Segment {segment_number}: {updates}")
+    print()
+
+    started = time.time()
+    try:
+        video_path = composer.rerender_slideshow(
+            manifest_path,
+            segment_updates={segment_number: updates},
+            output_dir=output_dir
+        )
+    except VideoCompositionError as e:
+        print(f"❌ Re-render failed: {e}")
+        return None
+
+    print(f"✓ Re-rendered in {time.time() - started:.1f}s")
+    print(f"  Video: {video_path}")
+    print(f"  Manifest: {composer.get_manifest_path(video_path)}")
+    print()
+    return video_path
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Re-render a video after editing segments")
+    parser.add_argument("manifest", help="Render manifest (final_shorts_*.manifest.json)")
+    parser.add_argument("--segment", type=int, required=True, help="Segment number to edit")
+    parser.add_argument("--title", help="New segment title")
+    parser.add_argument("--image", help="New image or video for the segment")
+    parser.add_argument("--output-dir", default="output", help="Output folder")
+    args = parser.parse_args()
+
+    rerender_video(args.manifest, args.segment, args.title, args.image, args.output_dir)
@@ -0,0 +1,209 @@
+"""
+Sample-accurate narration timeline.
+
+Segment MP3s are decoded once to PCM (the decoder drops the encoder delay
+and padding recorded in the LAME header), sped up and gained in the same
+ffmpeg process, and stitched into one WAV. Segment lengths are exact sample
+counts, so video clip durations can be derived from the audio the viewer
+hears instead of from MP3 container durations, and the narration is
+encoded only once, by the final AAC encode.
+"""
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .utils.ffmpeg_runner import run_ffmpeg
+
+
+# PCM format of the timeline (matches the final AAC encode, so nothing is resampled twice)
+TIMELINE_SAMPLE_RATE = 48000
+TIMELINE_CHANNELS = 2
+
+
+@dataclass
+class AudioTimeline:
+    """Narration WAV and the exact length of each segment in it."""
+    path: Path
+    sample_rate: int
+    segment_samples: list  # Samples per segment, after speed-up
+
+    @property
+    def duration(self) -> float:
+        """Total duration in seconds."""
+        return sum(self.segment_samples) / self.sample_rate
+
+    @property
+    def segment_durations(self) -> list:
+        """Duration of each segment in seconds."""
+        return [samples / self.sample_rate for samples in self.segment_samples]
+
+    def get_clip_durations(self, fps: int) -> list:
+        """
+        Get video clip durations that stay aligned with the segment boundaries.
+
+        Args:
+            fps: Video frame rate
+
+        Returns:
+            Clip duration of each segment in seconds (whole frames)
+        """
+        return get_clip_durations(self.segment_samples, self.sample_rate, fps)
+
+
+def get_clip_durations(segment_samples: list, sample_rate: int, fps: int) -> list:
+    """
+    Get video clip durations that stay aligned with the segment boundaries.
+
+    Each cut is placed on the frame nearest to its audio boundary, computed
+    from the cumulative sample count, so rounding to whole frames never
+    accumulates into drift across segments. A clip's duration depends only on
+    the segments before it, so durations of a prefix of the timeline are final.
+
+    Args:
+        segment_samples: Samples per segment, after speed-up
+        sample_rate: Sample rate of the timeline
+        fps: Video frame rate
+
+    Returns:
+        Clip duration of each segment in seconds (whole frames)
+    """
+    durations = []
+    samples_so_far = 0
+    frames_so_far = 0
+    for samples in segment_samples:
+        samples_so_far += samples
+        boundary_frame = round(samples_so_far * fps / sample_rate)
+        frames = max(boundary_frame - frames_so_far, 1)
+        durations.append(frames / fps)
+        frames_so_far += frames
+    return durations
+
+
+def _segment_filter(input_label: str, gain: float, speed_factor: float, output_label: str) -> str:
+    """Build the decode chain of one narration segment (timeline format, gain, speed-up)."""
+    return (
+        f"[{input_label}]aresample={TIMELINE_SAMPLE_RATE},"
+        f"aformat=sample_fmts=s16:channel_layouts=stereo,"
+        f"volume={gain:.6f},atempo={speed_factor}[{output_label}]"
+    )
+
+
+def decode_segment_samples(
+    audio_path: str,
+    part_file: Path,
+    speed_factor: float,
+    gain: float,
+    logger: Optional[structlog.BoundLogger] = None
+) -> int:
+    """
+    Decode one narration segment exactly as build_audio_timeline does and count its samples.
+
+    Lets a segment's clip be timed before the rest of the narration exists.
+
+    Args:
+        audio_path: Narration file of the segment
+        part_file: Scratch WAV to decode into (removed afterwards)
+        speed_factor: atempo speed factor applied to the narration
+        gain: Volume multiplier applied to the narration
+        logger: Logger instance
+
+    Returns:
+        Number of samples of the sped-up segment
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    part_file = Path(part_file)
+    try:
+        run_ffmpeg(
+            ['ffmpeg', '-y', '-i', str(audio_path),
+             '-filter_complex', _segment_filter("0:a", gain, speed_factor, "a0"),
+             '-map', '[a0]', '-c:a', 'pcm_s16le', str(part_file)],
+            logger=logger,
+            step="audio_segment_decode"
+        )
+        with wave.open(str(part_file), 'rb') as part:
+            return part.getnframes()
+    finally:
+        part_file.unlink(missing_ok=True)
+
+
+def build_audio_timeline(
+    audio_paths: list,
+    output_file: Path,
+    speed_factor: float,
+    gain,
+    logger: Optional[structlog.BoundLogger] = None
+) -> AudioTimeline:
+    """
+    Decode, speed up and join narration segments into one PCM WAV.
+
+    All segments are decoded by one ffmpeg process, which writes each sped-up
+    segment to its own WAV; the parts are then joined here so every segment
+    length is known to the sample.
+
+    Args:
+        audio_paths: Narration files in timeline order
+        output_file: Path of the timeline WAV to write
+        speed_factor: atempo speed factor applied to the narration
+        gain: Volume multiplier applied to the narration (one for all segments,
+            or a list with one per segment)
+        logger: Logger instance
+
+    Returns:
+        AudioTimeline describing the written WAV
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    logger = logger or structlog.get_logger()
+    output_file = Path(output_file)
+    part_files = [output_file.with_name(f"{output_file.stem}_part{i}.wav") for i in range(len(audio_paths))]
+    gains = list(gain) if isinstance(gain, (list, tuple)) else [gain] * len(audio_paths)
+
+    input_args = []
+    filters = []
+    output_args = []
+    for i, audio_path in enumerate(audio_paths):
+        input_args += ['-i', str(audio_path)]
+        filters.append(_segment_filter(f"{i}:a", gains[i], speed_factor, f"a{i}"))
+        output_args += ['-map', f'[a{i}]', '-c:a', 'pcm_s16le', str(part_files[i])]
+
+    try:
+        run_ffmpeg(
+            ['ffmpeg', '-y'] + input_args + ['-filter_complex', ';'.join(filters)] + output_args,
+            logger=logger,
+            step="audio_timeline"
+        )
+
+        segment_samples = []
+        with wave.open(str(output_file), 'wb') as timeline:
+            timeline.setnchannels(TIMELINE_CHANNELS)
+            timeline.setsampwidth(2)
+            timeline.setframerate(TIMELINE_SAMPLE_RATE)
+            for part_file in part_files:
+                with wave.open(str(part_file), 'rb') as part:
+                    frames = part.readframes(part.getnframes())
+                timeline.writeframes(frames)
+                segment_samples.append(len(frames) // (2 * TIMELINE_CHANNELS))
+    finally:
+        for part_file in part_files:
+            part_file.unlink(missing_ok=True)
+
+    audio_timeline = AudioTimeline(
+        path=output_file,
+        sample_rate=TIMELINE_SAMPLE_RATE,
+        segment_samples=segment_samples
+    )
+
+    logger.info(
+        "audio_timeline_built",
+        segments=len(segment_samples),
+        duration=round(audio_timeline.duration, 3),
+        timeline_path=str(output_file)
+    )
+
+    return audio_timeline
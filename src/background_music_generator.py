@@ -1,20 +1,49 @@
 """
 Background music generation for YouTube Shorts.
+
+Prepared music beds are cached: each bed is a looped (or synthesized) track
+at the mix volume, rendered once to lossless FLAC for a duration rounded up
+to a bucket, and keyed by source content, bucket and volume. Renders reuse a
+bed by trimming it and fading it out in their own filter graph. With loudness
+normalization the volume is the gain that brings the source's cached EBU R128
+measurement to the music loudness target.
 """
+import hashlib
+import json
+import math
+import os
 import random
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional, List
 
 import structlog
 
 from .config import Config
+from .loudness_cache import LoudnessCache, LoudnessMeasurement, measure_loudness
+from .render_manifest import file_digest
 from .utils.error_handler import VideoGenerationError
+from .utils.ffmpeg_governor import PRIORITY_BACKGROUND
+from .utils.ffmpeg_runner import run_ffmpeg
+
+
+# Bump when the bed rendering below changes so stale beds are not reused
+BED_VERSION = 1
 
 
 class BackgroundMusicGenerator:
     """Generates simple background music for videos."""
 
+    # Bed durations are rounded up to a multiple of this (seconds)
+    BED_BUCKET_SECONDS = 30
+
+    # Maximum number of cached beds (least recently used are evicted)
+    MAX_CACHED_BEDS = 32
+
+    # PCM format of the beds (matches the narration timeline and final AAC encode)
+    BED_SAMPLE_RATE = 48000
+
     def __init__(self, config: Config, logger: Optional[structlog.BoundLogger] = None):
         """
         Initialize the Background Music Generator.
@@ -26,6 +55,14 @@ class BackgroundMusicGenerator:
         self.config = config
         self.logger = logger or structlog.get_logger()
         self.music_folder = Path("background_music")
+        self.bed_dir = Path(config.cache_dir) / "bgm_beds"
+        self._lock = threading.Lock()
+        self.loudness_cache = None
+        if config.enable_loudness_normalization:
+            self.loudness_cache = LoudnessCache(
+                db_path=str(Path(config.cache_dir) / "loudness.sqlite3"),
+                logger=self.logger
+            )
 
     def _get_available_music_files(self) -> List[Path]:
         """
@@ -44,165 +81,265 @@ class BackgroundMusicGenerator:
 
         return list(music_files)
 
-    def _prepare_music_file(self, source_file: Path, duration: float, output_file: Path) -> str:
+    def _get_bed_duration(self, duration: float) -> int:
+        """Round a required duration up to the bed bucket."""
+        return max(1, math.ceil(duration / self.BED_BUCKET_SECONDS)) * self.BED_BUCKET_SECONDS
+
+    def _bed_key(self, source_file: Optional[Path], bed_duration: int, volume: float) -> str:
+        """Hash the source content (None for synthetic), bed duration and volume."""
+        key_data = {
+            "version": BED_VERSION,
+            "source": file_digest(str(source_file)) if source_file else "synthetic",
+            "duration": bed_duration,
+            "volume": round(volume, 6),
+            "sample_rate": self.BED_SAMPLE_RATE,
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _get_bed_output_args(self, output_file: Path) -> list:
+        """Encoder arguments shared by all beds: volume applied, lossless FLAC."""
+        return [
+            '-ar', str(self.BED_SAMPLE_RATE),
+            '-ac', '2',
+            '-c:a', 'flac',
+            '-f', 'flac',
+            str(output_file)
+        ]
+
+    def _prepare_music_file(self, source_file: Path, duration: int, volume: float, output_file: Path) -> None:
         """
-        Prepare an existing music file to match the required duration.
+        Render a music bed from an existing music file.
         Loops the music if it's shorter than needed, or trims if longer.
 
         Args:
             source_file: Path to source music file
-            duration: Required duration in seconds
+            duration: Bed duration in seconds
+            volume: Volume applied to the bed
             output_file: Path to output file
 
-        Returns:
-            Path to the prepared music file
-
         Raises:
-            VideoGenerationError: If preparation fails
+            subprocess.CalledProcessError: If ffmpeg fails
         """
-        try:
-            # Use ffmpeg to loop/trim the music to exact duration
-            # The -stream_loop option loops the input, and -t sets duration
-            subprocess.run([
-                'ffmpeg',
-                '-stream_loop', '-1',  # Loop indefinitely
-                '-i', str(source_file),
-                '-t', str(duration),  # Trim to exact duration
-                '-af', 'afade=t=out:st=' + str(duration - 2) + ':d=2',  # Fade out at end
-                '-c:a', 'libmp3lame',
-                '-b:a', '192k',
-                str(output_file)
-            ], check=True, capture_output=True)
-
-            file_size = output_file.stat().st_size
-            if file_size == 0:
-                raise VideoGenerationError("Prepared background music file is empty")
-
-            self.logger.info(
-                "background_music_prepared",
-                source=str(source_file),
-                output=str(output_file),
-                file_size_kb=round(file_size / 1024, 2),
-                duration=duration
-            )
-
-            return str(output_file)
-
-        except subprocess.CalledProcessError as e:
-            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
-            self.logger.error("ffmpeg_music_prep_error", error=stderr_output)
-            raise VideoGenerationError(f"Music preparation failed: {stderr_output}")
-
-    def _generate_synthetic_music(self, duration: float, output_file: Path) -> str:
+        # The -stream_loop option loops the input, and -t sets duration
+        # (the fade out is applied by each render after trimming the bed)
+        run_ffmpeg([
+            'ffmpeg', '-y',
+            '-stream_loop', '-1',  # Loop indefinitely
+            '-i', str(source_file),
+            '-t', str(duration),
+            '-af', f'volume={volume}',
+        ] + self._get_bed_output_args(output_file),
+            logger=self.logger, step="prepare_background_music", expected_duration=duration,
+            priority=PRIORITY_BACKGROUND)
+
+    def _get_synthetic_music_args(self, duration: int) -> tuple:
         """
-        Generate synthetic background music using ffmpeg sine waves.
+        Build the ffmpeg inputs and filter graph of the synthetic music (unity volume).
 
         Args:
             duration: Duration in seconds
-            output_file: Output file path
 
         Returns:
-            Path to the generated music file
+            Tuple of (input arguments, filter_complex chain with one unlabeled output)
+        """
+        # Generate synthetic background music with rhythm and harmonics
+        input_args = [
+            # Bass line (low frequency for foundation)
+            '-f', 'lavfi', '-i', f'sine=frequency=110:duration={duration}',  # A2
+            # Mid tones (melody)
+            '-f', 'lavfi', '-i', f'sine=frequency=220:duration={duration}',  # A3
+            '-f', 'lavfi', '-i', f'sine=frequency=330:duration={duration}',  # E4
+            '-f', 'lavfi', '-i', f'sine=frequency=440:duration={duration}',  # A4
+            # High harmonics (shimmer)
+            '-f', 'lavfi', '-i', f'sine=frequency=660:duration={duration}',  # E5
+            '-f', 'lavfi', '-i', f'sine=frequency=880:duration={duration}',  # A5
+            # Rhythm pulse (adds energy)
+            '-f', 'lavfi', '-i', f'sine=frequency=165:duration={duration}',  # E3 (pulse)
+        ]
+        filter_chain = (
+            # Mix all layers with different volumes for depth
+            '[0:a]volume=0.20[bass];'
+            '[1:a]volume=0.25[mid1];'
+            '[2:a]volume=0.25[mid2];'
+            '[3:a]volume=0.25[mid3];'
+            '[4:a]volume=0.15[high1];'
+            '[5:a]volume=0.15[high2];'
+            '[6:a]atempo=1.5,volume=0.10[pulse];'
+            '[bass][mid1][mid2][mid3][high1][high2][pulse]amix=inputs=7:duration=longest:dropout_transition=3,'
+            'highpass=f=80,'
+            'lowpass=f=8000'
+        )
+        return input_args, filter_chain
+
+    def _generate_synthetic_music(self, duration: int, volume: float, output_file: Path) -> None:
+        """
+        Render a synthetic music bed using ffmpeg sine waves.
+
+        Args:
+            duration: Bed duration in seconds
+            volume: Volume applied to the bed
+            output_file: Output file path
 
         Raises:
-            VideoGenerationError: If generation fails
+            subprocess.CalledProcessError: If ffmpeg fails
         """
-        try:
-            # Generate synthetic background music with rhythm and harmonics
-            subprocess.run([
-                'ffmpeg',
-                # Bass line (low frequency for foundation)
-                '-f', 'lavfi', '-i', f'sine=frequency=110:duration={duration}',  # A2
-                # Mid tones (melody)
-                '-f', 'lavfi', '-i', f'sine=frequency=220:duration={duration}',  # A3
-                '-f', 'lavfi', '-i', f'sine=frequency=330:duration={duration}',  # E4
-                '-f', 'lavfi', '-i', f'sine=frequency=440:duration={duration}',  # A4
-                # High harmonics (shimmer)
-                '-f', 'lavfi', '-i', f'sine=frequency=660:duration={duration}',  # E5
-                '-f', 'lavfi', '-i', f'sine=frequency=880:duration={duration}',  # A5
-                # Rhythm pulse (adds energy)
-                '-f', 'lavfi', '-i', f'sine=frequency=165:duration={duration}',  # E3 (pulse)
-                '-filter_complex',
-                # Mix all layers with different volumes for depth
-                '[0:a]volume=0.20[bass];'
-                '[1:a]volume=0.25[mid1];'
-                '[2:a]volume=0.25[mid2];'
-                '[3:a]volume=0.25[mid3];'
-                '[4:a]volume=0.15[high1];'
-                '[5:a]volume=0.15[high2];'
-                '[6:a]atempo=1.5,volume=0.10[pulse];'
-                '[bass][mid1][mid2][mid3][high1][high2][pulse]amix=inputs=7:duration=longest:dropout_transition=3,'
-                'volume=1.0,'
-                'highpass=f=80,'
-                'lowpass=f=8000',
-                '-c:a', 'libmp3lame',
-                '-b:a', '192k',
-                str(output_file)
-            ], check=True, capture_output=True)
-
-            file_size = output_file.stat().st_size
-            if file_size == 0:
-                raise VideoGenerationError("Generated background music file is empty")
+        input_args, filter_chain = self._get_synthetic_music_args(duration)
+        run_ffmpeg(
+            ['ffmpeg', '-y'] + input_args + ['-filter_complex', f'{filter_chain},volume={volume}']
+            + self._get_bed_output_args(output_file),
+            logger=self.logger, step="synthetic_background_music", expected_duration=duration,
+            priority=PRIORITY_BACKGROUND)
+
+    def _measure_source(self, source_file: Optional[Path]) -> LoudnessMeasurement:
+        """
+        Get the cached loudness of a music file or of the synthetic music.
 
-            self.logger.info(
-                "synthetic_background_music_generated",
-                music_path=str(output_file),
-                file_size_kb=round(file_size / 1024, 2),
-                duration=duration
-            )
+        Args:
+            source_file: Music file, or None for the synthetic music
 
-            return str(output_file)
+        Returns:
+            LoudnessMeasurement at unity volume
+        """
+        if source_file:
+            return self.loudness_cache.measure_file(str(source_file))
+
+        # The synthetic music is stationary: 10 seconds measure it fully
+        key = f"synthetic-music-v{BED_VERSION}"
+        measurement = self.loudness_cache.get(key)
+        if measurement is None:
+            input_args, filter_chain = self._get_synthetic_music_args(10)
+            measurement = measure_loudness(input_args, filter_chain, logger=self.logger)
+            self.loudness_cache.put(key, measurement)
+        return measurement
+
+    def _get_bed_volume(self, source_file: Optional[Path]) -> float:
+        """
+        Get the volume a bed is rendered at.
 
-        except subprocess.CalledProcessError as e:
-            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
-            self.logger.error("ffmpeg_synthetic_music_error", error=stderr_output)
-            raise VideoGenerationError(f"Synthetic music generation failed: {stderr_output}")
+        Args:
+            source_file: Music file, or None for the synthetic music
 
-    def generate_background_music(self, duration: float, output_dir: str = "output") -> str:
+        Returns:
+            Loudness-normalized gain, or the configured background music volume
+        """
+        if self.loudness_cache is None:
+            return self.config.background_music_volume
+
+        measurement = self._measure_source(source_file)
+        volume = measurement.get_gain(self.config.music_loudness_target)
+        self.logger.debug(
+            "background_music_loudness",
+            source_file=str(source_file) if source_file else "synthetic",
+            integrated_lufs=measurement.integrated_lufs,
+            true_peak_dbtp=measurement.true_peak_dbtp,
+            volume=round(volume, 4)
+        )
+        return volume
+
+    def _evict_beds(self) -> None:
+        """Remove the least recently used beds beyond MAX_CACHED_BEDS."""
+        with self._lock:
+            entries = []
+            for path in self.bed_dir.glob("*.flac"):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+
+            excess = len(entries) - self.MAX_CACHED_BEDS
+            if excess <= 0:
+                return
+
+            entries.sort()
+            for _, path in entries[:excess]:
+                path.unlink(missing_ok=True)
+
+            self.logger.debug("background_music_beds_evicted", evicted=excess)
+
+    def generate_background_music(self, duration: float) -> str:
         """
-        Generate or select background music.
+        Get a background music bed covering the required duration.
         First tries to use existing music files from background_music/ folder,
         falls back to synthetic generation if none available.
 
+        The bed already has the background music volume (or the loudness
+        normalized gain) applied and lasts at
+        least duration seconds (rounded up to BED_BUCKET_SECONDS); callers trim
+        it to the video length and apply the fade out.
+
         Args:
-            duration: Duration of the music in seconds
-            output_dir: Directory to save the generated music
+            duration: Required music duration in seconds
 
         Returns:
-            Path to the generated music file
+            Path to the cached FLAC bed
 
         Raises:
             VideoGenerationError: If music generation fails
         """
         try:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            import time
-            music_file = output_path / f"bgm_{int(time.time())}.mp3"
+            bed_duration = self._get_bed_duration(duration)
 
             # Check for existing music files
             available_music = self._get_available_music_files()
+            selected_music = random.choice(available_music) if available_music else None
+
+            volume = self._get_bed_volume(selected_music)
+            bed_file = self.bed_dir / f"{self._bed_key(selected_music, bed_duration, volume)}.flac"
+            if bed_file.exists():
+                try:
+                    # Refresh mtime so eviction treats this bed as recently used
+                    os.utime(bed_file)
+                    self.logger.info(
+                        "background_music_bed_reused",
+                        source_file=str(selected_music) if selected_music else "synthetic",
+                        bed_duration=bed_duration,
+                        bed_path=str(bed_file)
+                    )
+                    return str(bed_file)
+                except FileNotFoundError:
+                    pass  # Evicted by another worker in the meantime
+
+            self.bed_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = bed_file.with_name(f"{bed_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                if selected_music:
+                    # Use existing music file
+                    self.logger.info(
+                        "using_existing_background_music",
+                        source_file=str(selected_music),
+                        bed_duration=bed_duration,
+                        output_path=str(bed_file)
+                    )
+                    self._prepare_music_file(selected_music, bed_duration, volume, temp_file)
+                else:
+                    # Fall back to synthetic generation
+                    self.logger.info(
+                        "generating_synthetic_background_music",
+                        bed_duration=bed_duration,
+                        output_path=str(bed_file)
+                    )
+                    self._generate_synthetic_music(bed_duration, volume, temp_file)
+
+                if temp_file.stat().st_size == 0:
+                    raise VideoGenerationError("Prepared background music file is empty")
+                os.replace(temp_file, bed_file)
+            finally:
+                temp_file.unlink(missing_ok=True)
 
-            if available_music:
-                # Use existing music file
-                selected_music = random.choice(available_music)
-                self.logger.info(
-                    "using_existing_background_music",
-                    source_file=str(selected_music),
-                    duration=duration,
-                    output_path=str(music_file)
-                )
-                return self._prepare_music_file(selected_music, duration, music_file)
-            else:
-                # Fall back to synthetic generation
-                self.logger.info(
-                    "generating_synthetic_background_music",
-                    duration=duration,
-                    output_path=str(music_file)
-                )
-                return self._generate_synthetic_music(duration, music_file)
+            self.logger.info(
+                "background_music_bed_created",
+                bed_path=str(bed_file),
+                file_size_kb=round(bed_file.stat().st_size / 1024, 2),
+                bed_duration=bed_duration
+            )
+
+            self._evict_beds()
+            return str(bed_file)
 
+        except subprocess.CalledProcessError as e:
+            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
+            self.logger.error("ffmpeg_music_prep_error", error=stderr_output)
+            raise VideoGenerationError(f"Background music generation failed: {stderr_output}")
         except Exception as e:
             self.logger.error("bgm_generation_error", error=str(e))
             raise VideoGenerationError(f"Background music generation failed: {str(e)}")
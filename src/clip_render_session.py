@@ -0,0 +1,251 @@
+"""
+Streaming clip rendering for multi_pass renders.
+
+Generating segment content (titles, images, narration) waits on the network
+while encoding clips keeps the CPU busy. Without streaming, the composer starts
+only after every segment exists. A ClipRenderSession takes each segment's
+narration and media as soon as they arrive and encodes its clip right away,
+so clips are rendered while later segments are still being generated. The
+concat and finishing pass start as soon as the last clip lands.
+"""
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .audio_timeline import TIMELINE_SAMPLE_RATE, decode_segment_samples, get_clip_durations
+from .render_manifest import file_digest
+from .utils.error_handler import VideoCompositionError
+from .utils.logger import log_error
+
+
+class ClipRenderSession:
+    """Renders segment clips as their inputs arrive, then finishes the video."""
+
+    def __init__(
+        self,
+        composer,
+        num_segments: int,
+        output_dir: str = "output",
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Clip Render Session.
+
+        Args:
+            composer: VideoComposer that renders the clips and the final video
+            num_segments: Number of segments of the video
+            output_dir: Directory for the clips and the final video
+            logger: Logger instance
+        """
+        self.composer = composer
+        self.num_segments = num_segments
+        self.output_path = Path(output_dir)
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        self.logger = logger or structlog.get_logger()
+        self.timestamp = int(time.time())
+
+        self.width, self.height = composer._get_output_size()
+        self.settings = composer._get_clip_settings(self.width, self.height)
+        workers, self.threads = composer._get_clip_render_budget(num_segments)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # Narration is decoded and measured here, not on the caller's (API pool) thread
+        self._audio_executor = ThreadPoolExecutor(max_workers=1)
+        self._audio_jobs = []  # Future of each narration handed over
+        self._lock = threading.Lock()
+
+        self._segment_samples = [None] * num_segments  # PCM narration samples per segment
+        self._audio_durations = [None] * num_segments
+        self._media = [None] * num_segments  # (media path, segment title)
+        self._clip_durations = [None] * num_segments
+        self._clips = [None] * num_segments  # Future of each clip path
+        self._rendered_files = []  # Clips this session encoded (cached clips are not ours to delete)
+
+        self.logger.info("clip_session_started", segments=num_segments, workers=workers, threads_per_clip=self.threads)
+
+    def add_audio(self, position: int, audio_path: str, audio_duration: float) -> None:
+        """
+        Hand over a segment's narration, timing its clip.
+
+        Only queues the narration and returns at once: decoding and loudness
+        measurement run on the session's audio thread, so the caller can move
+        on to its next API request. Decoding errors surface from finish().
+
+        Args:
+            position: Position of the segment on the timeline
+            audio_path: Narration file of the segment
+            audio_duration: Narration duration reported by the generator
+        """
+        with self._lock:
+            self._audio_jobs.append(
+                self._audio_executor.submit(self._prepare_audio, position, audio_path, audio_duration)
+            )
+
+    def _prepare_audio(self, position: int, audio_path: str, audio_duration: float) -> None:
+        """
+        Decode a segment's narration and time its clip (runs on the audio thread).
+
+        With the PCM narration timeline, a clip's length depends on the exact
+        sample counts of every segment up to it, so clips are timed in order.
+
+        Args:
+            position: Position of the segment on the timeline
+            audio_path: Narration file of the segment
+            audio_duration: Narration duration reported by the generator
+
+        Raises:
+            subprocess.CalledProcessError: If decoding the narration fails
+        """
+        samples = None
+        if self.composer.config.audio_assembly == "pcm":
+            # Also measures the segment's loudness now, off the critical path of the final render
+            gain = self.composer._get_voice_gains([audio_path])[0]
+            samples = decode_segment_samples(
+                audio_path,
+                self.output_path / f"stream_audio_{position}_{self.timestamp}.wav",
+                speed_factor=self.composer.AUDIO_SPEED_FACTOR,
+                gain=gain,
+                logger=self.logger
+            )
+
+        with self._lock:
+            self._audio_durations[position] = audio_duration
+            self._segment_samples[position] = samples
+            self._update_clip_durations()
+            self._dispatch()
+
+    def add_media(self, position: int, media_path: str, title: str) -> None:
+        """
+        Hand over a segment's image or pre-defined video and its title.
+
+        Args:
+            position: Position of the segment on the timeline
+            media_path: Image or video of the segment
+            title: Segment title shown in the clip
+        """
+        with self._lock:
+            self._media[position] = (media_path, title)
+            self._dispatch()
+
+    def _update_clip_durations(self) -> None:
+        """Time every clip whose duration is known (called with the lock held)."""
+        speed_factor = self.composer.AUDIO_SPEED_FACTOR
+        if self.composer.config.audio_assembly != "pcm":
+            # Each clip follows its own narration length
+            for position, audio_duration in enumerate(self._audio_durations):
+                if audio_duration is not None:
+                    self._clip_durations[position] = audio_duration / speed_factor
+            return
+
+        # Cuts follow cumulative sample counts: only the prefix without gaps can be timed
+        known = 0
+        while known < self.num_segments and self._segment_samples[known] is not None:
+            known += 1
+        durations = get_clip_durations(self._segment_samples[:known], TIMELINE_SAMPLE_RATE, self.composer.FPS)
+        self._clip_durations[:known] = durations
+
+    def _dispatch(self) -> None:
+        """Queue every clip whose inputs are complete (called with the lock held)."""
+        for position in range(self.num_segments):
+            if self._clips[position] is not None or self._media[position] is None:
+                continue
+            if self._clip_durations[position] is None:
+                continue  # Not timed yet (waits for its narration, or an earlier segment's)
+
+            media_path, title = self._media[position]
+            segment = {
+                'segment_number': position + 1,
+                'image_path': media_path,
+                'title': title,
+                'clip_duration': self._clip_durations[position],
+            }
+
+            # A clip rendered earlier with the same inputs needs no encode
+            clip_hash = None
+            if self.composer.clip_cache is not None:
+                clip_hash = self.composer._get_clip_hash(position, segment, file_digest(media_path), self.settings)
+                cached_clip = self.composer.clip_cache.get(clip_hash)
+                if cached_clip is not None:
+                    future = Future()
+                    future.set_result(str(cached_clip))
+                    self._clips[position] = future
+                    continue
+
+            job = self.composer._build_clip_job(
+                position, segment, self.output_path / f"stream_clip_{position}_{self.timestamp}.mp4"
+            )
+            self._clips[position] = self._executor.submit(self._render, job, clip_hash)
+            self.logger.info("clip_session_clip_queued", position=position, clip_duration=job['clip_duration'])
+
+    def _render(self, job: dict, clip_hash: Optional[str]) -> str:
+        """Render one clip and store it in the clip cache."""
+        clip_path = self.composer._render_clip(job, self.width, self.height, self.threads)
+        with self._lock:
+            self._rendered_files.append(clip_path)
+        if clip_hash is not None:
+            self.composer.clip_cache.put(clip_hash, clip_path)
+        return clip_path
+
+    def finish(self, segments_data: list) -> str:
+        """
+        Wait for the queued clips, then concatenate and finish the video.
+
+        Clips whose timing no longer matches the final segments (or that were
+        never handed over) are rendered by the finishing render as usual.
+
+        Args:
+            segments_data: Segment data dictionaries in timeline order
+                (see VideoComposer.create_slideshow_with_subtitles)
+
+        Returns:
+            Path to the final slideshow video
+
+        Raises:
+            VideoCompositionError: If a clip or the final render fails
+        """
+        started = time.monotonic()
+        try:
+            for future in self._audio_jobs:
+                future.result()
+        except subprocess.CalledProcessError as e:
+            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
+            log_error(self.logger, e, "clip_render_session.finish")
+            raise VideoCompositionError(f"Failed to decode narration: {stderr_output}")
+        self._audio_executor.shutdown(wait=True)
+
+        prerendered_clips = {}
+        try:
+            for position, future in enumerate(self._clips):
+                if future is not None:
+                    prerendered_clips[position] = (self._clip_durations[position], future.result())
+        except subprocess.CalledProcessError as e:
+            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
+            log_error(self.logger, e, "clip_render_session.finish")
+            raise VideoCompositionError(f"Failed to render clip: {stderr_output}")
+        self._executor.shutdown(wait=True)
+
+        self.logger.info(
+            "clip_session_clips_ready",
+            prerendered=len(prerendered_clips),
+            segments=len(segments_data),
+            wait_seconds=round(time.monotonic() - started, 2)
+        )
+
+        return self.composer.create_slideshow_with_subtitles(
+            segments_data,
+            output_dir=str(self.output_path),
+            render_mode="multi_pass",
+            prerendered_clips=prerendered_clips
+        )
+
+    def close(self) -> None:
+        """Drop queued clips and delete the clips this session rendered."""
+        # Stop timing new clips before the clip queue is shut down
+        self._audio_executor.shutdown(wait=True, cancel_futures=True)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for clip_path in self._rendered_files:
+            Path(clip_path).unlink(missing_ok=True)
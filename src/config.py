@@ -16,6 +16,53 @@ from .utils.error_handler import ConfigurationError
 load_dotenv()
 
 
+@dataclass(frozen=True)
+class EncodingProfile:
+    """x264/AAC settings shared by every ffmpeg encode of a render."""
+
+    preset: str  # x264 speed/quality preset
+    crf: int  # x264 constant rate factor (lower = better quality, bigger files)
+    resolution_scale: float = 1.0  # Output size relative to full resolution (0.5 → 540x960 for 9:16)
+    audio_bitrate: str = "192k"
+    threads: int = 0  # ffmpeg -threads for whole-video encodes (0 = ffmpeg decides)
+    still_image_tune: bool = False  # Add -tune stillimage to Ken Burns image clips
+
+    def video_args(self, still_image: bool = False) -> list:
+        """
+        Get the x264 encoder arguments.
+
+        Args:
+            still_image: Whether the clip is rendered from a still image (Ken Burns)
+
+        Returns:
+            List of ffmpeg video encoder arguments
+        """
+        args = ['-c:v', 'libx264', '-preset', self.preset, '-crf', str(self.crf)]
+        if still_image and self.still_image_tune:
+            args += ['-tune', 'stillimage']
+        return args
+
+    def thread_args(self) -> list:
+        """
+        Get the ffmpeg thread limit arguments (empty when ffmpeg decides).
+
+        Returns:
+            List of ffmpeg arguments
+        """
+        return ['-threads', str(self.threads)] if self.threads else []
+
+
+# Named encoding profiles selectable with ENCODING_PROFILE
+ENCODING_PROFILES = {
+    # Fast styling iterations: half resolution, ultrafast encode
+    "draft": EncodingProfile(preset="ultrafast", crf=28, resolution_scale=0.5, audio_bitrate="128k"),
+    # Upload quality (the long-standing defaults)
+    "publish": EncodingProfile(preset="medium", crf=23),
+    # Master copies: slower preset, higher quality
+    "archive": EncodingProfile(preset="slow", crf=18, audio_bitrate="256k", still_image_tune=True),
+}
+
+
 @dataclass
 class Config:
     """Configuration settings for the video generation pipeline."""
@@ -36,6 +83,9 @@ class Config:
     news_category: str = "business"
     news_country: str = "us"
     max_news_articles: int = 5
+    videos_per_run: int = 1  # Videos produced per run, one per top article (batch mode when above 1)
+    batch_queue_size: int = 1  # Batch mode: articles with generated content waiting for their render
+    news_search_concurrency: int = 4  # Concurrent fallback news searches when the keyword finds nothing
 
     # Claude API Settings
     claude_model: str = "claude-3-5-sonnet-20241022"
@@ -46,7 +96,26 @@ class Config:
     video_duration: int = 60  # Target duration for final video (1 minute with enriched insights)
     segment_duration: int = 4  # Duration for each image segment (3-5 seconds)
     video_aspect_ratio: str = "9:16"  # Portrait for YouTube Shorts
+    output_aspect_ratios: str = ""  # Extra variants rendered in the same ffmpeg pass, comma separated (e.g. "16:9,1:1")
     video_resolution: str = "1080p"
+    encoding_profile: str = "publish"  # Options: draft, publish, archive (see ENCODING_PROFILES)
+    render_mode: str = "multi_pass"  # Options: multi_pass (clip by clip), single_pass (one filter graph, one encode)
+    clip_render_workers: int = 0  # Parallel clip encodes in multi_pass mode (0 = half the CPU cores)
+    ffmpeg_threads_per_clip: int = 0  # ffmpeg -threads per clip encode (0 = split cores between workers)
+    enable_streaming_render: bool = True  # multi_pass: render each clip as soon as its segment's media and narration exist
+    final_encode_chunks: int = 1  # Parallel chunks of the multi_pass finishing encode (1 = one process, 0 = one per ffmpeg slot)
+    enable_ffmpeg_governor: bool = True  # Share a host-wide pool of ffmpeg slots with every other pipeline process
+    ffmpeg_max_concurrent: int = 0  # Host-wide concurrent ffmpeg processes (0 = half the CPU cores)
+    ffmpeg_governor_dir: str = ""  # Lock directory of the slot pool (empty = <system temp>/ffmpeg_governor)
+    ken_burns_engine: str = "zoompan"  # Options: zoompan (ffmpeg filter), fast (decode once, crop/scale per frame)
+    audio_assembly: str = "pcm"  # Options: pcm (decode once to a sample-accurate WAV timeline), concat (MP3 stream-copy concat)
+    clip_intermediate_format: str = "standard"  # Options: standard (re-encode on concat), matched, lossless (stream-copy concat)
+    title_overlay_mode: str = "drawtext"  # Options: drawtext (ffmpeg filters), png (cached pre-rendered overlay)
+    title_overlay_cache_size: int = 256  # Max cached title overlay PNGs (least recently used are evicted)
+    enable_probe_cache: bool = True  # Persist ffprobe results keyed by (path, size, mtime)
+    enable_media_proxies: bool = False  # Reuse pre-defined videos pre-transcoded to output size/fps (see warm_media_proxies.py)
+    enable_clip_cache: bool = True  # Cache encoded clips by content hash and save a render manifest (see rerender_video.py)
+    clip_cache_size: int = 200  # Max cached segment clips (least recently used are evicted)
 
     # Subtitle Settings
     enable_subtitles: bool = True
@@ -59,6 +128,11 @@ class Config:
     enable_background_music: bool = True
     background_music_volume: float = 0.06  # Volume level (0.0-1.0) - 6% to not overpower voice
 
+    # Loudness Normalization (EBU R128, measured once per narration segment / music file and cached)
+    enable_loudness_normalization: bool = True  # Replaces the fixed voice boost and music volume with measured gains
+    voice_loudness_target: float = -16.0  # Integrated loudness of the narration (LUFS)
+    music_loudness_target: float = -32.0  # Integrated loudness of the background music (LUFS)
+
     # Audio Settings (ElevenLabs)
     elevenlabs_voice_id: Optional[str] = None
     elevenlabs_model: str = "eleven_multilingual_v2"
@@ -66,10 +140,20 @@ class Config:
     audio_similarity: float = 0.75
     audio_style: float = 0.5
 
+    # API Concurrency (segment content generation)
+    gemini_text_concurrency: int = 4  # Concurrent Gemini text calls (segment titles, image prompts)
+    gemini_image_concurrency: int = 2  # Concurrent Gemini image generations
+    elevenlabs_concurrency: int = 2  # Concurrent ElevenLabs TTS requests (mind the plan's concurrency limit)
+
     # Application Settings
     log_level: str = "INFO"
     output_dir: str = "output"
     log_dir: str = "logs"
+    cache_dir: str = ".cache"  # Reusable render artifacts (title overlays, ...)
+    scratch_dir: str = ""  # Parent of per-job scratch workspaces (empty = system temp dir)
+    runs_dir: str = "runs"  # Checkpoints of pipeline runs (for main.py --resume)
+    max_saved_runs: int = 20  # Checkpointed runs kept (least recently updated are removed)
+    use_tmpfs_scratch: bool = False  # Put per-job scratch workspaces on /dev/shm when available
     retry_attempts: int = 3
     retry_delay: float = 2.0
 
@@ -115,13 +199,35 @@ class Config:
             "news_category": os.getenv("NEWS_CATEGORY", "business"),
             "news_country": os.getenv("NEWS_COUNTRY", "us"),
             "max_news_articles": int(os.getenv("MAX_NEWS_ARTICLES", "5")),
+            "videos_per_run": int(os.getenv("VIDEOS_PER_RUN", "1")),
+            "batch_queue_size": int(os.getenv("BATCH_QUEUE_SIZE", "1")),
+            "news_search_concurrency": int(os.getenv("NEWS_SEARCH_CONCURRENCY", "4")),
             "claude_model": os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022"),
             "claude_max_tokens": int(os.getenv("CLAUDE_MAX_TOKENS", "2048")),
             "claude_temperature": float(os.getenv("CLAUDE_TEMPERATURE", "0.7")),
             "video_duration": int(os.getenv("VIDEO_DURATION", "30")),
             "segment_duration": int(os.getenv("SEGMENT_DURATION", "4")),
             "video_aspect_ratio": os.getenv("VIDEO_ASPECT_RATIO", "9:16"),
+            "output_aspect_ratios": os.getenv("OUTPUT_ASPECT_RATIOS", ""),
             "video_resolution": os.getenv("VIDEO_RESOLUTION", "1080p"),
+            "encoding_profile": os.getenv("ENCODING_PROFILE", "publish"),
+            "render_mode": os.getenv("RENDER_MODE", "multi_pass"),
+            "clip_render_workers": int(os.getenv("CLIP_RENDER_WORKERS", "0")),
+            "ffmpeg_threads_per_clip": int(os.getenv("FFMPEG_THREADS_PER_CLIP", "0")),
+            "enable_streaming_render": os.getenv("ENABLE_STREAMING_RENDER", "true").lower() == "true",
+            "final_encode_chunks": int(os.getenv("FINAL_ENCODE_CHUNKS", "1")),
+            "enable_ffmpeg_governor": os.getenv("ENABLE_FFMPEG_GOVERNOR", "true").lower() == "true",
+            "ffmpeg_max_concurrent": int(os.getenv("FFMPEG_MAX_CONCURRENT", "0")),
+            "ffmpeg_governor_dir": os.getenv("FFMPEG_GOVERNOR_DIR", ""),
+            "ken_burns_engine": os.getenv("KEN_BURNS_ENGINE", "zoompan"),
+            "audio_assembly": os.getenv("AUDIO_ASSEMBLY", "pcm"),
+            "clip_intermediate_format": os.getenv("CLIP_INTERMEDIATE_FORMAT", "standard"),
+            "title_overlay_mode": os.getenv("TITLE_OVERLAY_MODE", "drawtext"),
+            "title_overlay_cache_size": int(os.getenv("TITLE_OVERLAY_CACHE_SIZE", "256")),
+            "enable_probe_cache": os.getenv("ENABLE_PROBE_CACHE", "true").lower() == "true",
+            "enable_media_proxies": os.getenv("ENABLE_MEDIA_PROXIES", "false").lower() == "true",
+            "enable_clip_cache": os.getenv("ENABLE_CLIP_CACHE", "true").lower() == "true",
+            "clip_cache_size": int(os.getenv("CLIP_CACHE_SIZE", "200")),
             "enable_subtitles": os.getenv("ENABLE_SUBTITLES", "true").lower() == "true",
             "subtitle_font_size": int(os.getenv("SUBTITLE_FONT_SIZE", "130")),
             "subtitle_font_color": os.getenv("SUBTITLE_FONT_COLOR", "white"),
@@ -129,14 +235,25 @@ class Config:
             "subtitle_position": os.getenv("SUBTITLE_POSITION", "bottom"),
             "enable_background_music": os.getenv("ENABLE_BACKGROUND_MUSIC", "true").lower() == "true",
             "background_music_volume": float(os.getenv("BACKGROUND_MUSIC_VOLUME", "0.2")),
+            "enable_loudness_normalization": os.getenv("ENABLE_LOUDNESS_NORMALIZATION", "true").lower() == "true",
+            "voice_loudness_target": float(os.getenv("VOICE_LOUDNESS_TARGET", "-16.0")),
+            "music_loudness_target": float(os.getenv("MUSIC_LOUDNESS_TARGET", "-32.0")),
             "elevenlabs_voice_id": os.getenv("ELEVENLABS_VOICE_ID"),
             "elevenlabs_model": os.getenv("ELEVENLABS_MODEL", "eleven_multilingual_v2"),
             "audio_stability": float(os.getenv("AUDIO_STABILITY", "0.5")),
             "audio_similarity": float(os.getenv("AUDIO_SIMILARITY", "0.75")),
             "audio_style": float(os.getenv("AUDIO_STYLE", "0.5")),
+            "gemini_text_concurrency": int(os.getenv("GEMINI_TEXT_CONCURRENCY", "4")),
+            "gemini_image_concurrency": int(os.getenv("GEMINI_IMAGE_CONCURRENCY", "2")),
+            "elevenlabs_concurrency": int(os.getenv("ELEVENLABS_CONCURRENCY", "2")),
             "log_level": os.getenv("LOG_LEVEL", "INFO"),
             "output_dir": os.getenv("OUTPUT_DIR", "output"),
             "log_dir": os.getenv("LOG_DIR", "logs"),
+            "cache_dir": os.getenv("CACHE_DIR", ".cache"),
+            "scratch_dir": os.getenv("SCRATCH_DIR", ""),
+            "runs_dir": os.getenv("RUNS_DIR", "runs"),
+            "max_saved_runs": int(os.getenv("MAX_SAVED_RUNS", "20")),
+            "use_tmpfs_scratch": os.getenv("USE_TMPFS_SCRATCH", "false").lower() == "true",
             "retry_attempts": int(os.getenv("RETRY_ATTEMPTS", "3")),
             "retry_delay": float(os.getenv("RETRY_DELAY", "2.0")),
         })
@@ -162,10 +279,90 @@ class Config:
         if self.max_news_articles < 1 or self.max_news_articles > 100:
             raise ConfigurationError("max_news_articles must be between 1 and 100")
 
+        # Validate batch production
+        if not 1 <= self.videos_per_run <= self.max_news_articles:
+            raise ConfigurationError("videos_per_run must be between 1 and max_news_articles")
+        if self.batch_queue_size < 1:
+            raise ConfigurationError("batch_queue_size must be at least 1")
+        if self.news_search_concurrency < 1:
+            raise ConfigurationError("news_search_concurrency must be at least 1")
+
         # Validate temperature
         if not 0 <= self.claude_temperature <= 1:
             raise ConfigurationError("claude_temperature must be between 0 and 1")
 
+        # Validate aspect ratio variants
+        valid_aspect_ratios = ["9:16", "16:9", "1:1"]
+        for aspect_ratio in self.get_output_aspect_ratios()[1:]:
+            if aspect_ratio not in valid_aspect_ratios:
+                raise ConfigurationError(
+                    f"Invalid output aspect ratio: {aspect_ratio}. "
+                    f"Must be one of: {', '.join(valid_aspect_ratios)}"
+                )
+
+        # Validate encoding profile
+        if self.encoding_profile not in ENCODING_PROFILES:
+            raise ConfigurationError(
+                f"Invalid encoding profile: {self.encoding_profile}. "
+                f"Must be one of: {', '.join(ENCODING_PROFILES)}"
+            )
+
+        # Validate render mode
+        valid_render_modes = ["multi_pass", "single_pass"]
+        if self.render_mode not in valid_render_modes:
+            raise ConfigurationError(
+                f"Invalid render mode: {self.render_mode}. "
+                f"Must be one of: {', '.join(valid_render_modes)}"
+            )
+
+        # Validate Ken Burns engine
+        valid_ken_burns_engines = ["zoompan", "fast"]
+        if self.ken_burns_engine not in valid_ken_burns_engines:
+            raise ConfigurationError(
+                f"Invalid Ken Burns engine: {self.ken_burns_engine}. "
+                f"Must be one of: {', '.join(valid_ken_burns_engines)}"
+            )
+
+        # Validate narration assembly
+        valid_audio_assemblies = ["pcm", "concat"]
+        if self.audio_assembly not in valid_audio_assemblies:
+            raise ConfigurationError(
+                f"Invalid audio assembly: {self.audio_assembly}. "
+                f"Must be one of: {', '.join(valid_audio_assemblies)}"
+            )
+
+        # Validate clip intermediate format
+        valid_clip_formats = ["standard", "matched", "lossless"]
+        if self.clip_intermediate_format not in valid_clip_formats:
+            raise ConfigurationError(
+                f"Invalid clip intermediate format: {self.clip_intermediate_format}. "
+                f"Must be one of: {', '.join(valid_clip_formats)}"
+            )
+
+        # Validate title overlay settings
+        valid_title_overlay_modes = ["drawtext", "png"]
+        if self.title_overlay_mode not in valid_title_overlay_modes:
+            raise ConfigurationError(
+                f"Invalid title overlay mode: {self.title_overlay_mode}. "
+                f"Must be one of: {', '.join(valid_title_overlay_modes)}"
+            )
+        if self.title_overlay_cache_size < 1:
+            raise ConfigurationError("title_overlay_cache_size must be at least 1")
+
+        # Validate clip cache size
+        if self.clip_cache_size < 1:
+            raise ConfigurationError("clip_cache_size must be at least 1")
+
+        # Validate clip rendering budget
+        if self.clip_render_workers < 0:
+            raise ConfigurationError("clip_render_workers must be 0 (auto) or positive")
+        if self.ffmpeg_threads_per_clip < 0:
+            raise ConfigurationError("ffmpeg_threads_per_clip must be 0 (auto) or positive")
+        if self.final_encode_chunks < 0:
+            raise ConfigurationError("final_encode_chunks must be 0 (auto) or positive")
+        if self.ffmpeg_max_concurrent < 0:
+            raise ConfigurationError("ffmpeg_max_concurrent must be 0 (auto) or positive")
+
         # Validate audio settings
         if not 0 <= self.audio_stability <= 1:
             raise ConfigurationError("audio_stability must be between 0 and 1")
@@ -174,10 +371,51 @@ class Config:
         if not 0 <= self.audio_style <= 1:
             raise ConfigurationError("audio_style must be between 0 and 1")
 
+        # Validate API concurrency
+        if self.gemini_text_concurrency < 1:
+            raise ConfigurationError("gemini_text_concurrency must be at least 1")
+        if self.gemini_image_concurrency < 1:
+            raise ConfigurationError("gemini_image_concurrency must be at least 1")
+        if self.elevenlabs_concurrency < 1:
+            raise ConfigurationError("elevenlabs_concurrency must be at least 1")
+
+        # Validate loudness targets
+        if not -70 < self.voice_loudness_target < 0:
+            raise ConfigurationError("voice_loudness_target must be between -70 and 0 LUFS")
+        if not -70 < self.music_loudness_target < self.voice_loudness_target:
+            raise ConfigurationError("music_loudness_target must be above -70 LUFS and below voice_loudness_target")
+
+        # Validate run checkpoints
+        if self.max_saved_runs < 1:
+            raise ConfigurationError("max_saved_runs must be at least 1")
+
         # Create output directories if they don't exist
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
         Path(self.log_dir).mkdir(parents=True, exist_ok=True)
 
+    def get_encoding_profile(self) -> EncodingProfile:
+        """
+        Get the encoding profile selected by encoding_profile.
+
+        Returns:
+            EncodingProfile instance
+        """
+        return ENCODING_PROFILES[self.encoding_profile]
+
+    def get_output_aspect_ratios(self) -> list:
+        """
+        Get every aspect ratio to render, the primary video_aspect_ratio first.
+
+        Returns:
+            List of unique aspect ratios such as ["9:16", "16:9", "1:1"]
+        """
+        aspect_ratios = [self.video_aspect_ratio]
+        for aspect_ratio in self.output_aspect_ratios.split(","):
+            aspect_ratio = aspect_ratio.strip()
+            if aspect_ratio and aspect_ratio not in aspect_ratios:
+                aspect_ratios.append(aspect_ratio)
+        return aspect_ratios
+
     def __repr__(self) -> str:
         """Return a safe string representation (without API keys)."""
         return (
@@ -3,6 +3,7 @@ Image generation module using Google Gemini Image API.
 """
 import base64
 import time
+import uuid
 from pathlib import Path
 from typing import Optional
 
@@ -239,7 +240,8 @@ class ImageGenerator:
             # Save image
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
-            image_file = output_path / f"image_{int(time.time())}.{extension}"
+            # Unique name: several images can be generated in the same second
+            image_file = output_path / f"image_{int(time.time())}_{uuid.uuid4().hex[:8]}.{extension}"
 
             # Decode and save image
             image_bytes = base64.b64decode(image_data)
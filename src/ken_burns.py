@@ -0,0 +1,213 @@
+"""
+Ken Burns (zoom + pan) motion for still images.
+
+Holds the movement pattern table shared by the zoompan filter path and the
+fast renderer, which decodes the still once and computes every crop window
+at output resolution with sub-pixel accuracy instead of running zoompan on
+a 3x upscaled image.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class MovementPattern:
+    """One Ken Burns movement, expressed in the legacy zoompan parameters."""
+    upscale: float  # Pre-zoompan upscale factor (sets the pan speed in source pixels)
+    zoom_start: float  # Zoom at the first frame
+    zoom_rate: float  # Zoom change per frame (negative zooms out)
+    pan_x: float  # Horizontal pan per frame, in upscaled pixels
+    pan_y: float  # Vertical pan per frame, in upscaled pixels
+
+
+# Dynamic movement patterns: Mix of zoom-in, zoom-out, and varied panning
+# Each pattern creates lively, engaging motion perfect for short clips
+MOVEMENT_PATTERNS = [
+    # Pattern 0: Zoom IN (starts at zoom=1.2, increases to ~1.5) + pan right
+    # Creates focus effect moving right
+    MovementPattern(upscale=3, zoom_start=1.2, zoom_rate=0.001, pan_x=1.5, pan_y=0),
+
+    # Pattern 1: Zoom OUT (starts at zoom=1.5, decreases to ~1.2) + pan left
+    # Creates reveal effect moving left
+    MovementPattern(upscale=3, zoom_start=1.5, zoom_rate=-0.001, pan_x=-1.2, pan_y=0),
+
+    # Pattern 2: Zoom IN + diagonal pan (zoom in, move diagonally down-right)
+    # Creates dramatic focus from top-left
+    MovementPattern(upscale=3, zoom_start=1.2, zoom_rate=0.0012, pan_x=1, pan_y=0.7),
+
+    # Pattern 3: Zoom OUT + upward pan (zoom out, move up)
+    # Creates upward reveal effect
+    MovementPattern(upscale=3, zoom_start=1.5, zoom_rate=-0.001, pan_x=0, pan_y=-1.3),
+
+    # Pattern 4: Strong zoom IN + slow pan right
+    # Creates intense focus with subtle movement
+    MovementPattern(upscale=3.5, zoom_start=1.1, zoom_rate=0.0015, pan_x=0.8, pan_y=0),
+
+    # Pattern 5: Zoom OUT + diagonal pan (zoom out, move diagonally up-left)
+    # Creates sweeping reveal
+    MovementPattern(upscale=3, zoom_start=1.5, zoom_rate=-0.0012, pan_x=-0.9, pan_y=-0.8),
+
+    # Pattern 6: Moderate zoom IN + downward pan
+    # Creates focus moving down
+    MovementPattern(upscale=3, zoom_start=1.2, zoom_rate=0.0008, pan_x=0, pan_y=1.1),
+
+    # Pattern 7: Zoom OUT + horizontal sweep (zoom out, move right)
+    # Creates wide reveal sweep
+    MovementPattern(upscale=3, zoom_start=1.5, zoom_rate=-0.001, pan_x=-1.6, pan_y=0),
+]
+
+
+def get_movement_pattern(index: int) -> MovementPattern:
+    """
+    Select a movement pattern by segment index to add variety across the video.
+
+    Args:
+        index: Segment index
+
+    Returns:
+        MovementPattern for this segment
+    """
+    return MOVEMENT_PATTERNS[index % len(MOVEMENT_PATTERNS)]
+
+
+def _pan_term(value: float) -> str:
+    """Format the '+on*value' / '-on*value' pan term of a zoompan position."""
+    if value == 0:
+        return ""
+    sign = "+" if value > 0 else "-"
+    return f"{sign}on*{abs(value):g}"
+
+
+def build_zoompan_filter(
+    pattern: MovementPattern,
+    total_frames: int,
+    width: int,
+    height: int,
+    fps: int
+) -> str:
+    """
+    Build the legacy upscale + zoompan filter for a movement pattern.
+
+    Args:
+        pattern: Movement pattern
+        total_frames: Number of frames to generate
+        width: Output width
+        height: Output height
+        fps: Output frame rate
+
+    Returns:
+        ffmpeg filter string
+    """
+    # 'on' is frame number (0, 1, 2, ...), zoom starts at initial value
+    zoom_sign = "+" if pattern.zoom_rate >= 0 else "-"
+    zoom = f"{pattern.zoom_start:g}{zoom_sign}{abs(pattern.zoom_rate):g}*on"
+    x = f"iw/2-(iw/zoom/2){_pan_term(pattern.pan_x)}"
+    y = f"ih/2-(ih/zoom/2){_pan_term(pattern.pan_y)}"
+    return (
+        f"scale={pattern.upscale:g}*iw:{pattern.upscale:g}*ih,"
+        f"zoompan=z='{zoom}':x='{x}':y='{y}':d={total_frames}:s={width}x{height}:fps={fps}"
+    )
+
+
+class KenBurnsRenderer:
+    """Renders Ken Burns frames from a still image decoded once."""
+
+    def __init__(self, image_path: str, width: int, height: int):
+        """
+        Initialize the Ken Burns renderer.
+
+        Args:
+            image_path: Path to the still image
+            width: Output width
+            height: Output height
+        """
+        with Image.open(image_path) as image:
+            self.image = image.convert("RGB")
+        self.width = width
+        self.height = height
+
+    def crop_window(self, pattern: MovementPattern, frame: int) -> tuple:
+        """
+        Compute the source crop window of one frame.
+
+        Mirrors zoompan on the upscaled image (zoom clamped to [1, 10], window
+        clamped inside the picture) but keeps the position fractional instead
+        of snapping it to whole upscaled pixels.
+
+        Args:
+            pattern: Movement pattern
+            frame: Output frame number (0-based)
+
+        Returns:
+            (left, top, right, bottom) box in source image pixels
+        """
+        source_width, source_height = self.image.size
+
+        zoom = min(max(pattern.zoom_start + pattern.zoom_rate * frame, 1.0), 10.0)
+        window_width = source_width / zoom
+        window_height = source_height / zoom
+
+        # Pan speed is defined in upscaled pixels; convert back to source pixels
+        left = source_width / 2 - window_width / 2 + frame * pattern.pan_x / pattern.upscale
+        top = source_height / 2 - window_height / 2 + frame * pattern.pan_y / pattern.upscale
+
+        left = min(max(left, 0.0), max(source_width - window_width, 0.0))
+        top = min(max(top, 0.0), max(source_height - window_height, 0.0))
+
+        return left, top, left + window_width, top + window_height
+
+    def render_frame(self, pattern: MovementPattern, frame: int) -> bytes:
+        """
+        Render one raw RGB24 frame at output resolution.
+
+        Args:
+            pattern: Movement pattern
+            frame: Output frame number (0-based)
+
+        Returns:
+            Raw rgb24 frame data
+        """
+        return self.image.resize(
+            (self.width, self.height),
+            Image.Resampling.BILINEAR,
+            box=self.crop_window(pattern, frame)
+        ).tobytes()
+
+    def render_frames(
+        self,
+        pattern: MovementPattern,
+        total_frames: int,
+        workers: int = 1
+    ) -> Iterator[bytes]:
+        """
+        Render raw RGB24 frames for a movement pattern, in order.
+
+        Pillow releases the GIL while resampling, so with several workers frames
+        are rendered in parallel while earlier frames are being encoded.
+
+        Args:
+            pattern: Movement pattern
+            total_frames: Number of frames to render
+            workers: Number of rendering threads
+
+        Yields:
+            Raw rgb24 frame data at output resolution
+        """
+        if workers <= 1:
+            for frame in range(total_frames):
+                yield self.render_frame(pattern, frame)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keep a bounded window of frames in flight (each frame is several MB)
+            pending = deque()
+            for frame in range(total_frames):
+                pending.append(executor.submit(self.render_frame, pattern, frame))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -0,0 +1,213 @@
+"""
+Pre-rendered spinning channel logo.
+
+The channel logo in the bottom left corner makes one full clockwise turn
+every ROTATION_PERIOD seconds. Instead of running a rotate filter on every
+frame of every video, one turn is rendered once per (logo, size, fps) into a
+short RGBA QuickTime Animation clip and kept in a content-keyed on-disk
+cache; the final pass loops it under an overlay.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+
+import structlog
+from PIL import Image, ImageDraw, ImageFont
+
+from .utils.ffmpeg_governor import PRIORITY_BACKGROUND
+from .utils.ffmpeg_runner import run_ffmpeg
+
+
+# Bump when the rendering below changes so stale sprites are not reused
+SPRITE_VERSION = 1
+
+# Seconds per full turn of the logo (the former rotate='t*2*PI/3')
+ROTATION_PERIOD = 3
+
+# Channel logo shipped in the assets folder
+DEFAULT_LOGO_PATH = Path(__file__).parent.parent / "assets" / "channel_logo.png"
+
+
+def render_logo_image(logo_path: Optional[Path], size: int) -> Image.Image:
+    """
+    Render the still logo fitted into a size x size box.
+
+    Args:
+        logo_path: Channel logo image, or None to draw the default business icon
+        size: Bounding box size in pixels
+
+    Returns:
+        RGBA image (aspect ratio of the logo is kept)
+    """
+    if logo_path is not None:
+        logo = Image.open(logo_path).convert("RGBA")
+        # Resize to size while maintaining aspect ratio
+        logo.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return logo
+
+    # Fallback: default business icon (white "$" on a sky blue circle)
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    margin = size // 10
+    draw.ellipse([margin, margin, size - margin, size - margin], fill=(135, 206, 235, 255))
+    try:
+        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size // 2)
+    except OSError:
+        font = ImageFont.load_default()
+    bbox = draw.textbbox((0, 0), "$", font=font)
+    text_x = (size - (bbox[2] - bbox[0])) // 2
+    text_y = (size - (bbox[3] - bbox[1])) // 2 - 5
+    draw.text((text_x, text_y), "$", fill="white", font=font)
+    return img
+
+
+def render_spin_frames(logo: Image.Image, frame_count: int) -> Iterator[Image.Image]:
+    """
+    Render one full clockwise turn of the logo.
+
+    Frame n shows the logo rotated by 360 * n / frame_count degrees, the same
+    angle rotate='t*2*PI/3' gives at t = n / fps, so looping the frames is
+    seamless. Corners outside the logo box are clipped like the rotate filter.
+
+    Args:
+        logo: RGBA logo image
+        frame_count: Number of frames in one turn
+
+    Yields:
+        RGBA frames the size of the logo
+    """
+    for n in range(frame_count):
+        # PIL rotates counterclockwise for positive angles
+        yield logo.rotate(-360.0 * n / frame_count, resample=Image.Resampling.BICUBIC)
+
+
+class LogoSpriteCache:
+    """Content-keyed on-disk cache of spinning logo clips with LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        fps: int,
+        max_entries: int = 16,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Logo Sprite Cache.
+
+        Args:
+            cache_dir: Directory holding the cached clips
+            fps: Output frame rate
+            max_entries: Maximum number of clips kept (least recently used are evicted)
+            logger: Logger instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fps = fps
+        self.max_entries = max_entries
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.Lock()
+
+    def _cache_key(self, logo_path: Optional[Path], size: int) -> str:
+        """Hash the logo bytes and everything else that affects the rendered frames."""
+        logo_digest = None
+        if logo_path is not None:
+            logo_digest = hashlib.sha256(Path(logo_path).read_bytes()).hexdigest()
+        key_data = {
+            "version": SPRITE_VERSION,
+            "logo": logo_digest,
+            "size": size,
+            "fps": self.fps,
+            "period": ROTATION_PERIOD,
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, size: int, logo_path: Optional[Path] = DEFAULT_LOGO_PATH) -> Path:
+        """
+        Get the spinning logo clip, rendering it on a cache miss.
+
+        Args:
+            size: Logo bounding box size in pixels
+            logo_path: Channel logo image (the default business icon is used if it does not exist)
+
+        Returns:
+            Path to the cached RGBA .mov (one full turn, meant to be looped)
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        if logo_path is not None and not Path(logo_path).exists():
+            logo_path = None
+
+        key = self._cache_key(logo_path, size)
+        sprite_path = self.cache_dir / f"{key}.mov"
+
+        if sprite_path.exists():
+            # Refresh mtime so eviction treats this entry as recently used
+            try:
+                os.utime(sprite_path)
+                return sprite_path
+            except FileNotFoundError:
+                pass  # Evicted by another worker in the meantime
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logo = render_logo_image(logo_path, size)
+        frame_count = self.fps * ROTATION_PERIOD
+
+        # Write atomically: parallel renders may ask for the same sprite
+        temp_path = sprite_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        frames = (frame.tobytes() for frame in render_spin_frames(logo, frame_count))
+        try:
+            run_ffmpeg(
+                [
+                    'ffmpeg', '-y',
+                    '-f', 'rawvideo',
+                    '-pix_fmt', 'rgba',
+                    '-s', f'{logo.width}x{logo.height}',
+                    '-r', str(self.fps),
+                    '-i', 'pipe:0',
+                    '-c:v', 'qtrle',  # Lossless with alpha, cheap to decode
+                    '-pix_fmt', 'argb',
+                    '-f', 'mov',
+                    str(temp_path)
+                ],
+                logger=self.logger,
+                step="logo_sprite",
+                stdin_chunks=frames,
+                priority=PRIORITY_BACKGROUND
+            )
+            os.replace(temp_path, sprite_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        self.logger.info(
+            "logo_sprite_rendered",
+            logo_path=str(logo_path) if logo_path else None,
+            size=size,
+            frames=frame_count,
+            sprite_path=str(sprite_path)
+        )
+
+        self._evict()
+        return sprite_path
+
+    def _evict(self) -> None:
+        """Remove the least recently used clips beyond max_entries."""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.mov"):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+
+            entries.sort()
+            for _, path in entries[:excess]:
+                path.unlink(missing_ok=True)
+
+            self.logger.debug("logo_sprite_cache_evicted", evicted=excess)
@@ -0,0 +1,243 @@
+"""
+Persistent EBU R128 loudness measurements.
+
+Integrated loudness (LUFS) and true peak (dBTP) of narration segments and
+background music are measured once with ffmpeg's ebur128 filter and stored
+in a small SQLite database keyed by content hash. Renders turn the stored
+measurements into plain linear gains, so loudness is normalized in the same
+single pass that mixes the audio instead of a second loudnorm analysis pass.
+"""
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .render_manifest import file_digest
+from .utils.ffmpeg_governor import PRIORITY_BACKGROUND
+from .utils.ffmpeg_runner import run_ffmpeg
+
+
+# Highest true peak allowed after applying a gain (dBTP)
+TRUE_PEAK_CEILING = -1.0
+
+# Integrated loudness reported for silence (no gain is applied below it)
+SILENCE_LUFS = -70.0
+
+_INTEGRATED_PATTERN = re.compile(r"I:\s+(-?[\d.]+|-inf) LUFS")
+_TRUE_PEAK_PATTERN = re.compile(r"Peak:\s+(-?[\d.]+|-inf) dBFS")
+
+
+@dataclass(frozen=True)
+class LoudnessMeasurement:
+    """Integrated loudness and true peak of an audio source."""
+    integrated_lufs: float
+    true_peak_dbtp: float
+
+    def get_gain(self, target_lufs: float, true_peak_ceiling: float = TRUE_PEAK_CEILING) -> float:
+        """
+        Get the linear gain that brings the source to a target loudness.
+
+        The gain is lowered when it would push the true peak above the ceiling.
+
+        Args:
+            target_lufs: Target integrated loudness
+            true_peak_ceiling: Highest true peak allowed after the gain (dBTP)
+
+        Returns:
+            Linear gain (1.0 for silent sources)
+        """
+        if self.integrated_lufs <= SILENCE_LUFS:
+            return 1.0
+        gain_db = min(target_lufs - self.integrated_lufs, true_peak_ceiling - self.true_peak_dbtp)
+        return 10 ** (gain_db / 20)
+
+
+def _parse_level(text: str) -> float:
+    """Parse an ebur128 level, mapping -inf to the silence floor."""
+    return SILENCE_LUFS if text == "-inf" else float(text)
+
+
+def measure_loudness(
+    input_args: list,
+    audio_filter: str = "",
+    logger: Optional[structlog.BoundLogger] = None
+) -> LoudnessMeasurement:
+    """
+    Measure loudness with ffmpeg's ebur128 filter.
+
+    Args:
+        input_args: ffmpeg input arguments (e.g. ['-i', path])
+        audio_filter: filter_complex chain producing the measured audio from
+            the inputs (empty to measure the first input's audio as is)
+        logger: Logger instance
+
+    Returns:
+        LoudnessMeasurement
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+        ValueError: If the ebur128 summary cannot be parsed
+    """
+    chain = f"{audio_filter}," if audio_filter else "[0:a]"
+    result = run_ffmpeg(
+        ['ffmpeg', '-hide_banner'] + input_args + [
+            '-filter_complex', f"{chain}ebur128=peak=true",
+            '-f', 'null', '-'
+        ],
+        logger=logger,
+        step="loudness_analysis",
+        priority=PRIORITY_BACKGROUND
+    )
+
+    summary = result.stderr.decode('utf-8', errors='replace').rsplit("Summary:", 1)[-1]
+    integrated = _INTEGRATED_PATTERN.search(summary)
+    true_peak = _TRUE_PEAK_PATTERN.search(summary)
+    if integrated is None or true_peak is None:
+        raise ValueError("ebur128 summary not found in ffmpeg output")
+
+    # Silence reports -inf; clamp so the values stay finite in SQLite
+    return LoudnessMeasurement(
+        integrated_lufs=max(_parse_level(integrated.group(1)), SILENCE_LUFS),
+        true_peak_dbtp=_parse_level(true_peak.group(1))
+    )
+
+
+class LoudnessCache:
+    """SQLite-backed cache of loudness measurements keyed by content hash."""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = 5000,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Loudness Cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_entries: Maximum number of cached measurements (least recently used are pruned)
+            logger: Logger instance
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (shared by threads, guarded by the lock)."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")  # Concurrent runs can read while one writes
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS loudness ("
+                " key TEXT PRIMARY KEY,"
+                " integrated_lufs REAL NOT NULL,"
+                " true_peak_dbtp REAL NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[LoudnessMeasurement]:
+        """
+        Get a cached measurement and mark it as recently used.
+
+        Args:
+            key: Content key (file digest, or a name for generated audio)
+
+        Returns:
+            LoudnessMeasurement, or None if not cached
+        """
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT integrated_lufs, true_peak_dbtp FROM loudness WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE loudness SET last_used = ? WHERE key = ?", (time.time(), key))
+            connection.commit()
+        return LoudnessMeasurement(integrated_lufs=row[0], true_peak_dbtp=row[1])
+
+    def put(self, key: str, measurement: LoudnessMeasurement) -> None:
+        """
+        Store a measurement and prune the least recently used entries.
+
+        Args:
+            key: Content key (file digest, or a name for generated audio)
+            measurement: Measured loudness
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO loudness (key, integrated_lufs, true_peak_dbtp, last_used) VALUES (?, ?, ?, ?)",
+                (key, measurement.integrated_lufs, measurement.true_peak_dbtp, time.time())
+            )
+            connection.execute(
+                "DELETE FROM loudness WHERE rowid IN ("
+                " SELECT rowid FROM loudness ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            connection.commit()
+
+    def measure_file(self, file_path: str) -> LoudnessMeasurement:
+        """
+        Measure an audio file, using the cached result when its content was measured before.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            LoudnessMeasurement
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+            ValueError: If the ebur128 summary cannot be parsed
+            OSError: If the file does not exist
+        """
+        key = file_digest(str(file_path))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        measurement = measure_loudness(['-i', str(file_path)], logger=self.logger)
+        self.put(key, measurement)
+
+        self.logger.info(
+            "loudness_measured",
+            file_path=str(file_path),
+            integrated_lufs=measurement.integrated_lufs,
+            true_peak_dbtp=measurement.true_peak_dbtp
+        )
+        return measurement
+
+    def measure_files(self, file_paths: list, max_workers: int = 4) -> list:
+        """
+        Measure several audio files, running ebur128 for cache misses in a thread pool.
+
+        Args:
+            file_paths: Paths to audio files
+            max_workers: Maximum concurrent ffmpeg processes
+
+        Returns:
+            LoudnessMeasurement of each file, in order
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+            ValueError: If an ebur128 summary cannot be parsed
+            OSError: If a file does not exist
+        """
+        if not file_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+            return list(executor.map(self.measure_file, file_paths))
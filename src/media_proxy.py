@@ -0,0 +1,163 @@
+"""
+Normalized proxy cache for pre-defined library videos.
+
+Stock clips in predefined_media/ are 1920x1080 25fps sources. Each one is
+transcoded once into the output geometry (scale + crop, 30fps CFR, 1 second
+GOP) so later uses only trim or loop an already conformed stream instead of
+decoding, scaling and re-timing the full-resolution original.
+"""
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .utils.ffmpeg_governor import PRIORITY_BACKGROUND
+from .utils.ffmpeg_runner import run_ffmpeg
+
+
+# Bump when the proxy encoding below changes so stale proxies are not reused
+PROXY_VERSION = 1
+
+
+class MediaProxyCache:
+    """On-disk cache of library videos conformed to the output geometry."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        width: int,
+        height: int,
+        fps: int,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Media Proxy Cache.
+
+        Args:
+            cache_dir: Directory holding the proxy files
+            width: Output width
+            height: Output height
+            fps: Output frame rate
+            logger: Logger instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.logger = logger or structlog.get_logger()
+
+    def _cache_key(self, media_path: str) -> str:
+        """Key a source by path, size and mtime plus the proxy geometry."""
+        stat = os.stat(media_path)
+        key_data = {
+            "version": PROXY_VERSION,
+            "path": os.path.realpath(media_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "width": self.width,
+            "height": self.height,
+            "fps": self.fps,
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get_proxy_path(self, media_path: str) -> Path:
+        """
+        Get where the proxy of a source video lives (whether or not it exists yet).
+
+        Args:
+            media_path: Path to the source video
+
+        Returns:
+            Path of the proxy file
+        """
+        return self.cache_dir / f"{self._cache_key(media_path)}.mp4"
+
+    def get_proxy(self, media_path: str) -> Path:
+        """
+        Get the proxy of a source video, transcoding it on a cache miss.
+
+        Args:
+            media_path: Path to the source video
+
+        Returns:
+            Path to the conformed proxy
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        proxy_path = self.get_proxy_path(media_path)
+        if proxy_path.exists():
+            self.logger.debug("media_proxy_hit", media_path=media_path, proxy_path=str(proxy_path))
+            return proxy_path
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = proxy_path.with_name(f"{proxy_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.mp4")
+
+        self.logger.info("creating_media_proxy", media_path=media_path, proxy_path=str(proxy_path))
+
+        fps = self.fps
+        try:
+            run_ffmpeg([
+                'ffmpeg', '-y',
+                '-i', media_path,
+                '-vf', (
+                    f"scale={self.width}:{self.height}:force_original_aspect_ratio=increase,"
+                    f"crop={self.width}:{self.height},setsar=1"
+                ),
+                '-c:v', 'libx264',
+                '-preset', 'medium',
+                '-crf', '18',  # Near-transparent: proxies are re-encoded again with the title
+                '-pix_fmt', 'yuv420p',
+                '-r', str(fps),  # Set frame rate
+                '-vsync', 'cfr',  # Constant frame rate
+                '-g', str(fps),  # Keyframe interval = 1 second
+                '-keyint_min', str(fps),  # Minimum keyframe interval
+                '-sc_threshold', '0',  # No extra scene-cut keyframes: every GOP is exactly 1 second
+                '-an',  # No audio
+                '-movflags', '+faststart',
+                str(temp_path)
+            ], logger=self.logger, step="media_proxy", priority=PRIORITY_BACKGROUND)
+            os.replace(temp_path, proxy_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        self.logger.info(
+            "media_proxy_created",
+            media_path=media_path,
+            proxy_path=str(proxy_path),
+            proxy_size_mb=round(proxy_path.stat().st_size / (1024 * 1024), 2)
+        )
+
+        return proxy_path
+
+    def warm(self, media_paths: list) -> dict:
+        """
+        Create proxies for several source videos ahead of time.
+
+        Args:
+            media_paths: Paths to source videos
+
+        Returns:
+            Dict with 'created', 'cached' and 'failed' source path lists
+        """
+        result = {"created": [], "cached": [], "failed": []}
+
+        for media_path in media_paths:
+            media_path = str(media_path)
+            if self.get_proxy_path(media_path).exists():
+                result["cached"].append(media_path)
+                continue
+            try:
+                self.get_proxy(media_path)
+                result["created"].append(media_path)
+            except subprocess.CalledProcessError as e:
+                stderr_output = e.stderr.decode('utf-8', errors='replace') if e.stderr else "No error output"
+                self.logger.error("media_proxy_error", media_path=media_path, error=stderr_output[-500:])
+                result["failed"].append(media_path)
+
+        return result
@@ -2,7 +2,10 @@
 Main pipeline orchestrator for video generation.
 """
 import json
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -13,7 +16,8 @@ import structlog
 from .config import Config
 from .gemini_news_fetcher import GeminiNewsFetcher
 from .gemini_script_generator import GeminiScriptGenerator
-from .script_segmenter import ScriptSegmenter
+from .run_state import RunState, article_from_dict, article_to_dict
+from .script_segmenter import ScriptSegment, ScriptSegmenter
 from .segment_image_prompt_generator import SegmentImagePromptGenerator
 from .title_generator import TitleGenerator
 from .image_generator import ImageGenerator
@@ -22,6 +26,7 @@ from .video_composer import VideoComposer
 from .media_matcher import MediaMatcher
 from .utils.error_handler import VideoGenerationError, get_error_category
 from .utils.logger import setup_logger, log_error
+from .utils.workspace import JobWorkspace
 
 
 @dataclass
@@ -40,6 +45,20 @@ class VideoResult:
             self.steps_completed = []
 
 
+@dataclass
+class PreparedArticle:
+    """An article whose video content is generated, waiting for its render."""
+    article: object  # NewsArticle
+    article_index: int
+    workspace: JobWorkspace  # Holds the generated images and narration
+    korean_script: str
+    script_segments: list  # List of ScriptSegment
+    segments_data: list  # Segment data dicts (see VideoComposer.create_slideshow_with_subtitles)
+    steps_completed: list
+    variants: Optional[list] = None  # Rendered variants reused from an earlier attempt
+    clip_session: object = None  # ClipRenderSession of a streaming multi_pass render
+
+
 @dataclass
 class PipelineResult:
     """Result of a pipeline execution."""
@@ -49,6 +68,7 @@ class PipelineResult:
     error_category: Optional[str] = None
     execution_time_seconds: float = 0
     news_articles_count: int = 0
+    run_id: Optional[str] = None  # Pass to main.py --resume to continue a failed run
 
     def __post_init__(self):
         if self.videos is None:
@@ -58,6 +78,12 @@ class PipelineResult:
 class VideoPipeline:
     """Orchestrates the entire video generation pipeline."""
 
+    # Searched when the chosen keyword finds no news, in priority order
+    FALLBACK_KEYWORDS = ['Bitcoin', 'cryptocurrency', 'stock market', 'AI', 'economy', 'Tesla']
+
+    # Seconds between checks for an interrupted batch while the prepared-article queue is full
+    BATCH_POLL_INTERVAL = 0.5
+
     def __init__(self, config: Config):
         """
         Initialize the Video Pipeline.
@@ -88,14 +114,18 @@ class VideoPipeline:
         self.logger.info("pipeline_initialized", config=str(config))
 
 
-    def run(self, keyword: Optional[str] = None) -> PipelineResult:
+    def run(self, keyword: Optional[str] = None, resume_run_id: Optional[str] = None) -> PipelineResult:
         """
         Run the complete YouTube Shorts generation pipeline.
-        Generates one video per news article.
+        Generates one video per news article, for the top Config.videos_per_run articles.
+
+        Every completed step is checkpointed under Config.runs_dir; resuming a
+        run skips the steps it already completed.
 
         Args:
             keyword: Optional custom keyword for topic search (e.g., "Tesla", "금리인상")
                     If not provided, randomly selects from predefined media keywords
+            resume_run_id: ID of an earlier run to continue (its keyword is reused)
 
         Returns:
             PipelineResult with execution details
@@ -103,6 +133,20 @@ class VideoPipeline:
         start_time = time.time()
         video_results = []
 
+        try:
+            run_state = self._open_run_state(resume_run_id)
+        except (OSError, ValueError) as e:
+            self.logger.error("run_resume_failed", run_id=resume_run_id, error=str(e))
+            return PipelineResult(
+                success=False,
+                error=f"Cannot resume run {resume_run_id}: {e}",
+                error_category="configuration",
+                run_id=resume_run_id
+            )
+
+        if run_state.is_completed("fetch_news"):
+            keyword = run_state.get("keyword")
+
         # If no keyword provided, randomly select from business/finance/crypto/tech keywords
         if not keyword:
             import random
@@ -120,62 +164,46 @@ class VideoPipeline:
                 reason="no_keyword_provided_using_business_finance_crypto_tech_keywords"
             )
 
-        self.logger.info("pipeline_started", mode="YouTube Shorts Generation (Keyword)", keyword=keyword)
+        self.logger.info(
+            "pipeline_started",
+            mode="YouTube Shorts Generation (Keyword)",
+            keyword=keyword,
+            run_id=run_state.run_id,
+            resumed=resume_run_id is not None
+        )
 
         try:
-            # Step 1: Fetch top business news using Gemini with Google Search
-            self.logger.info("step_1_fetch_news_with_keyword", keyword=keyword)
-            news_articles = self.news_fetcher.fetch_top_business_news(keyword=keyword)
-
-            # If no articles found with keyword, try fallback keywords (business/finance/crypto/tech)
-            if not news_articles and keyword:
-                self.logger.warning(
-                    "no_articles_for_keyword",
-                    keyword=keyword,
-                    action="trying_fallback_keywords"
-                )
-                fallback_keywords = ['Bitcoin', 'cryptocurrency', 'stock market', 'AI', 'economy', 'Tesla']
-                for fallback_keyword in fallback_keywords:
-                    if fallback_keyword == keyword:
-                        continue  # Skip the one we already tried
-                    self.logger.info("trying_fallback_keyword", keyword=fallback_keyword)
-                    news_articles = self.news_fetcher.fetch_top_business_news(keyword=fallback_keyword)
-                    if news_articles:
-                        self.logger.info("fallback_keyword_success", keyword=fallback_keyword)
-                        keyword = fallback_keyword  # Update keyword for logging
-                        break
-
-            # If still no articles, try fetching top headlines without keyword
-            if not news_articles:
-                self.logger.warning("no_articles_with_keywords", action="fetching_top_headlines")
-                news_articles = self.news_fetcher.fetch_top_business_news(keyword=None)
-
-            if not news_articles:
-                raise VideoGenerationError("No news articles found")
+            news_articles = self._fetch_news(keyword, run_state)
 
             self.logger.info("step_1_completed", article_count=len(news_articles))
 
-            # Step 2: Process the top news article
-            top_article = news_articles[0]
-            self.logger.info(
-                "processing_top_article",
-                article_title=top_article.title
-            )
-
-            video_result = self._process_single_article(top_article, 1)
-            video_results.append(video_result)
-
-            if video_result.success:
-                self.logger.info(
-                    "top_article_video_completed",
-                    video_path=video_result.final_video_path
-                )
+            articles = news_articles[:self.config.videos_per_run]
+            if len(articles) > 1:
+                # Step 2: Produce one video per top article (content and renders overlap)
+                video_results.extend(self._process_batch(articles, run_state))
             else:
-                self.logger.warning(
-                    "top_article_video_failed",
-                    error=video_result.error
+                # Step 2: Process the top news article
+                top_article = articles[0]
+                self.logger.info(
+                    "processing_top_article",
+                    article_title=top_article.title
                 )
 
+                video_result = self._process_single_article(top_article, 1, run_state)
+                video_results.append(video_result)
+
+                if video_result.success:
+                    self.logger.info(
+                        "top_article_video_completed",
+                        video_path=video_result.final_video_path
+                    )
+                else:
+                    self.logger.warning(
+                        "top_article_video_failed",
+                        error=video_result.error,
+                        run_id=run_state.run_id
+                    )
+
             # Calculate execution time
             execution_time = time.time() - start_time
 
@@ -195,7 +223,8 @@ class VideoPipeline:
                 success=overall_success,
                 videos=video_results,
                 execution_time_seconds=execution_time,
-                news_articles_count=len(news_articles)
+                news_articles_count=len(news_articles),
+                run_id=run_state.run_id
             )
 
         except Exception as e:
@@ -208,7 +237,8 @@ class VideoPipeline:
                 "pipeline_failed",
                 error=str(e),
                 error_category=error_category,
-                execution_time_seconds=round(execution_time, 2)
+                execution_time_seconds=round(execution_time, 2),
+                run_id=run_state.run_id
             )
 
             return PipelineResult(
@@ -216,204 +246,503 @@ class VideoPipeline:
                 error=str(e),
                 error_category=error_category,
                 execution_time_seconds=execution_time,
-                videos=video_results
+                videos=video_results,
+                run_id=run_state.run_id
+            )
+
+    def _open_run_state(self, resume_run_id: Optional[str]) -> RunState:
+        """
+        Load the run to resume, or start recording a new run.
+
+        Args:
+            resume_run_id: ID of the run to resume (None for a new run)
+
+        Returns:
+            RunState of this run
+
+        Raises:
+            FileNotFoundError: If the run to resume does not exist
+            ValueError: If its state was written by an incompatible version
+        """
+        if resume_run_id:
+            run_state = RunState.load(self.config.runs_dir, resume_run_id, self.logger)
+            self.logger.info(
+                "run_resumed",
+                run_id=run_state.run_id,
+                steps_completed=run_state.get_steps_completed()
             )
+            return run_state
+
+        run_state = RunState(self.config.runs_dir, logger=self.logger)
+        pruned = RunState.prune(self.config.runs_dir, self.config.max_saved_runs, keep=run_state.run_id)
+        run_state.save()
+        self.logger.info("run_started", run_id=run_state.run_id, run_dir=str(run_state.run_dir), pruned_runs=pruned)
+        return run_state
+
+    def _fetch_news(self, keyword: str, run_state: RunState) -> list:
+        """
+        Fetch the news articles of the run (from the checkpoint when resuming).
+
+        Args:
+            keyword: Keyword for topic search
+            run_state: State of the run
+
+        Returns:
+            List of NewsArticle
 
-    def _process_single_article(self, article, article_index: int) -> VideoResult:
+        Raises:
+            VideoGenerationError: If no news articles are found
+        """
+        if run_state.is_completed("fetch_news"):
+            self.logger.info("step_resumed", step="fetch_news", run_id=run_state.run_id)
+            return [article_from_dict(data) for data in run_state.get("articles")]
+
+        # Step 1: Fetch top business news using Gemini with Google Search
+        self.logger.info("step_1_fetch_news_with_keyword", keyword=keyword)
+        news_articles = self.news_fetcher.fetch_top_business_news(keyword=keyword)
+
+        # If no articles found with keyword, search the fallback keywords (business/finance/crypto/tech)
+        # and the top headlines without keyword concurrently
+        if not news_articles:
+            self.logger.warning(
+                "no_articles_for_keyword",
+                keyword=keyword,
+                action="trying_fallback_keywords"
+            )
+            fallback_keywords = [
+                fallback_keyword for fallback_keyword in self.FALLBACK_KEYWORDS + [None]
+                if fallback_keyword != keyword  # Skip the one we already tried
+            ]
+            found_keyword, news_articles = self._search_fallback_news(fallback_keywords)
+            if found_keyword:
+                keyword = found_keyword  # Update keyword for logging
+
+        if not news_articles:
+            raise VideoGenerationError("No news articles found")
+
+        run_state.complete_step(
+            "fetch_news",
+            keyword=keyword,
+            articles=[article_to_dict(article) for article in news_articles]
+        )
+        return news_articles
+
+    def _search_fallback_news(self, keywords: list) -> tuple:
+        """
+        Search several keywords concurrently and take the first hit in priority order.
+
+        Up to Config.news_search_concurrency searches run at once. A keyword's
+        result is taken once every keyword before it came back empty, so the
+        outcome is the same as trying them one by one; searches still queued
+        are then cancelled (searches in flight finish in the background).
+
+        Args:
+            keywords: Keywords in priority order (None searches the top headlines)
+
+        Returns:
+            Tuple of (keyword that found articles, articles); the articles list is
+            empty if no keyword found any
+
+        Raises:
+            NewsAPIError: If no keyword found articles and a search failed
+        """
+        started = time.time()
+        executor = ThreadPoolExecutor(max_workers=min(self.config.news_search_concurrency, len(keywords)))
+        try:
+            futures = []
+            for fallback_keyword in keywords:
+                self.logger.info("trying_fallback_keyword", keyword=fallback_keyword)
+                futures.append(executor.submit(self.news_fetcher.fetch_top_business_news, keyword=fallback_keyword))
+
+            first_error = None
+            for fallback_keyword, future in zip(keywords, futures):
+                try:
+                    news_articles = future.result()
+                except Exception as e:
+                    # A failed search counts as empty unless no keyword finds anything
+                    first_error = first_error or e
+                    continue
+
+                if news_articles:
+                    self.logger.info(
+                        "fallback_keyword_success",
+                        keyword=fallback_keyword,
+                        searches_cancelled=sum(f.cancel() for f in futures),
+                        duration_seconds=round(time.time() - started, 2)
+                    )
+                    return fallback_keyword, news_articles
+
+            if first_error is not None:
+                raise first_error
+            return None, []
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _process_single_article(self, article, article_index: int, run_state: RunState) -> VideoResult:
         """
         Process a single news article and generate a video for it.
 
+        Steps already recorded in the run state are skipped (see RunState).
+
         Args:
             article: News article to process
             article_index: Index of the article (for logging/naming)
+            run_state: State of the run (checkpoints every completed step)
 
         Returns:
             VideoResult with processing details
         """
-        steps_completed = []
+        prepared = self._prepare_article(article, article_index, run_state)
+        if isinstance(prepared, VideoResult):
+            return prepared
+        return self._render_article(prepared, run_state)
+
+    def _process_batch(self, articles: list, run_state: RunState) -> list:
+        """
+        Generate one video per article, overlapping content generation and rendering.
+
+        A producer thread generates the content of the articles in order
+        (script, segments, images, narration: API bound) and hands each one
+        over through a bounded queue, while this thread renders them in
+        order (CPU bound). So article N+1's content is generated while
+        article N renders. The queue bound (Config.batch_queue_size) caps how
+        many prepared workspaces wait for a render. Clients and caches are
+        those of the pipeline, shared by every article.
+
+        Args:
+            articles: News articles, in publishing order
+            run_state: State of the run
+
+        Returns:
+            List of VideoResult, one per article, in article order
+        """
+        prepared_queue = queue.Queue(maxsize=self.config.batch_queue_size)
+        stopped = threading.Event()
+
+        def hand_over(prepared) -> bool:
+            while not stopped.is_set():
+                try:
+                    prepared_queue.put(prepared, timeout=self.BATCH_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            self._discard_prepared(prepared)
+            return False
+
+        def produce():
+            article_index = 0
+            try:
+                for article_index, article in enumerate(articles, 1):
+                    if not hand_over(self._prepare_article(article, article_index, run_state)):
+                        return
+            except Exception as e:
+                # The renderer expects one item per article: fail the one that broke and the rest
+                log_error(self.logger, e, f"pipeline._process_batch (article {article_index})")
+                for failed_index, article in enumerate(articles[article_index - 1:], article_index):
+                    failed = VideoResult(
+                        success=False,
+                        article_index=failed_index,
+                        article_title=article.title,
+                        error=f"Batch content stage failed: {e}"
+                    )
+                    if not hand_over(failed):
+                        return
+
+        self.logger.info("batch_started", articles=len(articles), queue_size=self.config.batch_queue_size)
+        producer = threading.Thread(target=produce, name="batch-content", daemon=True)
+        producer.start()
 
+        video_results = []
         try:
-            # Step 2: Generate Korean narration script using Gemini with Google Search
-            # Gemini searches Korean sources and generates natural Korean script directly
-            self.logger.info("generating_korean_script_with_gemini", article_index=article_index)
-            target_video_duration = self.config.video_duration
-            korean_script = self.script_generator.generate_korean_script(
-                [article],
-                target_duration=target_video_duration
-            )
+            for article_index, article in enumerate(articles, 1):
+                prepared = None
+                while prepared is None:
+                    try:
+                        prepared = prepared_queue.get(timeout=self.BATCH_POLL_INTERVAL)
+                    except queue.Empty:
+                        # Never wait on a producer that is gone (it hands over an item per article)
+                        if not producer.is_alive() and prepared_queue.empty():
+                            prepared = VideoResult(
+                                success=False,
+                                article_index=article_index,
+                                article_title=article.title,
+                                error="Batch content stage stopped before this article"
+                            )
 
-            if not korean_script:
-                raise VideoGenerationError("Script generation failed")
+                if isinstance(prepared, PreparedArticle):
+                    video_result = self._render_article(prepared, run_state)
+                else:
+                    video_result = prepared
+                video_results.append(video_result)
 
-            steps_completed.append("generate_script")
+                self.logger.info(
+                    "batch_video_finished",
+                    article_index=video_result.article_index,
+                    success=video_result.success,
+                    finished=len(video_results),
+                    total=len(articles)
+                )
+        finally:
+            # Only reached early on interrupt: stop the producer and drop what it prepared
+            stopped.set()
+            while True:
+                try:
+                    self._discard_prepared(prepared_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+        producer.join(timeout=self.BATCH_POLL_INTERVAL)
+        return video_results
+
+    def _discard_prepared(self, prepared) -> None:
+        """Release the clip session and workspace of a prepared article that will not be rendered."""
+        if isinstance(prepared, PreparedArticle):
+            if prepared.clip_session is not None:
+                prepared.clip_session.close()
+            prepared.workspace.cleanup()
+
+    def _prepare_article(self, article, article_index: int, run_state: RunState):
+        """
+        Generate the content of an article's video: script, segments, media and narration.
 
-            # Step 3: Segment script into timed chunks
-            self.logger.info("segmenting_script", article_index=article_index)
-            script_segments = self.script_segmenter.segment_script(korean_script)
+        Steps already recorded in the run state are skipped (see RunState).
 
-            if not script_segments:
-                raise VideoGenerationError("Script segmentation failed")
+        Args:
+            article: News article to process
+            article_index: Index of the article (for logging/naming)
+            run_state: State of the run (checkpoints every completed step)
 
-            steps_completed.append("segment_script")
+        Returns:
+            PreparedArticle to render, or the VideoResult of an article that
+            needs no render (already completed by an earlier attempt, or failed)
+        """
+        steps_completed = run_state.get_steps_completed(article_index)
+        clip_session = None
 
-            # Step 4: Generate content for each segment (images and audio)
-            self.logger.info("generating_segment_content", article_index=article_index)
-            segments_data = []
+        if "save_metadata" in steps_completed:
+            self.logger.info("step_resumed", step="save_metadata", article_index=article_index)
+            return VideoResult(
+                success=True,
+                article_index=article_index,
+                article_title=article.title,
+                final_video_path=run_state.get("final_video_path", article_index),
+                metadata_path=run_state.get("metadata_path", article_index),
+                steps_completed=steps_completed
+            )
 
-            # Create context summary for better image generation
-            context_summary = f"Business news about: {article.title}"
+        # Intermediate files (images, narration, clips, BGM) live in a per-job scratch
+        # workspace; only the final video and metadata are promoted to output_dir
+        workspace = JobWorkspace(
+            output_dir=self.config.output_dir,
+            scratch_dir=self.config.scratch_dir or None,
+            use_tmpfs=self.config.use_tmpfs_scratch,
+            logger=self.logger
+        )
 
-            # Track used media files (videos) to prevent duplicates in the same video
-            used_media_paths = set()
+        try:
+            workspace.create()
 
-            for segment in script_segments:
-                # Generate catchy title for this segment
-                segment_title = self.title_generator.generate_title(
-                    segment,
-                    context=context_summary
+            # Step 2: Generate Korean narration script using Gemini with Google Search
+            # Gemini searches Korean sources and generates natural Korean script directly
+            if "generate_script" in steps_completed:
+                self.logger.info("step_resumed", step="generate_script", article_index=article_index)
+                korean_script = run_state.get("korean_script", article_index)
+            else:
+                self.logger.info("generating_korean_script_with_gemini", article_index=article_index)
+                target_video_duration = self.config.video_duration
+                korean_script = self.script_generator.generate_korean_script(
+                    [article],
+                    target_duration=target_video_duration
                 )
 
-                if not segment_title:
-                    raise VideoGenerationError(f"Title generation failed for segment {segment.segment_number}")
+                if not korean_script:
+                    raise VideoGenerationError("Script generation failed")
 
-                # Generate image prompt for this segment
-                image_prompt = self.image_prompt_generator.generate_image_prompt(
-                    segment,
-                    context=context_summary
-                )
+                run_state.complete_step("generate_script", article_index, korean_script=korean_script)
+                steps_completed.append("generate_script")
 
-                if not image_prompt:
-                    raise VideoGenerationError(f"Image prompt generation failed for segment {segment.segment_number}")
+            # Step 3: Segment script into timed chunks
+            if "segment_script" in steps_completed:
+                self.logger.info("step_resumed", step="segment_script", article_index=article_index)
+                script_segments = [ScriptSegment(**data) for data in run_state.get("script_segments", article_index)]
+            else:
+                self.logger.info("segmenting_script", article_index=article_index)
+                script_segments = self.script_segmenter.segment_script(korean_script)
 
-                # Try to find pre-defined media first (excluding already-used videos)
-                image_path = self.media_matcher.find_matching_media(
-                    text=segment.text,
-                    title=segment_title,
-                    used_media=used_media_paths
-                )
+                if not script_segments:
+                    raise VideoGenerationError("Script segmentation failed")
 
-                # If no pre-defined media found, generate new image
-                if not image_path:
-                    self.logger.info(
-                        "generating_new_image",
-                        segment_number=segment.segment_number,
-                        reason="no_predefined_media_match"
-                    )
-                    try:
-                        image_path = self.image_generator.generate_image(
-                            prompt=image_prompt,
-                            output_dir=self.config.output_dir,
-                            aspect_ratio=self.config.video_aspect_ratio
-                        )
-                    except VideoGenerationError as e:
-                        # If image generation fails with NO_IMAGE, try to use a generic fallback image
-                        if "NO_IMAGE" in str(e):
-                            self.logger.warning(
-                                "image_generation_failed_no_image",
-                                segment_number=segment.segment_number,
-                                error=str(e),
-                                action="retrying_with_simplified_prompt"
-                            )
-                            # Try once more with a simplified prompt
-                            simplified_prompt = f"A professional business-related image representing: {segment_title}"
-                            try:
-                                image_path = self.image_generator.generate_image(
-                                    prompt=simplified_prompt,
-                                    output_dir=self.config.output_dir,
-                                    aspect_ratio=self.config.video_aspect_ratio
-                                )
-                                self.logger.info(
-                                    "image_generation_retry_success",
-                                    segment_number=segment.segment_number
-                                )
-                            except VideoGenerationError:
-                                # If retry also fails, re-raise the original error
-                                self.logger.error(
-                                    "image_generation_retry_failed",
-                                    segment_number=segment.segment_number,
-                                    original_error=str(e)
-                                )
-                                raise VideoGenerationError(
-                                    f"Image generation failed after retry with simplified prompt for segment {segment.segment_number}. "
-                                    f"Original error: {str(e)}. "
-                                    f"Consider adding predefined media for this topic."
-                                )
-                        else:
-                            # For other errors, just re-raise
-                            raise
-                else:
-                    self.logger.info(
-                        "using_predefined_media",
-                        segment_number=segment.segment_number,
-                        media_path=image_path
+                run_state.complete_step(
+                    "segment_script",
+                    article_index,
+                    script_segments=[asdict(segment) for segment in script_segments]
+                )
+                steps_completed.append("segment_script")
+
+            # A finished slideshow is only reused while its files still exist
+            variants = None
+            if "create_slideshow" in steps_completed:
+                saved_variants = run_state.get("variants", article_index)
+                if all(Path(variant["path"]).exists() for variant in saved_variants):
+                    variants = saved_variants
+
+            if variants is not None:
+                self.logger.info("step_resumed", step="create_slideshow", article_index=article_index)
+                segments_data = run_state.get("segments_data", article_index)
+            else:
+                # Step 4: Generate content for each segment (images and audio)
+                self.logger.info("generating_segment_content", article_index=article_index)
+
+                # Create context summary for better image generation
+                context_summary = f"Business news about: {article.title}"
+
+                # multi_pass clips can be rendered while the remaining segments are generated
+                if (self.config.enable_streaming_render
+                        and self.config.render_mode == "multi_pass"
+                        and len(self.config.get_output_aspect_ratios()) == 1):
+                    clip_session = self.video_composer.start_clip_session(
+                        num_segments=len(script_segments),
+                        output_dir=str(workspace.path)
                     )
-                    # Track used video files (not images, as images can be reused)
-                    media_path_obj = Path(image_path).resolve()
-                    if media_path_obj.suffix.lower() in ['.mp4', '.mov', '.avi']:
-                        used_media_paths.add(str(media_path_obj))
-                        self.logger.debug(
-                            "tracking_used_video",
-                            video_path=str(media_path_obj),
-                            total_used=len(used_media_paths)
-                        )
 
-                if not image_path or not Path(image_path).exists():
-                    raise VideoGenerationError(f"Image/media acquisition failed for segment {segment.segment_number}")
+                segments_data = self._generate_segment_content(
+                    script_segments, context_summary, workspace, run_state, article_index, clip_session
+                )
 
-                # Generate audio for this segment
-                audio_path, audio_duration = self.audio_generator.generate_segment_audio(
-                    script_text=segment.text,
-                    segment_number=segment.segment_number,
-                    output_dir=self.config.output_dir
+                # Media and narration paths are per segment in the run state; metadata needs the rest
+                run_state.complete_step(
+                    "generate_segment_content",
+                    article_index,
+                    segments_data=[
+                        {key: segment[key] for key in ('segment_number', 'text', 'title', 'audio_duration', 'image_prompt')}
+                        for segment in segments_data
+                    ]
                 )
+                if "generate_segment_content" not in steps_completed:
+                    steps_completed.append("generate_segment_content")
 
-                if not audio_path or not Path(audio_path).exists():
-                    raise VideoGenerationError(f"Audio generation failed for segment {segment.segment_number}")
+            return PreparedArticle(
+                article=article,
+                article_index=article_index,
+                workspace=workspace,
+                korean_script=korean_script,
+                script_segments=script_segments,
+                segments_data=segments_data,
+                steps_completed=steps_completed,
+                variants=variants,
+                clip_session=clip_session
+            )
 
-                # Store segment data
-                segments_data.append({
-                    'segment_number': segment.segment_number,
-                    'text': segment.text,
-                    'title': segment_title,
-                    'image_path': image_path,
-                    'audio_path': audio_path,
-                    'audio_duration': audio_duration,
-                    'image_prompt': image_prompt
-                })
+        except Exception as e:
+            log_error(self.logger, e, f"pipeline._prepare_article (article {article_index})")
 
-            steps_completed.append("generate_segment_content")
+            if clip_session is not None:
+                clip_session.close()
+            # Scratch files never outlive the job, whether it succeeded or failed
+            workspace.cleanup()
 
-            # Step 5: Create slideshow video with subtitles
-            self.logger.info("creating_slideshow", article_index=article_index)
-            final_video_path = self.video_composer.create_slideshow_with_subtitles(
-                segments_data=segments_data,
-                output_dir=self.config.output_dir
+            return VideoResult(
+                success=False,
+                article_index=article_index,
+                article_title=article.title,
+                error=str(e),
+                steps_completed=steps_completed
             )
 
-            if not final_video_path or not Path(final_video_path).exists():
-                raise VideoGenerationError("Slideshow creation failed")
+    def _render_article(self, prepared: PreparedArticle, run_state: RunState) -> VideoResult:
+        """
+        Render a prepared article's video and save its metadata.
 
-            steps_completed.append("create_slideshow")
+        Args:
+            prepared: Article with generated content (see _prepare_article)
+            run_state: State of the run (checkpoints every completed step)
+
+        Returns:
+            VideoResult with processing details
+        """
+        article = prepared.article
+        article_index = prepared.article_index
+        workspace = prepared.workspace
+        segments_data = prepared.segments_data
+        steps_completed = prepared.steps_completed
+        variants = prepared.variants
+
+        try:
+            if variants is None:
+                # Step 5: Create slideshow video with subtitles
+                # (extra aspect ratio variants are rendered by the same ffmpeg process)
+                self.logger.info("creating_slideshow", article_index=article_index)
+                aspect_ratios = self.config.get_output_aspect_ratios()
+                if prepared.clip_session is not None:
+                    variant_paths = {aspect_ratios[0]: prepared.clip_session.finish(segments_data)}
+                elif len(aspect_ratios) > 1:
+                    variant_paths = self.video_composer.create_slideshow_variants(
+                        segments_data=segments_data,
+                        aspect_ratios=aspect_ratios,
+                        output_dir=str(workspace.path)
+                    )
+                else:
+                    variant_paths = {
+                        aspect_ratios[0]: self.video_composer.create_slideshow_with_subtitles(
+                            segments_data=segments_data,
+                            output_dir=str(workspace.path)
+                        )
+                    }
+
+                variants = []
+                for aspect_ratio in aspect_ratios:
+                    variant_path = variant_paths.get(aspect_ratio)
+                    if not variant_path or not Path(variant_path).exists():
+                        raise VideoGenerationError(f"Slideshow creation failed ({aspect_ratio})")
+
+                    # The primary aspect ratio keeps the plain file name
+                    suffix = "" if aspect_ratio == aspect_ratios[0] else f"_{aspect_ratio.replace(':', 'x')}"
+                    variant = {
+                        "aspect_ratio": aspect_ratio,
+                        "path": workspace.promote(variant_path, f"final_shorts_{workspace.job_id}{suffix}.mp4")
+                    }
+
+                    # Keep the render manifest so single segments can be re-rendered later
+                    manifest_path = self.video_composer.get_manifest_path(variant_path)
+                    if manifest_path.exists():
+                        variant["manifest_path"] = workspace.promote(
+                            str(manifest_path), f"final_shorts_{workspace.job_id}{suffix}.manifest.json"
+                        )
+
+                    variants.append(variant)
+
+                run_state.complete_step(
+                    "create_slideshow", article_index, variants=variants, final_video_path=variants[0]["path"]
+                )
+                if "create_slideshow" not in steps_completed:
+                    steps_completed.append("create_slideshow")
+
+            final_video_path = variants[0]["path"]
 
             # Step 6: Generate Korean title for YouTube
-            self.logger.info("generating_korean_title", article_index=article_index)
-            korean_title = self._generate_korean_title(korean_script, article)
+            korean_title = run_state.get("korean_title", article_index)
             if not korean_title:
-                # Fallback: extract from script
-                korean_title = self._extract_title_from_script(korean_script)
+                self.logger.info("generating_korean_title", article_index=article_index)
+                korean_title = self._generate_korean_title(prepared.korean_script, article)
+                if not korean_title:
+                    # Fallback: extract from script
+                    korean_title = self._extract_title_from_script(prepared.korean_script)
+                run_state.set_result("korean_title", korean_title, article_index)
 
             # Step 7: Save metadata
             self.logger.info("saving_metadata", article_index=article_index)
             metadata = self._create_metadata_single_article(
                 article=article,
-                korean_script=korean_script,
-                script_segments=script_segments,
+                korean_script=prepared.korean_script,
+                script_segments=prepared.script_segments,
                 segments_data=segments_data,
                 final_video_path=final_video_path,
-                korean_title=korean_title
+                korean_title=korean_title,
+                variants=variants
             )
 
-            metadata_path = self._save_metadata(metadata)
+            metadata_path = self._save_metadata(metadata, workspace)
+            run_state.complete_step("save_metadata", article_index, metadata_path=metadata_path)
             steps_completed.append("save_metadata")
 
             return VideoResult(
@@ -426,7 +755,7 @@ class VideoPipeline:
             )
 
         except Exception as e:
-            log_error(self.logger, e, f"pipeline._process_single_article (article {article_index})")
+            log_error(self.logger, e, f"pipeline._render_article (article {article_index})")
 
             return VideoResult(
                 success=False,
@@ -436,6 +765,339 @@ class VideoPipeline:
                 steps_completed=steps_completed
             )
 
+        finally:
+            # Scratch files never outlive the job, whether it succeeded or failed
+            self._discard_prepared(prepared)
+
+    def _generate_segment_text(
+        self,
+        segment,
+        context_summary: str,
+        run_state: RunState,
+        article_index: int
+    ) -> tuple:
+        """
+        Generate the title and image prompt of a segment (or reuse the checkpointed ones).
+
+        Args:
+            segment: ScriptSegment
+            context_summary: Topic context shared by all segments
+            run_state: State of the run
+            article_index: Article of the video
+
+        Returns:
+            Tuple of (segment title, image prompt)
+
+        Raises:
+            VideoGenerationError: If title or image prompt generation fails
+        """
+        record = run_state.get_segment(article_index, segment.segment_number)
+        if record.get('title') and record.get('image_prompt'):
+            return record['title'], record['image_prompt']
+
+        # Generate catchy title for this segment
+        segment_title = self.title_generator.generate_title(segment, context=context_summary)
+
+        if not segment_title:
+            raise VideoGenerationError(f"Title generation failed for segment {segment.segment_number}")
+
+        # Generate image prompt for this segment
+        image_prompt = self.image_prompt_generator.generate_image_prompt(segment, context=context_summary)
+
+        if not image_prompt:
+            raise VideoGenerationError(f"Image prompt generation failed for segment {segment.segment_number}")
+
+        run_state.update_segment(
+            article_index, segment.segment_number, title=segment_title, image_prompt=image_prompt
+        )
+        return segment_title, image_prompt
+
+    def _generate_segment_image(self, segment, segment_title: str, image_prompt: str, output_dir: str) -> str:
+        """
+        Generate the image of a segment without matching pre-defined media.
+
+        Args:
+            segment: ScriptSegment
+            segment_title: Title of the segment
+            image_prompt: Image generation prompt
+            output_dir: Directory to save the image
+
+        Returns:
+            Path to the generated image
+
+        Raises:
+            VideoGenerationError: If image generation fails, also with a simplified prompt
+        """
+        self.logger.info(
+            "generating_new_image",
+            segment_number=segment.segment_number,
+            reason="no_predefined_media_match"
+        )
+        try:
+            return self.image_generator.generate_image(
+                prompt=image_prompt,
+                output_dir=output_dir,
+                aspect_ratio=self.config.video_aspect_ratio
+            )
+        except VideoGenerationError as e:
+            # For other errors, just re-raise
+            if "NO_IMAGE" not in str(e):
+                raise
+
+            # If image generation fails with NO_IMAGE, try once more with a simplified prompt
+            self.logger.warning(
+                "image_generation_failed_no_image",
+                segment_number=segment.segment_number,
+                error=str(e),
+                action="retrying_with_simplified_prompt"
+            )
+            simplified_prompt = f"A professional business-related image representing: {segment_title}"
+            try:
+                image_path = self.image_generator.generate_image(
+                    prompt=simplified_prompt,
+                    output_dir=output_dir,
+                    aspect_ratio=self.config.video_aspect_ratio
+                )
+                self.logger.info(
+                    "image_generation_retry_success",
+                    segment_number=segment.segment_number
+                )
+                return image_path
+            except VideoGenerationError:
+                # If retry also fails, re-raise the original error
+                self.logger.error(
+                    "image_generation_retry_failed",
+                    segment_number=segment.segment_number,
+                    original_error=str(e)
+                )
+                raise VideoGenerationError(
+                    f"Image generation failed after retry with simplified prompt for segment {segment.segment_number}. "
+                    f"Original error: {str(e)}. "
+                    f"Consider adding predefined media for this topic."
+                )
+
+    def _generate_segment_audio(
+        self,
+        position: int,
+        segment,
+        output_dir: str,
+        run_state: RunState,
+        article_index: int,
+        clip_session=None
+    ) -> tuple:
+        """
+        Generate the narration of a segment (or reuse the checkpointed one) and hand it to the clip session.
+
+        Args:
+            position: Position of the segment on the timeline
+            segment: ScriptSegment
+            output_dir: Directory to save the narration
+            run_state: State of the run (generated narration is kept in its assets)
+            article_index: Article of the video
+            clip_session: ClipRenderSession rendering clips as segments complete (optional)
+
+        Returns:
+            Tuple of (audio file path, duration in seconds)
+
+        Raises:
+            VideoGenerationError: If audio generation fails
+        """
+        record = run_state.get_segment(article_index, segment.segment_number)
+        audio_path = run_state.restore_asset(record.get('audio_path'), Path(output_dir))
+        if audio_path:
+            audio_duration = record['audio_duration']
+        else:
+            audio_path, audio_duration = self.audio_generator.generate_segment_audio(
+                script_text=segment.text,
+                segment_number=segment.segment_number,
+                output_dir=output_dir
+            )
+
+            if not audio_path or not Path(audio_path).exists():
+                raise VideoGenerationError(f"Audio generation failed for segment {segment.segment_number}")
+
+            run_state.update_segment(
+                article_index,
+                segment.segment_number,
+                audio_path=run_state.keep_asset(audio_path),
+                audio_duration=audio_duration
+            )
+
+        if clip_session is not None:
+            clip_session.add_audio(position, audio_path, audio_duration)
+
+        return audio_path, audio_duration
+
+    def _media_ready(self, position: int, segment, image_path: str, segment_title: str, clip_session=None) -> str:
+        """
+        Check a segment's image or video and hand it to the clip session.
+
+        Args:
+            position: Position of the segment on the timeline
+            segment: ScriptSegment
+            image_path: Generated image or matched pre-defined media
+            segment_title: Title of the segment
+            clip_session: ClipRenderSession rendering clips as segments complete (optional)
+
+        Returns:
+            The media path
+
+        Raises:
+            VideoGenerationError: If the media does not exist
+        """
+        if not image_path or not Path(image_path).exists():
+            raise VideoGenerationError(f"Image/media acquisition failed for segment {segment.segment_number}")
+
+        if clip_session is not None:
+            clip_session.add_media(position, image_path, segment_title)
+
+        return image_path
+
+    def _generate_segment_content(
+        self,
+        script_segments: list,
+        context_summary: str,
+        workspace: JobWorkspace,
+        run_state: RunState,
+        article_index: int,
+        clip_session=None
+    ) -> list:
+        """
+        Generate titles, image prompts, media and narration of all segments.
+
+        API calls run concurrently, each provider bounded by its own limit
+        (Gemini text, Gemini image, ElevenLabs). Narration starts right away,
+        since it only needs the segment text. Pre-defined media is matched
+        sequentially in segment order, as soon as each title is ready, so
+        used_media_paths sees the same sequence as a sequential run. Segments
+        without a match get a generated image. With a clip session, every
+        narration and image is handed over as soon as it exists, so clips
+        render while the other segments are still being generated.
+
+        Content checkpointed by an earlier attempt of the run is reused, so a
+        resumed run only calls the APIs for what is still missing.
+
+        Args:
+            script_segments: ScriptSegments in order
+            context_summary: Topic context shared by all segments
+            workspace: Job workspace (generated images and narration are saved there)
+            run_state: State of the run
+            article_index: Article of the video
+            clip_session: ClipRenderSession of a streaming multi_pass render (optional)
+
+        Returns:
+            List of segment data dicts, in segment order
+
+        Raises:
+            VideoGenerationError: If any segment's content cannot be generated
+        """
+        output_dir = str(workspace.path)
+        started = time.time()
+
+        # Track used media files (videos) to prevent duplicates in the same video
+        used_media_paths = set()
+
+        # One pool per provider, sized to its limit: calls queued for a busy provider
+        # never hold the threads another provider's calls would run on
+        executors = {
+            "gemini_text": ThreadPoolExecutor(max_workers=self.config.gemini_text_concurrency),
+            "gemini_image": ThreadPoolExecutor(max_workers=self.config.gemini_image_concurrency),
+            "elevenlabs": ThreadPoolExecutor(max_workers=self.config.elevenlabs_concurrency),
+        }
+        try:
+            audio_futures = [
+                executors["elevenlabs"].submit(
+                    self._generate_segment_audio,
+                    position, segment, output_dir, run_state, article_index, clip_session
+                )
+                for position, segment in enumerate(script_segments)
+            ]
+            text_futures = [
+                executors["gemini_text"].submit(
+                    self._generate_segment_text, segment, context_summary, run_state, article_index
+                )
+                for segment in script_segments
+            ]
+
+            # Match pre-defined media in segment order; generate images for the rest
+            def generate_image(position, segment, segment_title, image_prompt):
+                image_path = self._generate_segment_image(segment, segment_title, image_prompt, output_dir)
+                if image_path and Path(image_path).exists():
+                    run_state.update_segment(
+                        article_index, segment.segment_number, image_path=run_state.keep_asset(image_path)
+                    )
+                return self._media_ready(position, segment, image_path, segment_title, clip_session)
+
+            media = []
+            for position, (segment, text_future) in enumerate(zip(script_segments, text_futures)):
+                segment_title, image_prompt = text_future.result()
+
+                # Media checkpointed by an earlier attempt keeps its place in the sequence
+                record = run_state.get_segment(article_index, segment.segment_number)
+                image_path = run_state.restore_asset(record.get('image_path'), workspace.path)
+
+                if not image_path:
+                    # Try to find pre-defined media first (excluding already-used videos)
+                    image_path = self.media_matcher.find_matching_media(
+                        text=segment.text,
+                        title=segment_title,
+                        used_media=used_media_paths
+                    )
+
+                    if not image_path:
+                        media.append(executors["gemini_image"].submit(
+                            generate_image, position, segment, segment_title, image_prompt
+                        ))
+                        continue
+
+                    self.logger.info(
+                        "using_predefined_media",
+                        segment_number=segment.segment_number,
+                        media_path=image_path
+                    )
+                    run_state.update_segment(article_index, segment.segment_number, image_path=image_path)
+                # Track used video files (not images, as images can be reused)
+                media_path_obj = Path(image_path).resolve()
+                if media_path_obj.suffix.lower() in ['.mp4', '.mov', '.avi']:
+                    used_media_paths.add(str(media_path_obj))
+                    self.logger.debug(
+                        "tracking_used_video",
+                        video_path=str(media_path_obj),
+                        total_used=len(used_media_paths)
+                    )
+                media.append(self._media_ready(position, segment, image_path, segment_title, clip_session))
+
+            segments_data = []
+            for segment, text_future, image_path, audio_future in zip(
+                script_segments, text_futures, media, audio_futures
+            ):
+                segment_title, image_prompt = text_future.result()
+                if isinstance(image_path, Future):
+                    image_path = image_path.result()
+                audio_path, audio_duration = audio_future.result()
+
+                # Store segment data
+                segments_data.append({
+                    'segment_number': segment.segment_number,
+                    'text': segment.text,
+                    'title': segment_title,
+                    'image_path': image_path,
+                    'audio_path': audio_path,
+                    'audio_duration': audio_duration,
+                    'image_prompt': image_prompt
+                })
+        finally:
+            # On failure, queued calls are dropped; calls already in flight finish
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        self.logger.info(
+            "segment_content_generated",
+            segments=len(segments_data),
+            duration_seconds=round(time.time() - started, 2)
+        )
+        return segments_data
+
     def _generate_korean_title(self, korean_script: str, article) -> str:
         """
         Generate a Korean title for YouTube from the Korean script using Gemini API.
@@ -570,7 +1232,8 @@ Output ONLY the description with hashtags, nothing else."""
         script_segments: list,
         segments_data: list,
         final_video_path: str,
-        korean_title: str = None
+        korean_title: str = None,
+        variants: Optional[list] = None
     ) -> dict:
         """
         Create metadata for a single article video.
@@ -589,10 +1252,15 @@ Output ONLY the description with hashtags, nothing else."""
                 "video_duration": self.config.video_duration,
                 "segment_duration": self.config.segment_duration,
                 "video_aspect_ratio": self.config.video_aspect_ratio,
+                "output_aspect_ratios": self.config.get_output_aspect_ratios(),
                 "video_resolution": self.config.video_resolution,
                 "enable_subtitles": self.config.enable_subtitles,
                 "subtitle_font_size": self.config.subtitle_font_size,
                 "background_music_volume": self.config.background_music_volume,
+                "loudness_targets": {
+                    "voice_lufs": self.config.voice_loudness_target,
+                    "music_lufs": self.config.music_loudness_target,
+                } if self.config.enable_loudness_normalization else None,
                 "claude_model": self.config.claude_model,
                 "video_generator": "Image Slideshow with Gemini 2.5 Flash Image",
                 "audio_generator": "ElevenLabs"
@@ -614,27 +1282,27 @@ Output ONLY the description with hashtags, nothing else."""
                 for seg in segments_data
             ],
             "final_video_path": final_video_path,
+            # Every rendered aspect ratio: [{"aspect_ratio": "9:16", "path": ...}, ...]
+            "variants": variants or [{"aspect_ratio": self.config.video_aspect_ratio, "path": final_video_path}],
             "title": korean_title or "오늘의 뉴스",  # Korean title for YouTube
             "description": youtube_description,  # Engaging description with relevant hashtags
             "generation_method": "Gemini native Korean script generation with Google Search + Imagen + ElevenLabs audio + subtitles + background music"
         }
 
-    def _save_metadata(self, metadata: dict) -> str:
+    def _save_metadata(self, metadata: dict, workspace: JobWorkspace) -> str:
         """
-        Save metadata to a JSON file.
+        Save metadata to a JSON file in the output directory.
 
         Args:
             metadata: Metadata dictionary
+            workspace: Job workspace (the file is written there, then promoted)
 
         Returns:
             Path to the metadata file
         """
-        output_path = Path(self.config.output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        metadata_file = output_path / f"metadata_{int(time.time())}.json"
+        metadata_file = workspace.path / f"metadata_{workspace.job_id}.json"
 
         with open(metadata_file, "w", encoding="utf-8") as f:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
 
-        return str(metadata_file)
+        return workspace.promote(str(metadata_file))
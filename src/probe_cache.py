@@ -0,0 +1,161 @@
+"""
+Persistent ffprobe metadata cache.
+
+Probe results (format and stream layout: duration, resolution, fps, codecs)
+are stored in a small SQLite database keyed by (realpath, size, mtime_ns), so
+library videos and background music tracks are probed once instead of once
+per lookup. Changed files get a new key and are probed again.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import ffmpeg
+import structlog
+
+
+class ProbeCache:
+    """SQLite-backed cache of ffmpeg.probe results."""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = 5000,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Probe Cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_entries: Maximum number of cached probes (least recently used are pruned)
+            logger: Logger instance
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (shared by threads, guarded by the lock)."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")  # Concurrent runs can read while one writes
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                " path TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " data TEXT NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " PRIMARY KEY (path, size, mtime_ns))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _file_key(self, file_path: str) -> tuple:
+        """Build the (realpath, size, mtime_ns) cache key of a file."""
+        stat = os.stat(file_path)
+        return os.path.realpath(file_path), stat.st_size, stat.st_mtime_ns
+
+    def _lookup(self, key: tuple) -> Optional[dict]:
+        """Get a cached probe and mark it as recently used."""
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT data FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE probes SET last_used = ? WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (time.time(),) + key
+            )
+            connection.commit()
+        return json.loads(row[0])
+
+    def _store(self, key: tuple, probe: dict) -> None:
+        """Store a probe result and prune the least recently used entries."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO probes (path, size, mtime_ns, data, last_used) VALUES (?, ?, ?, ?, ?)",
+                key + (json.dumps(probe), time.time())
+            )
+            connection.execute(
+                "DELETE FROM probes WHERE rowid IN ("
+                " SELECT rowid FROM probes ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            connection.commit()
+
+    def probe(self, file_path: str) -> dict:
+        """
+        Probe a media file, using the cached result when the file is unchanged.
+
+        Args:
+            file_path: Path to the media file
+
+        Returns:
+            ffprobe result with 'format' and 'streams' (same shape as ffmpeg.probe)
+
+        Raises:
+            ffmpeg.Error: If ffprobe fails
+            OSError: If the file does not exist
+        """
+        key = self._file_key(file_path)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        result = ffmpeg.probe(file_path)
+        probe = {"format": result.get("format", {}), "streams": result.get("streams", [])}
+        self._store(key, probe)
+
+        self.logger.debug("probe_cached", file_path=file_path)
+        return probe
+
+    def probe_many(self, file_paths: list, max_workers: int = 8) -> dict:
+        """
+        Probe several media files, running ffprobe for cache misses in a thread pool.
+
+        Args:
+            file_paths: Paths to media files
+            max_workers: Maximum concurrent ffprobe processes
+
+        Returns:
+            Dict mapping each successfully probed path to its probe result
+        """
+        results = {}
+        misses = []
+
+        for file_path in dict.fromkeys(str(path) for path in file_paths):
+            try:
+                cached = self._lookup(self._file_key(file_path))
+            except OSError as e:
+                self.logger.warning("probe_failed", file_path=file_path, error=str(e))
+                continue
+            if cached is not None:
+                results[file_path] = cached
+            else:
+                misses.append(file_path)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(misses)))) as executor:
+                futures = {executor.submit(self.probe, file_path): file_path for file_path in misses}
+                for future, file_path in futures.items():
+                    try:
+                        results[file_path] = future.result()
+                    except (ffmpeg.Error, OSError) as e:
+                        self.logger.warning("probe_failed", file_path=file_path, error=str(e))
+
+        self.logger.debug("probe_batch_completed", files=len(results), probed=len(misses))
+        return results
@@ -0,0 +1,237 @@
+"""
+Render manifest and segment clip cache for incremental re-renders.
+
+Every multi-pass render hashes each segment's inputs (media and narration
+content, title, clip duration, Ken Burns pattern and the clip encode
+settings) and stores the encoded clip under that hash. The manifest saved
+next to the final video records the segments and their hashes, so an edit
+(a typo in one title, a swapped image) re-encodes only the clips whose hash
+changed and reuses the cached clips for the rest.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+
+# Bump when the manifest layout or the clip hash inputs change
+MANIFEST_VERSION = 1
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Hash a file's content.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def segment_hash(segment_inputs: dict) -> str:
+    """
+    Hash everything that affects the pixels of one segment clip.
+
+    Args:
+        segment_inputs: JSON-serializable clip inputs (digests, title, duration, pattern, settings)
+
+    Returns:
+        SHA-256 hex digest used as the clip cache key
+    """
+    key_data = dict(segment_inputs, version=MANIFEST_VERSION)
+    encoded = json.dumps(key_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class RenderManifest:
+    """Segments of one render and the clip hash of each."""
+    segments: list  # Segment dicts: segment_data fields plus media/audio digests and clip_hash
+    settings: dict = field(default_factory=dict)  # Render settings the clip hashes were computed with
+    version: int = MANIFEST_VERSION
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def save(self, manifest_path: str) -> None:
+        """
+        Write the manifest as JSON (atomically).
+
+        Args:
+            manifest_path: Path of the manifest file
+        """
+        path = Path(manifest_path)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.__dict__, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, manifest_path: str) -> "RenderManifest":
+        """
+        Read a manifest written by save().
+
+        Args:
+            manifest_path: Path of the manifest file
+
+        Returns:
+            RenderManifest instance
+
+        Raises:
+            ValueError: If the manifest was written by an incompatible version
+        """
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported render manifest version: {data.get('version')}")
+
+        return cls(**data)
+
+    def get_segments_data(self) -> list:
+        """
+        Get the segments in the segments_data format of VideoComposer.
+
+        Returns:
+            List of segment data dictionaries (copies, safe to edit)
+        """
+        return [
+            {
+                "segment_number": segment["segment_number"],
+                "text": segment["text"],
+                "title": segment["title"],
+                "image_path": segment["image_path"],
+                "audio_path": segment["audio_path"],
+                "audio_duration": segment["audio_duration"],
+            }
+            for segment in self.segments
+        ]
+
+
+class ClipCache:
+    """Content-keyed on-disk cache of encoded segment clips and render inputs."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: int = 200,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Clip Cache.
+
+        Args:
+            cache_dir: Directory holding cached clips (and render inputs under assets/)
+            max_entries: Maximum number of clips kept (least recently used are evicted)
+            logger: Logger instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.assets_dir = self.cache_dir / "assets"
+        self.max_entries = max_entries
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.Lock()
+
+    def get(self, clip_hash: str) -> Optional[Path]:
+        """
+        Get a cached clip.
+
+        Args:
+            clip_hash: Segment hash (see segment_hash)
+
+        Returns:
+            Path to the cached clip, or None on a miss
+        """
+        clip_path = self.cache_dir / f"{clip_hash}.mp4"
+        try:
+            # Refresh mtime so eviction treats this entry as recently used
+            os.utime(clip_path)
+        except FileNotFoundError:
+            return None
+        return clip_path
+
+    def put(self, clip_hash: str, clip_path: str) -> Path:
+        """
+        Store a rendered clip (the source file is left in place).
+
+        Args:
+            clip_hash: Segment hash (see segment_hash)
+            clip_path: Path to the rendered clip
+
+        Returns:
+            Path to the cached copy
+        """
+        cached_path = self.cache_dir / f"{clip_hash}.mp4"
+        self._copy_atomic(Path(clip_path), cached_path)
+        self.logger.debug("clip_cached", clip_hash=clip_hash, clip_path=str(cached_path))
+        self._evict(self.cache_dir, "*.mp4", self.max_entries)
+        return cached_path
+
+    def store_asset(self, file_path: str, digest: str) -> Path:
+        """
+        Keep a copy of a render input that lives in a temporary job directory.
+
+        Assets are stored by content digest, so a later re-render can rebuild
+        any segment after the job's scratch files are gone.
+
+        Args:
+            file_path: Path to the input file
+            digest: Content digest of the file (see file_digest)
+
+        Returns:
+            Path to the stored copy
+        """
+        asset_path = self.assets_dir / f"{digest}{Path(file_path).suffix.lower()}"
+        try:
+            os.utime(asset_path)
+            return asset_path
+        except FileNotFoundError:
+            pass
+
+        self._copy_atomic(Path(file_path), asset_path)
+        # Each segment keeps two inputs (media and narration) per cached clip
+        self._evict(self.assets_dir, "*", self.max_entries * 2)
+        return asset_path
+
+    def _copy_atomic(self, source: Path, destination: Path) -> None:
+        """Copy a file so readers never see a partially written destination."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_name(f".{destination.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            shutil.copyfile(source, temp_path)
+            os.replace(temp_path, destination)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _evict(self, directory: Path, pattern: str, max_entries: int) -> None:
+        """Remove the least recently used files of a directory beyond max_entries."""
+        with self._lock:
+            entries = []
+            for path in directory.glob(pattern):
+                if not path.is_file() or path.name.startswith("."):
+                    continue
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+
+            excess = len(entries) - max_entries
+            if excess <= 0:
+                return
+
+            entries.sort()
+            for _, path in entries[:excess]:
+                path.unlink(missing_ok=True)
+
+            self.logger.debug("clip_cache_evicted", directory=str(directory), evicted=excess)
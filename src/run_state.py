@@ -0,0 +1,317 @@
+"""
+Checkpoints of pipeline runs, for resuming a failed run.
+
+Every completed pipeline step is recorded in runs/<run_id>/state.json:
+fetched articles, and per article the Korean script, script segments,
+segment titles and image prompts, media and narration (with durations),
+final video and metadata. Generated images and narration are copied into
+the run's assets/ directory, because the job workspace holding them is
+removed when the job ends. `main.py --resume <run_id>` skips every recorded
+step, so a failure in the final render does not pay for news search,
+script, images and TTS again.
+"""
+import json
+import os
+import shutil
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from .news_fetcher import NewsArticle
+from .render_manifest import file_digest
+from .utils.workspace import new_job_id
+
+
+# Bump when the state layout changes
+RUN_STATE_VERSION = 1
+
+
+def article_to_dict(article: NewsArticle) -> dict:
+    """
+    Convert a news article to JSON-serializable data.
+
+    Args:
+        article: NewsArticle instance
+
+    Returns:
+        Article fields (published_at as ISO 8601)
+    """
+    data = asdict(article)
+    data["published_at"] = article.published_at.isoformat()
+    return data
+
+
+def article_from_dict(data: dict) -> NewsArticle:
+    """
+    Rebuild a news article saved by article_to_dict.
+
+    Args:
+        data: Article fields
+
+    Returns:
+        NewsArticle instance
+    """
+    return NewsArticle(**dict(data, published_at=datetime.fromisoformat(data["published_at"])))
+
+
+class RunState:
+    """Persistent record of one pipeline run's completed steps and their results."""
+
+    def __init__(
+        self,
+        runs_dir: str,
+        run_id: Optional[str] = None,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Run State.
+
+        Args:
+            runs_dir: Directory holding one subdirectory per run
+            run_id: Run ID (a new unique ID when None)
+            logger: Logger instance
+        """
+        self.runs_dir = Path(runs_dir)
+        self.run_id = run_id or new_job_id()
+        self.run_dir = self.runs_dir / self.run_id
+        self.assets_dir = self.run_dir / "assets"
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.RLock()  # Segment content is checkpointed from worker threads
+
+        now = datetime.now().isoformat()
+        self.data = {
+            "version": RUN_STATE_VERSION,
+            "run_id": self.run_id,
+            "created_at": now,
+            "updated_at": now,
+            "steps_completed": [],
+            "videos": {},
+        }
+
+    @property
+    def state_path(self) -> Path:
+        """Path of the state file."""
+        return self.run_dir / "state.json"
+
+    @classmethod
+    def load(
+        cls,
+        runs_dir: str,
+        run_id: str,
+        logger: Optional[structlog.BoundLogger] = None
+    ) -> "RunState":
+        """
+        Load the state of an earlier run.
+
+        Args:
+            runs_dir: Directory holding one subdirectory per run
+            run_id: ID of the run to resume
+            logger: Logger instance
+
+        Returns:
+            RunState instance
+
+        Raises:
+            FileNotFoundError: If the run does not exist
+            ValueError: If the state was written by an incompatible version
+        """
+        run_state = cls(runs_dir, run_id, logger)
+        with open(run_state.state_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != RUN_STATE_VERSION:
+            raise ValueError(f"Unsupported run state version: {data.get('version')}")
+
+        run_state.data = data
+        return run_state
+
+    def save(self) -> None:
+        """Write the state as JSON (atomically)."""
+        with self._lock:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            self.data["updated_at"] = datetime.now().isoformat()
+            temp_path = self.state_path.with_name(f".state.json.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.state_path)
+
+    def _scope(self, article_index: Optional[int]) -> dict:
+        """Get the run-level state, or the state of one article's video."""
+        if article_index is None:
+            return self.data
+        return self.data["videos"].setdefault(str(article_index), {"steps_completed": [], "segments": {}})
+
+    def is_completed(self, step: str, article_index: Optional[int] = None) -> bool:
+        """
+        Check whether a step was completed.
+
+        Args:
+            step: Step name (e.g. "fetch_news", "generate_script")
+            article_index: Article of a per-video step (None for run-level steps)
+
+        Returns:
+            True if the step's results are recorded
+        """
+        with self._lock:
+            return step in self._scope(article_index)["steps_completed"]
+
+    def get_steps_completed(self, article_index: Optional[int] = None) -> list:
+        """
+        Get the completed steps, in completion order.
+
+        Args:
+            article_index: Article of per-video steps (None for run-level steps)
+
+        Returns:
+            List of step names (a copy)
+        """
+        with self._lock:
+            return list(self._scope(article_index)["steps_completed"])
+
+    def get(self, key: str, article_index: Optional[int] = None, default=None):
+        """
+        Get a recorded result.
+
+        Args:
+            key: Result name (e.g. "articles", "korean_script")
+            article_index: Article of a per-video result (None for run-level results)
+            default: Value returned when the result is not recorded
+
+        Returns:
+            The recorded value
+        """
+        with self._lock:
+            return self._scope(article_index).get(key, default)
+
+    def complete_step(self, step: str, article_index: Optional[int] = None, **results) -> None:
+        """
+        Record a completed step and its results, and save the state.
+
+        Args:
+            step: Step name
+            article_index: Article of a per-video step (None for run-level steps)
+            **results: JSON-serializable results of the step
+        """
+        with self._lock:
+            scope = self._scope(article_index)
+            scope.update(results)
+            if step not in scope["steps_completed"]:
+                scope["steps_completed"].append(step)
+            self.save()
+
+        self.logger.info("run_step_checkpointed", run_id=self.run_id, step=step, article_index=article_index)
+
+    def set_result(self, key: str, value, article_index: Optional[int] = None) -> None:
+        """
+        Record a result that is not a step of its own, and save the state.
+
+        Args:
+            key: Result name
+            value: JSON-serializable value
+            article_index: Article of a per-video result (None for run-level results)
+        """
+        with self._lock:
+            self._scope(article_index)[key] = value
+            self.save()
+
+    def get_segment(self, article_index: int, segment_number: int) -> dict:
+        """
+        Get the recorded content of a segment.
+
+        Args:
+            article_index: Article of the video
+            segment_number: Segment number
+
+        Returns:
+            Recorded fields (title, image_prompt, image_path, audio_path, audio_duration), a copy
+        """
+        with self._lock:
+            return dict(self._scope(article_index)["segments"].get(str(segment_number), {}))
+
+    def update_segment(self, article_index: int, segment_number: int, **fields) -> None:
+        """
+        Record content of a segment, and save the state.
+
+        Args:
+            article_index: Article of the video
+            segment_number: Segment number
+            **fields: JSON-serializable segment fields
+        """
+        with self._lock:
+            self._scope(article_index)["segments"].setdefault(str(segment_number), {}).update(fields)
+            self.save()
+
+    def keep_asset(self, file_path: str) -> str:
+        """
+        Copy a generated file into the run's assets, named by content digest.
+
+        Args:
+            file_path: Generated image or narration (in the job workspace)
+
+        Returns:
+            Path of the kept copy
+        """
+        asset_path = self.assets_dir / f"{file_digest(file_path)}{Path(file_path).suffix.lower()}"
+        if not asset_path.exists():
+            self.assets_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = asset_path.with_name(f".{asset_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                shutil.copyfile(file_path, temp_path)
+                os.replace(temp_path, asset_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        return str(asset_path)
+
+    def restore_asset(self, file_path: Optional[str], directory: Path) -> Optional[str]:
+        """
+        Copy a kept asset into a job workspace so the render treats it like a fresh file.
+
+        Files outside the run's assets (e.g. pre-defined media) are used in place.
+
+        Args:
+            file_path: Recorded path
+            directory: Job workspace
+
+        Returns:
+            Path to use for rendering, or None if the file no longer exists
+        """
+        if not file_path or not Path(file_path).exists():
+            return None
+        if not Path(file_path).resolve().is_relative_to(self.assets_dir.resolve()):
+            return file_path
+        restored_path = Path(directory) / Path(file_path).name
+        shutil.copyfile(file_path, restored_path)
+        return str(restored_path)
+
+    @staticmethod
+    def prune(runs_dir: str, max_runs: int, keep: Optional[str] = None) -> int:
+        """
+        Remove the least recently updated runs beyond max_runs.
+
+        Args:
+            runs_dir: Directory holding one subdirectory per run
+            max_runs: Maximum number of runs kept
+            keep: Run ID that is never removed (the current run)
+
+        Returns:
+            Number of runs removed
+        """
+        entries = []
+        for run_dir in Path(runs_dir).glob("*"):
+            state_path = run_dir / "state.json"
+            if run_dir.name == keep or not state_path.exists():
+                continue
+            entries.append((state_path.stat().st_mtime, run_dir))
+
+        excess = len(entries) - (max_runs - (1 if keep else 0))
+        if excess <= 0:
+            return 0
+
+        entries.sort()
+        for _, run_dir in entries[:excess]:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        return excess
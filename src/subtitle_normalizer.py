@@ -0,0 +1,118 @@
+"""
+Korean number and currency normalizer for subtitle text.
+
+TTS scripts spell numbers out ("이점오 퍼센트", "십억 원") so the narration
+sounds natural; subtitles read better with digits and symbols ("2.5 %",
+"10억 ₩"). All rewrite rules are compiled into one alternation and applied
+in a single scan, so each subtitle line is walked once no matter how many
+rules exist.
+
+Usage:
+    from src.subtitle_normalizer import normalize_subtitle_text
+
+    normalize_subtitle_text("테슬라 주가가 이점오 퍼센트 상승했습니다")
+    # -> "테슬라 주가가 2.5 % 상승했습니다"
+"""
+import re
+
+
+# Spelled-out digits used in decimals ("일점오" = 1.5) and quarters ("삼 분기" = Q3)
+DIGIT_WORDS = {
+    "일": "1", "이": "2", "삼": "3", "사": "4", "오": "5",
+    "육": "6", "칠": "7", "팔": "8", "구": "9",
+}
+
+# Standalone magnitude words rewritten to digits ("십억" = 10억)
+MAGNITUDE_WORDS = {"십억": "10억", "백억": "100억", "천억": "1000억", "일조": "1조"}
+
+CURRENCY_SYMBOLS = {"달러": "$", "원": "₩"}
+
+# A currency word only counts as a unit when followed by a space, comma, period or the end
+_CURRENCY_END = r"(?=\s|[,.]|$)"
+
+# "원" directly after a magnitude or number unit ("억 원", "만원") becomes "₩"
+_WON_AFTER = r"\s*원" + _CURRENCY_END
+
+_DIGIT_CLASS = "[" + "".join(DIGIT_WORDS) + "]"
+
+# Characters that make a magnitude word part of a larger spelled-out number
+_NUMBER_WORD_CLASS = "[" + "".join(DIGIT_WORDS) + "십백천]"
+
+# One alternation for every rule. Alternatives that can touch the output of
+# another rule (a decimal or number followed by 억/만 and 원) absorb that
+# context, so one left-to-right scan gives the same result as applying the
+# rules one after another.
+_PATTERN = re.compile(
+    # 퍼센트 -> %
+    r"(?P<percent>퍼센트)"
+    # 100달러 -> 100$, 100 원 -> 100₩, 5 억 -> 5억, 5만 원 -> 5만₩
+    r"|(?P<number>\d+)(?:"
+    r"\s*(?P<number_currency>달러|원)" + _CURRENCY_END +
+    r"|\s*(?P<number_unit>[억만])(?P<number_won>" + _WON_AFTER + r")?)"
+    # 이점오 -> 2.5 (with 억/만 and 원 following it, or a magnitude word right after)
+    r"|(?P<decimal>" + _DIGIT_CLASS + r")점오(?:"
+    r"\s*(?P<decimal_unit>[억만])(?P<decimal_won>" + _WON_AFTER + r")?"
+    r"|(?P<decimal_magnitude>십억|백억|천억)(?P<decimal_magnitude_won>" + _WON_AFTER + r")?"
+    r"|(?P<decimal_trillion>일조))?"
+    # 일 분기 -> 1분기 (only as a separate word)
+    r"|(?<!\S)(?P<quarter>[일이삼사])\s*분기"
+    # 십억 -> 10억, 일조 -> 1조 (not when part of a larger number such as 삼백억)
+    r"|(?<!" + _NUMBER_WORD_CLASS + r")(?:"
+    r"(?P<magnitude>십억|백억|천억)(?P<magnitude_won>" + _WON_AFTER + r")?"
+    r"|(?P<trillion>일조))"
+    # 억 원 -> 억₩, 만원 -> 만₩
+    r"|(?P<unit>[억만천백])" + _WON_AFTER
+)
+
+
+def _replace(match: re.Match) -> str:
+    """Rewrite one match of _PATTERN."""
+    groups = match.groupdict()
+
+    if groups["percent"]:
+        return "%"
+
+    if groups["number"]:
+        if groups["number_currency"]:
+            return groups["number"] + CURRENCY_SYMBOLS[groups["number_currency"]]
+        return groups["number"] + groups["number_unit"] + ("₩" if groups["number_won"] else "")
+
+    if groups["decimal"]:
+        text = DIGIT_WORDS[groups["decimal"]] + ".5"
+        if groups["decimal_unit"]:
+            text += groups["decimal_unit"] + ("₩" if groups["decimal_won"] else "")
+        elif groups["decimal_magnitude"]:
+            text += MAGNITUDE_WORDS[groups["decimal_magnitude"]] + ("₩" if groups["decimal_magnitude_won"] else "")
+        elif groups["decimal_trillion"]:
+            text += MAGNITUDE_WORDS["일조"]
+        return text
+
+    if groups["quarter"]:
+        return DIGIT_WORDS[groups["quarter"]] + "분기"
+
+    if groups["magnitude"]:
+        return MAGNITUDE_WORDS[groups["magnitude"]] + ("₩" if groups["magnitude_won"] else "")
+
+    if groups["trillion"]:
+        return MAGNITUDE_WORDS["일조"]
+
+    if groups["unit"]:
+        return groups["unit"] + "₩"
+
+    raise AssertionError(f"Unhandled subtitle normalizer match: {match.group(0)!r}")
+
+
+def normalize_subtitle_text(text: str) -> str:
+    """
+    Convert TTS-optimized Korean text to subtitle-friendly format.
+
+    Spelled-out percentages, decimals, quarters, magnitudes and currencies
+    are rewritten to digits and symbols in one scan.
+
+    Args:
+        text: TTS-optimized Korean text with spelled-out numbers
+
+    Returns:
+        Subtitle-friendly text with numeric symbols
+    """
+    return _PATTERN.sub(_replace, text)
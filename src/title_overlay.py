@@ -0,0 +1,252 @@
+"""
+Pre-rendered segment title overlays.
+
+The title bar (background boxes, two yellow glow layers, outlined text and
+highlight) is rasterized once per (title, font, size, width, layout) into an
+RGBA PNG and kept in a content-keyed on-disk cache, so clips composite it
+with a single overlay instead of running four drawtext filters per frame.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+import structlog
+from PIL import Image, ImageDraw, ImageFont
+
+
+# Bump when the rendering below changes so stale overlays are not reused
+RENDER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class TitleLayout:
+    """Geometry and colors of a title bar (mirrors the drawbox/drawtext chains)."""
+    height: int  # Height of the overlay strip at the top of the frame
+    bars: tuple  # (y, height, RGBA color) background boxes
+    text_y: int  # y of the highlight layer; glow/outline layers are offset from it
+
+    def scaled(self, scale: float) -> "TitleLayout":
+        """
+        Scale the layout designed for full resolution to another output size.
+
+        Args:
+            scale: Output size relative to full resolution
+
+        Returns:
+            Scaled TitleLayout
+        """
+        if scale == 1.0:
+            return self
+        return TitleLayout(
+            height=max(1, round(self.height * scale)),
+            bars=tuple((round(y * scale), max(1, round(h * scale)), color) for y, h, color in self.bars),
+            text_y=round(self.text_y * scale),
+        )
+
+
+TITLE_LAYOUTS = {
+    # Image clips: sky blue padding, grayish-black bar (440px tall), text at ~220px
+    "image": TitleLayout(
+        height=440,
+        bars=(
+            (0, 40, (0x87, 0xCE, 0xEB, 255)),
+            (40, 360, (0x3a, 0x3a, 0x3a, 255)),
+            (400, 40, (0x87, 0xCE, 0xEB, 255)),
+        ),
+        text_y=220,
+    ),
+    # Pre-defined video clips: black@0.8 box (260px tall), text at ~160px
+    "video": TitleLayout(
+        height=260,
+        bars=(
+            (0, 260, (0, 0, 0, 204)),
+        ),
+        text_y=160,
+    ),
+}
+
+# Text layers drawn bottom to top: (y offset, fill, outline width, outline color)
+TEXT_LAYERS = (
+    # Outer glow effect (yellow glow for visibility)
+    (-2, (255, 255, 0, 77), 0, None),
+    (-4, (255, 255, 0, 51), 0, None),
+    # Main text with bold outline for readability
+    (2, (255, 255, 255, 255), 5, (0, 0, 0, 230)),
+    # Inner highlight layer
+    (0, (255, 255, 255, 255), 0, None),
+)
+
+# Bundled font used when the requested font is not installed
+DEFAULT_FONT_PATH = str(Path(__file__).parent.parent / "fonts" / "NanumSquareB.ttf")
+
+
+def render_title_overlay(
+    title: str,
+    font_path: str,
+    font_size: int,
+    width: int,
+    layout: TitleLayout,
+    scale: float = 1.0
+) -> Image.Image:
+    """
+    Rasterize a title bar into an RGBA image.
+
+    Args:
+        title: Title text
+        font_path: Path to the font file
+        font_size: Font size in pixels
+        width: Overlay width (video width)
+        layout: Title bar layout (already scaled)
+        scale: Output size relative to full resolution (scales glow offsets and outline)
+
+    Returns:
+        RGBA image of size (width, layout.height)
+    """
+    canvas = Image.new("RGBA", (width, layout.height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    for y, height, color in layout.bars:
+        draw.rectangle([0, y, width - 1, y + height - 1], fill=color)
+
+    font = ImageFont.truetype(font_path, font_size)
+    text_x = (width - draw.textlength(title, font=font)) / 2
+
+    # Each layer is composited separately so translucent glows blend like drawtext
+    for y_offset, fill, stroke_width, stroke_fill in TEXT_LAYERS:
+        layer = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).text(
+            (text_x, layout.text_y + round(y_offset * scale)),
+            title,
+            font=font,
+            fill=fill,
+            stroke_width=round(stroke_width * scale),
+            stroke_fill=stroke_fill,
+            anchor="la"
+        )
+        canvas = Image.alpha_composite(canvas, layer)
+
+    return canvas
+
+
+class TitleOverlayCache:
+    """Content-keyed on-disk cache of title overlay PNGs with LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: int = 256,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Title Overlay Cache.
+
+        Args:
+            cache_dir: Directory holding the cached PNGs
+            max_entries: Maximum number of overlays kept (least recently used are evicted)
+            logger: Logger instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.logger = logger or structlog.get_logger()
+        self._lock = threading.Lock()
+
+    def _cache_key(
+        self,
+        title: str,
+        font_path: str,
+        font_size: int,
+        width: int,
+        layout: TitleLayout,
+        scale: float
+    ) -> str:
+        """Hash everything that affects the rendered pixels."""
+        font_stat = os.stat(font_path)
+        key_data = {
+            "version": RENDER_VERSION,
+            "title": title,
+            "font": os.path.realpath(font_path),
+            "font_size_bytes": font_stat.st_size,
+            "font_mtime_ns": font_stat.st_mtime_ns,
+            "font_size": font_size,
+            "width": width,
+            "layout": asdict(layout),
+            "scale": scale,
+        }
+        encoded = json.dumps(key_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(
+        self,
+        title: str,
+        font_path: str,
+        font_size: int,
+        width: int,
+        layout: str,
+        scale: float = 1.0
+    ) -> Path:
+        """
+        Get the overlay PNG for a title, rendering it on a cache miss.
+
+        Args:
+            title: Title text
+            font_path: Path to the font file
+            font_size: Font size in pixels
+            width: Overlay width (video width)
+            layout: Layout name ("image" or "video")
+            scale: Output size relative to full resolution (draft renders are smaller)
+
+        Returns:
+            Path to the cached RGBA PNG
+        """
+        title_layout = TITLE_LAYOUTS[layout].scaled(scale)
+
+        if not Path(font_path).exists():
+            self.logger.warning("title_font_not_found", font_path=font_path, fallback=DEFAULT_FONT_PATH)
+            font_path = DEFAULT_FONT_PATH
+
+        key = self._cache_key(title, font_path, font_size, width, title_layout, scale)
+        overlay_path = self.cache_dir / f"{key}.png"
+
+        if overlay_path.exists():
+            # Refresh mtime so eviction treats this entry as recently used
+            try:
+                os.utime(overlay_path)
+                return overlay_path
+            except FileNotFoundError:
+                pass  # Evicted by another worker in the meantime
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        image = render_title_overlay(title, font_path, font_size, width, title_layout, scale)
+
+        # Write atomically: parallel clip workers may ask for the same title
+        temp_path = overlay_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        image.save(temp_path, format="PNG")
+        os.replace(temp_path, overlay_path)
+
+        self.logger.info("title_overlay_rendered", title=title, layout=layout, overlay_path=str(overlay_path))
+
+        self._evict()
+        return overlay_path
+
+    def _evict(self) -> None:
+        """Remove the least recently used overlays beyond max_entries."""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.png"):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+
+            entries.sort()
+            for _, path in entries[:excess]:
+                path.unlink(missing_ok=True)
+
+            self.logger.debug("title_overlay_cache_evicted", evicted=excess)
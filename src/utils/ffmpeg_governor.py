@@ -0,0 +1,247 @@
+"""
+Host-wide ffmpeg concurrency governor.
+
+Overlapping pipeline runs (cron jobs, batch renders) each start ffmpeg
+processes sized for every core, and together they thrash the machine. The
+governor is a token pool shared by every process on the host: each slot is
+a lock file under a common directory, held with flock() while an ffmpeg
+process runs, so the kernel releases it even if the holder crashes.
+
+- At most max_slots ffmpeg processes run at once, host-wide
+- Each process gets cpu_count / max_slots threads, so the total tracks the cores
+- Background work (proxy warming, music beds, loudness analysis) waits while
+  a render is queued, and never takes the last free slot
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+import structlog
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, the governor is disabled
+    fcntl = None
+
+
+# Publish-critical encodes (clips, single pass, finishing pass)
+PRIORITY_RENDER = "render"
+
+# Work that can wait behind renders (proxies, music beds, analysis, sprites)
+PRIORITY_BACKGROUND = "background"
+
+# Seconds between two attempts to take a slot
+POLL_INTERVAL = 0.1
+
+# Shared by every pipeline process on the host unless configured otherwise
+DEFAULT_LOCK_DIR = Path(tempfile.gettempdir()) / "ffmpeg_governor"
+
+
+@dataclass
+class FfmpegSlot:
+    """A slot held by one ffmpeg process."""
+    index: int
+    threads: int
+    wait_seconds: float
+
+
+class FfmpegGovernor:
+    """flock-based token pool limiting concurrent ffmpeg processes host-wide."""
+
+    # ffmpeg options without a value (any other option consumes the next argument)
+    VALUELESS_OPTIONS = frozenset({
+        '-y', '-n', '-an', '-vn', '-sn', '-dn', '-shortest', '-nostdin', '-nostats', '-stats',
+        '-hide_banner', '-copyts', '-re',
+    })
+
+    def __init__(
+        self,
+        lock_dir: Optional[str] = None,
+        max_slots: int = 0,
+        cpu_count: Optional[int] = None,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the ffmpeg Governor.
+
+        Args:
+            lock_dir: Directory holding the slot lock files (shared by all processes)
+            max_slots: Maximum concurrent ffmpeg processes (0 = half the CPU cores, at least 1)
+            cpu_count: CPU cores to share (None = os.cpu_count())
+            logger: Logger instance
+        """
+        self.lock_dir = Path(lock_dir) if lock_dir else DEFAULT_LOCK_DIR
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.max_slots = max_slots if max_slots > 0 else max(1, self.cpu_count // 2)
+        self.logger = logger or structlog.get_logger()
+
+    @property
+    def threads_per_slot(self) -> int:
+        """ffmpeg threads each slot may use."""
+        return max(1, self.cpu_count // self.max_slots)
+
+    def _open_lock(self, name: str):
+        """Open (and create) a lock file in the lock directory."""
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        return open(self.lock_dir / name, "a")
+
+    def _render_waiting(self) -> bool:
+        """Check whether a render is queued for a slot (it holds a shared lock on the marker)."""
+        with self._open_lock("render_waiting.lock") as marker:
+            try:
+                fcntl.flock(marker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(marker, fcntl.LOCK_UN)
+            return False
+
+    def _try_acquire(self, slot_count: int) -> Optional[tuple]:
+        """Try to lock one of the first slot_count slots without blocking."""
+        for index in range(slot_count):
+            lock_file = self._open_lock(f"slot_{index}.lock")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return index, lock_file
+            except BlockingIOError:
+                lock_file.close()
+        return None
+
+    @contextmanager
+    def slot(self, priority: str = PRIORITY_RENDER, step: str = "ffmpeg") -> Iterator[FfmpegSlot]:
+        """
+        Hold a slot while an ffmpeg process runs, waiting for one if all are taken.
+
+        Args:
+            priority: PRIORITY_RENDER or PRIORITY_BACKGROUND
+            step: Name of the encode step (for logging)
+
+        Yields:
+            FfmpegSlot with the thread budget of the process
+        """
+        started = time.monotonic()
+
+        # A queued render announces itself so background work stays out of its way
+        marker = None
+        if priority == PRIORITY_RENDER:
+            marker = self._open_lock("render_waiting.lock")
+            fcntl.flock(marker, fcntl.LOCK_SH)
+
+        # Background work never takes the last slot, so a render can always start
+        slot_count = self.max_slots
+        if priority == PRIORITY_BACKGROUND and self.max_slots > 1:
+            slot_count = self.max_slots - 1
+
+        try:
+            while True:
+                if priority != PRIORITY_BACKGROUND or not self._render_waiting():
+                    acquired = self._try_acquire(slot_count)
+                    if acquired is not None:
+                        break
+                time.sleep(POLL_INTERVAL)
+        finally:
+            if marker is not None:
+                marker.close()  # Closing releases the shared lock
+
+        index, lock_file = acquired
+        wait_seconds = time.monotonic() - started
+        if wait_seconds >= 1.0:
+            self.logger.info(
+                "ffmpeg_slot_waited",
+                step=step,
+                priority=priority,
+                slot=index,
+                wait_seconds=round(wait_seconds, 2)
+            )
+
+        try:
+            yield FfmpegSlot(index=index, threads=self.threads_per_slot, wait_seconds=wait_seconds)
+        finally:
+            lock_file.close()  # Closing releases the slot
+
+    def apply_threads(self, command: list, threads: int) -> list:
+        """
+        Fit an ffmpeg command into a slot's thread budget.
+
+        Existing -threads and -filter_complex_threads values are capped (0 =
+        auto becomes the budget). Every output without its own -threads gets
+        one, so multi-output commands stay within the budget, and a
+        -filter_complex graph gets -filter_complex_threads.
+
+        Args:
+            command: ffmpeg command (first element is the ffmpeg executable)
+            threads: Thread budget of the slot
+
+        Returns:
+            Command with the thread budget applied
+        """
+        def cap(value: str) -> str:
+            requested = int(value)
+            return str(threads if requested <= 0 else min(requested, threads))
+
+        result = [command[0]]
+        if '-filter_complex' in command and '-filter_complex_threads' not in command:
+            result += ['-filter_complex_threads', str(threads)]
+
+        output_has_threads = False
+        i = 1
+        while i < len(command):
+            arg = command[i]
+            if arg in ('-threads', '-filter_complex_threads') and i + 1 < len(command):
+                result += [arg, cap(command[i + 1])]
+                output_has_threads = output_has_threads or arg == '-threads'
+                i += 2
+            elif arg == '-i' and i + 1 < len(command):
+                # Options so far belonged to this input; the next output starts fresh
+                result += [arg, command[i + 1]]
+                output_has_threads = False
+                i += 2
+            elif arg.startswith('-') and len(arg) > 1:
+                takes_value = arg not in self.VALUELESS_OPTIONS and i + 1 < len(command)
+                result += command[i:i + 2] if takes_value else [arg]
+                i += 2 if takes_value else 1
+            else:
+                # A positional argument is an output file: it closes the output's options
+                if not output_has_threads:
+                    result += ['-threads', str(threads)]
+                result.append(arg)
+                output_has_threads = False
+                i += 1
+        return result
+
+
+_governor: Optional[FfmpegGovernor] = None
+
+
+def configure_ffmpeg_governor(
+    enabled: bool,
+    lock_dir: Optional[str] = None,
+    max_slots: int = 0,
+    logger: Optional[structlog.BoundLogger] = None
+) -> Optional[FfmpegGovernor]:
+    """
+    Install (or remove) the governor used by every run_ffmpeg call in this process.
+
+    Args:
+        enabled: Whether ffmpeg processes are governed
+        lock_dir: Directory holding the slot lock files (None = shared default)
+        max_slots: Maximum concurrent ffmpeg processes (0 = half the CPU cores)
+        logger: Logger instance
+
+    Returns:
+        The installed governor, or None when disabled or unsupported
+    """
+    global _governor
+    if not enabled or fcntl is None:
+        _governor = None
+    else:
+        _governor = FfmpegGovernor(lock_dir=lock_dir, max_slots=max_slots, logger=logger)
+    return _governor
+
+
+def get_ffmpeg_governor() -> Optional[FfmpegGovernor]:
+    """Get the governor installed for this process (None if ffmpeg is not governed)."""
+    return _governor
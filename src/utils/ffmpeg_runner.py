@@ -0,0 +1,197 @@
+"""
+Shared ffmpeg runner with live progress telemetry.
+
+Every invocation runs with `-progress pipe:1`; the key=value progress blocks
+(frame, fps, speed, out_time) are parsed as they stream and logged as
+`ffmpeg_progress` events with an ETA. When the process exits, its wall time,
+CPU time, peak RSS (from the child's rusage) and output file size are logged
+as `ffmpeg_completed`, so the cost of each encode step can be compared.
+"""
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from typing import Iterable, Optional
+
+import structlog
+
+from .ffmpeg_governor import PRIORITY_RENDER, get_ffmpeg_governor
+
+
+# Minimum seconds between two ffmpeg_progress events of one invocation
+PROGRESS_LOG_INTERVAL = 5.0
+
+
+def _parse_out_time(progress: dict) -> Optional[float]:
+    """Get the encoded media time in seconds from a progress block."""
+    # out_time_us is authoritative; out_time_ms is also microseconds (historic ffmpeg naming)
+    for key in ("out_time_us", "out_time_ms"):
+        value = progress.get(key, "")
+        if value.lstrip("-").isdigit():
+            return max(0.0, int(value) / 1_000_000)
+    return None
+
+
+def _parse_speed(progress: dict) -> Optional[float]:
+    """Get the encode speed multiplier (e.g. '2.5x') from a progress block."""
+    value = progress.get("speed", "").strip().rstrip("x")
+    try:
+        speed = float(value)
+    except ValueError:
+        return None
+    return speed if speed > 0 else None
+
+
+def _read_progress(
+    stream,
+    logger: structlog.BoundLogger,
+    step: str,
+    expected_duration: Optional[float],
+    started: float
+) -> None:
+    """Parse -progress blocks from ffmpeg stdout and log them (runs in a thread)."""
+    progress = {}
+    last_logged = 0.0
+
+    for raw_line in iter(stream.readline, b""):
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        progress[key] = value
+
+        if key != "progress":
+            continue
+
+        # A block is complete: log it (throttled, but always the final one)
+        now = time.monotonic()
+        finished = value == "end"
+        if finished or now - last_logged >= PROGRESS_LOG_INTERVAL:
+            last_logged = now
+            out_time = _parse_out_time(progress)
+            speed = _parse_speed(progress)
+
+            event = {
+                "step": step,
+                "frame": int(progress["frame"]) if progress.get("frame", "").isdigit() else None,
+                "fps": progress.get("fps"),
+                "speed": speed,
+                "out_time_seconds": round(out_time, 2) if out_time is not None else None,
+                "elapsed_seconds": round(now - started, 2),
+                "finished": finished,
+            }
+            if expected_duration and out_time is not None:
+                event["percent"] = round(min(out_time / expected_duration, 1.0) * 100, 1)
+                if speed:
+                    event["eta_seconds"] = round(max(expected_duration - out_time, 0.0) / speed, 1)
+
+            logger.info("ffmpeg_progress", **event)
+
+        progress = {}
+
+
+def run_ffmpeg(
+    command: list,
+    logger: Optional[structlog.BoundLogger] = None,
+    step: str = "ffmpeg",
+    expected_duration: Optional[float] = None,
+    stdin_chunks: Optional[Iterable[bytes]] = None,
+    priority: str = PRIORITY_RENDER
+) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg command with progress telemetry and resource accounting.
+
+    Args:
+        command: ffmpeg command (first element is the ffmpeg executable)
+        logger: Logger instance
+        step: Name of the encode step used in log events
+        expected_duration: Expected output duration in seconds (enables percent and ETA)
+        stdin_chunks: Data written to ffmpeg's stdin (e.g. raw video frames), or None
+        priority: Governor priority (PRIORITY_RENDER, or PRIORITY_BACKGROUND for work
+            that can wait behind renders)
+
+    Returns:
+        CompletedProcess with the captured stderr
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg exits with a non-zero code (stderr attached)
+    """
+    logger = logger or structlog.get_logger()
+    governor = get_ffmpeg_governor()
+    slot_context = governor.slot(priority=priority, step=step) if governor else nullcontext()
+
+    # With a governor, the process runs only while it holds a host-wide slot
+    with slot_context as slot:
+        if slot is not None:
+            command = governor.apply_threads(command, slot.threads)
+        full_command = [command[0], "-progress", "pipe:1", "-nostats"] + list(command[1:])
+
+        started = time.monotonic()
+
+        # stderr goes to a temp file so a chatty ffmpeg can't block on a full pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                full_command,
+                stdin=subprocess.PIPE if stdin_chunks is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            )
+
+            reader = threading.Thread(
+                target=_read_progress,
+                args=(process.stdout, logger, step, expected_duration, started),
+                daemon=True
+            )
+            reader.start()
+
+            if stdin_chunks is not None:
+                try:
+                    for chunk in stdin_chunks:
+                        process.stdin.write(chunk)
+                except BrokenPipeError:
+                    pass  # ffmpeg exited early; its stderr explains why
+                finally:
+                    try:
+                        process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+
+            usage = None
+            if hasattr(os, "wait4"):
+                # Reap the child ourselves to get its resource usage
+                _, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+            else:
+                process.wait()
+
+            reader.join()
+            process.stdout.close()
+
+            stderr_file.seek(0)
+            stderr_output = stderr_file.read()
+
+    wall_seconds = time.monotonic() - started
+    metrics = {"step": step, "returncode": process.returncode, "wall_seconds": round(wall_seconds, 2)}
+    if slot is not None:
+        metrics["threads"] = slot.threads
+        metrics["slot_wait_seconds"] = round(slot.wait_seconds, 2)
+    if usage is not None:
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak_rss_bytes = usage.ru_maxrss if os.uname().sysname == "Darwin" else usage.ru_maxrss * 1024
+        metrics["cpu_seconds"] = round(usage.ru_utime + usage.ru_stime, 2)
+        metrics["cpu_utilization"] = round((usage.ru_utime + usage.ru_stime) / max(wall_seconds, 1e-6), 2)
+        metrics["peak_rss_mb"] = round(peak_rss_bytes / (1024 * 1024), 1)
+
+    # The last argument is the output file of almost every command
+    output_path = str(command[-1])
+    if process.returncode == 0 and output_path != "-" and os.path.isfile(output_path):
+        metrics["output_mb"] = round(os.path.getsize(output_path) / (1024 * 1024), 3)
+
+    if process.returncode != 0:
+        logger.error("ffmpeg_failed", **metrics)
+        raise subprocess.CalledProcessError(process.returncode, full_command, output=b"", stderr=stderr_output)
+
+    logger.info("ffmpeg_completed", **metrics)
+    return subprocess.CompletedProcess(full_command, process.returncode, stdout=b"", stderr=stderr_output)
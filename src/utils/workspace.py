@@ -0,0 +1,120 @@
+"""
+Per-job scratch workspace for intermediate render files.
+"""
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+
+# tmpfs mount used when scratch files should stay in RAM
+TMPFS_ROOT = Path("/dev/shm")
+
+
+def new_job_id() -> str:
+    """
+    Create a collision-free job ID.
+
+    The leading Unix timestamp keeps IDs sortable and compatible with tools
+    that read the timestamp from `name_<timestamp>_...` file names.
+
+    Returns:
+        Job ID such as '1734567890_3f9a1c2e'
+    """
+    return f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
+
+
+class JobWorkspace:
+    """
+    Scratch directory owned by one render job.
+
+    Intermediate files (clips, concat lists, narration, background music,
+    subtitles) are written here instead of the shared output directory. The
+    directory is always removed when the job ends, on success or failure;
+    only files explicitly promoted are moved to the output directory.
+
+    Usage:
+        with JobWorkspace(output_dir="output") as workspace:
+            clip = workspace.path / "clip_0.mp4"
+            ...
+            workspace.promote(final_video)
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        scratch_dir: Optional[str] = None,
+        use_tmpfs: bool = False,
+        job_id: Optional[str] = None,
+        logger: Optional[structlog.BoundLogger] = None
+    ):
+        """
+        Initialize the Job Workspace.
+
+        Args:
+            output_dir: Directory that receives promoted files
+            scratch_dir: Parent directory for the workspace (None for the system temp dir)
+            use_tmpfs: Place the workspace on /dev/shm when available (keeps intermediate I/O in RAM)
+            job_id: Job ID (a new unique ID when None)
+            logger: Logger instance
+        """
+        self.output_dir = Path(output_dir)
+        self.job_id = job_id or new_job_id()
+        self.logger = logger or structlog.get_logger()
+
+        if use_tmpfs and TMPFS_ROOT.is_dir() and os.access(TMPFS_ROOT, os.W_OK):
+            root = TMPFS_ROOT
+        elif scratch_dir:
+            root = Path(scratch_dir)
+        else:
+            root = Path(tempfile.gettempdir())
+
+        self.path = root / "yutu_jobs" / f"job_{self.job_id}"
+
+    def __enter__(self) -> "JobWorkspace":
+        self.create()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cleanup()
+
+    def create(self) -> None:
+        """Create the workspace directory."""
+        self.path.mkdir(parents=True, exist_ok=False)
+        self.logger.info("job_workspace_created", job_id=self.job_id, workspace=str(self.path))
+
+    def promote(self, file_path: str, name: Optional[str] = None) -> str:
+        """
+        Move a finished file from the workspace into the output directory.
+
+        The file is first copied next to its destination under a temporary name
+        and then renamed, so readers of the output directory never see a
+        partially written file.
+
+        Args:
+            file_path: File to promote
+            name: File name in the output directory (defaults to the current name)
+
+        Returns:
+            Path of the promoted file
+        """
+        source = Path(file_path)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        destination = self.output_dir / (name or source.name)
+        partial = destination.with_name(f".{destination.name}.{self.job_id}.partial")
+
+        shutil.move(str(source), str(partial))
+        os.replace(partial, destination)
+
+        self.logger.info("job_file_promoted", job_id=self.job_id, path=str(destination))
+        return str(destination)
+
+    def cleanup(self) -> None:
+        """Remove the workspace and everything left in it."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.logger.info("job_workspace_removed", job_id=self.job_id, workspace=str(self.path))
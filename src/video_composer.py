@@ -1,21 +1,65 @@
 """
 Video composition module using ffmpeg to combine video and audio.
 """
+import math
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
 
 import ffmpeg
 import structlog
 
+from .audio_timeline import AudioTimeline, build_audio_timeline
+from .clip_render_session import ClipRenderSession
 from .config import Config
-from .utils.error_handler import VideoCompositionError, VideoGenerationError
+from .ken_burns import KenBurnsRenderer, build_zoompan_filter, get_movement_pattern
+from .logo_sprite import ROTATION_PERIOD, LogoSpriteCache
+from .loudness_cache import LoudnessCache
+from .media_proxy import MediaProxyCache
+from .probe_cache import ProbeCache
+from .render_manifest import ClipCache, RenderManifest, file_digest, segment_hash
+from .subtitle_normalizer import normalize_subtitle_text
+from .title_overlay import TitleOverlayCache
+from .utils.error_handler import VideoCompositionError
+from .utils.ffmpeg_governor import configure_ffmpeg_governor, get_ffmpeg_governor
+from .utils.ffmpeg_runner import run_ffmpeg
 from .utils.logger import log_error
 
 
 class VideoComposer:
     """Combines video and Korean audio using ffmpeg."""
 
+    # Korean TTS narration is sped up by 1.2x in the final mix
+    AUDIO_SPEED_FACTOR = 1.2
+
+    # Narration gain applied before mixing with the background music (50% louder)
+    VOICE_VOLUME_BOOST = 1.5
+
+    # Frame rate of every rendered clip
+    FPS = 30
+
+    # Output resolution (width, height) per aspect ratio
+    OUTPUT_SIZES = {
+        "9:16": (1080, 1920),  # Portrait
+        "16:9": (1920, 1080),  # Landscape
+        "1:1": (1080, 1080),  # Square
+    }
+
+    # Width of the sky blue frame around the final video
+    FRAME_PADDING = 50
+
+    # Size of the spinning channel icon
+    ICON_SIZE = 180
+
+    # Font size of the segment title overlay
+    TITLE_FONT_SIZE = 80
+
+    # Shortest last chunk of a chunked finishing encode (shorter tails join the previous chunk)
+    MIN_FINAL_CHUNK_SECONDS = 1.0
+
     def __init__(self, config: Config, logger: Optional[structlog.BoundLogger] = None):
         """
         Initialize the Video Composer.
@@ -26,6 +70,51 @@ class VideoComposer:
         """
         self.config = config
         self.logger = logger or structlog.get_logger()
+        self.encoding = config.get_encoding_profile()
+        # Every ffmpeg process of this run shares the host-wide slot pool
+        configure_ffmpeg_governor(
+            enabled=config.enable_ffmpeg_governor,
+            lock_dir=config.ffmpeg_governor_dir or None,
+            max_slots=config.ffmpeg_max_concurrent,
+            logger=self.logger
+        )
+        self.title_overlay_cache = TitleOverlayCache(
+            cache_dir=str(Path(config.cache_dir) / "title_overlays"),
+            max_entries=config.title_overlay_cache_size,
+            logger=self.logger
+        )
+        self.logo_sprite_cache = LogoSpriteCache(
+            cache_dir=str(Path(config.cache_dir) / "logo_sprites"),
+            fps=self.FPS,
+            logger=self.logger
+        )
+        width, height = self._get_output_size()
+        self.media_proxy_cache = MediaProxyCache(
+            cache_dir=str(Path(config.cache_dir) / "media_proxies"),
+            width=width,
+            height=height,
+            fps=self.FPS,
+            logger=self.logger
+        )
+        self.probe_cache = None
+        if config.enable_probe_cache:
+            self.probe_cache = ProbeCache(
+                db_path=str(Path(config.cache_dir) / "probes.sqlite3"),
+                logger=self.logger
+            )
+        self.loudness_cache = None
+        if config.enable_loudness_normalization:
+            self.loudness_cache = LoudnessCache(
+                db_path=str(Path(config.cache_dir) / "loudness.sqlite3"),
+                logger=self.logger
+            )
+        self.clip_cache = None
+        if config.enable_clip_cache:
+            self.clip_cache = ClipCache(
+                cache_dir=str(Path(config.cache_dir) / "clips"),
+                max_entries=config.clip_cache_size,
+                logger=self.logger
+            )
 
     def _convert_tts_to_subtitle_format(self, text: str) -> str:
         """
@@ -38,53 +127,7 @@ class VideoComposer:
         Returns:
             Subtitle-friendly text with numeric symbols
         """
-        import re
-
-        # Common number word to numeric conversions
-        replacements = [
-            # Percentages
-            (r'퍼센트', '%'),
-
-            # Currency - only replace when it's clearly a currency unit
-            # Match when preceded by numbers/spaces and followed by space/punctuation/end
-            (r'(\d+)\s*달러(?=\s|[,.]|$)', r'\1$'),  # 100달러, 천달러 etc (after numbers)
-            (r'(\d+)\s*원(?=\s|[,.]|$)', r'\1₩'),  # 100원, 천원 etc (after numbers)
-            (r'(억|만|천|백)\s*원(?=\s|[,.]|$)', r'\1₩'),  # 억원, 만원, 천원 (after number words)
-
-            # Common fractions and decimals (context-aware)
-            (r'일점오', '1.5'),
-            (r'이점오', '2.5'),
-            (r'삼점오', '3.5'),
-            (r'사점오', '4.5'),
-            (r'오점오', '5.5'),
-            (r'육점오', '6.5'),
-            (r'칠점오', '7.5'),
-            (r'팔점오', '8.5'),
-            (r'구점오', '9.5'),
-
-            # Large numbers
-            (r'(\d+)\s*억', r'\1억'),  # Keep spacing correct for billions
-            (r'(\d+)\s*만', r'\1만'),  # Keep spacing correct for ten-thousands
-
-            # Quarter references (분기) - only at word boundaries
-            (r'(?<!\S)일\s*분기', '1분기'),
-            (r'(?<!\S)이\s*분기', '2분기'),
-            (r'(?<!\S)삼\s*분기', '3분기'),
-            (r'(?<!\S)사\s*분기', '4분기'),
-
-            # Common number + 억 patterns - only match standalone, not parts of larger numbers
-            # Use negative lookbehind to ensure not preceded by other number words
-            (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)십억', '10억'),
-            (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)백억', '100억'),
-            (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)천억', '1000억'),
-            (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)일조', '1조'),
-        ]
-
-        result = text
-        for pattern, replacement in replacements:
-            result = re.sub(pattern, replacement, result)
-
-        return result
+        return normalize_subtitle_text(text)
 
     def combine_video_audio(
         self,
@@ -158,8 +201,10 @@ class VideoComposer:
                     audio_input,
                     str(final_video),
                     vcodec='libx264',  # Need to re-encode when using filters
+                    preset=self.encoding.preset,
+                    crf=self.encoding.crf,
                     acodec='aac',
-                    audio_bitrate='192k',
+                    audio_bitrate=self.encoding.audio_bitrate,
                     shortest=None,
                     strict='experimental'
                 )
@@ -171,17 +216,17 @@ class VideoComposer:
                     str(final_video),
                     vcodec='copy',
                     acodec='aac',
-                    audio_bitrate='192k',
+                    audio_bitrate=self.encoding.audio_bitrate,
                     shortest=None,
                     strict='experimental'
                 )
 
             # Run ffmpeg
-            ffmpeg.run(
-                output,
-                capture_stdout=True,
-                capture_stderr=True,
-                overwrite_output=True
+            run_ffmpeg(
+                ffmpeg.compile(output, overwrite_output=True),
+                logger=self.logger,
+                step="combine_video_audio",
+                expected_duration=audio_duration
             )
 
             # Verify output file was created
@@ -200,7 +245,7 @@ class VideoComposer:
 
             return str(final_video)
 
-        except ffmpeg.Error as e:
+        except subprocess.CalledProcessError as e:
             # Extract ffmpeg error output
             stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
 
@@ -220,6 +265,44 @@ class VideoComposer:
             log_error(self.logger, e, "video_composer.combine_video_audio")
             raise VideoCompositionError(f"Video composition failed: {str(e)}")
 
+    def _probe(self, media_path: str) -> dict:
+        """
+        Probe a media file, through the persistent probe cache when enabled.
+
+        Args:
+            media_path: Path to the media file
+
+        Returns:
+            ffprobe result with 'format' and 'streams'
+
+        Raises:
+            ffmpeg.Error: If ffprobe fails
+        """
+        if self.probe_cache is not None:
+            return self.probe_cache.probe(media_path)
+        return ffmpeg.probe(media_path)
+
+    def _probe_many(self, media_paths: list) -> dict:
+        """
+        Probe several media files, in parallel for cache misses when the probe cache is enabled.
+
+        Args:
+            media_paths: Paths to media files
+
+        Returns:
+            Dict mapping each successfully probed path (as str) to its probe result
+        """
+        if self.probe_cache is not None:
+            return self.probe_cache.probe_many(media_paths)
+
+        probes = {}
+        for media_path in media_paths:
+            try:
+                probes[str(media_path)] = ffmpeg.probe(str(media_path))
+            except ffmpeg.Error as e:
+                self.logger.warning("probe_failed", file_path=str(media_path), error=str(e))
+        return probes
+
     def get_video_duration(self, video_path: str) -> float:
         """
         Get the duration of a video file in seconds.
@@ -234,7 +317,7 @@ class VideoComposer:
             VideoCompositionError: If unable to get duration
         """
         try:
-            probe = ffmpeg.probe(video_path)
+            probe = self._probe(video_path)
             duration = float(probe['format']['duration'])
             return duration
 
@@ -256,7 +339,7 @@ class VideoComposer:
             VideoCompositionError: If unable to get duration
         """
         try:
-            probe = ffmpeg.probe(audio_path)
+            probe = self._probe(audio_path)
             duration = float(probe['format']['duration'])
             return duration
 
@@ -264,13 +347,20 @@ class VideoComposer:
             log_error(self.logger, e, "video_composer.get_audio_duration")
             raise VideoCompositionError(f"Failed to get audio duration: {str(e)}")
 
-    def concatenate_videos(self, video_paths: list, output_dir: str = "output") -> str:
+    def concatenate_videos(
+        self,
+        video_paths: list,
+        output_dir: str = "output",
+        stream_copy: bool = False
+    ) -> str:
         """
         Concatenate multiple video clips into a single video.
 
         Args:
             video_paths: List of paths to video files to concatenate
             output_dir: Directory to save the concatenated video
+            stream_copy: Join with -c copy when all clips have compatible streams
+                (falls back to re-encoding when their parameters differ)
 
         Returns:
             Path to the concatenated video file
@@ -313,24 +403,29 @@ class VideoComposer:
                     abs_path = Path(video_path).resolve()
                     f.write(f"file '{abs_path}'\n")
 
+            if stream_copy and self._clips_are_stream_compatible(video_paths):
+                # Clips share codec parameters and start on keyframes → join without re-encoding
+                codec_args = ['-c', 'copy']
+            else:
+                # Re-encode to ensure smooth transitions and consistent timing
+                # This prevents freezes/delays between clips
+                codec_args = self.encoding.video_args() + [  # Re-encode video for smooth transitions
+                    '-c:a', 'aac',  # Re-encode audio
+                    '-pix_fmt', 'yuv420p',
+                    '-vsync', 'cfr',  # Constant frame rate for smooth playback
+                    '-r', '30',  # Standardize frame rate to 30fps
+                ] + self.encoding.thread_args()
+
             # Use ffmpeg concat demuxer to concatenate videos
-            # Re-encode to ensure smooth transitions and consistent timing
-            # This prevents freezes/delays between clips
-            subprocess.run([
+            run_ffmpeg([
                 'ffmpeg',
                 '-f', 'concat',
                 '-safe', '0',
                 '-i', str(concat_list_file),
-                '-c:v', 'libx264',  # Re-encode video for smooth transitions
-                '-c:a', 'aac',  # Re-encode audio
-                '-pix_fmt', 'yuv420p',
-                '-vsync', 'cfr',  # Constant frame rate for smooth playback
-                '-r', '30',  # Standardize frame rate to 30fps
-                '-preset', 'medium',
-                '-crf', '23',  # Quality setting
+            ] + codec_args + [
                 '-movflags', '+faststart',  # Enable fast start for web playback
                 str(concatenated_video)
-            ], check=True, capture_output=True)
+            ], logger=self.logger, step="concatenate_videos")
 
             # Clean up the concat list file
             concat_list_file.unlink()
@@ -378,6 +473,53 @@ class VideoComposer:
             log_error(self.logger, e, "video_composer.concatenate_videos")
             raise VideoCompositionError(f"Video concatenation failed: {str(e)}")
 
+    def _clips_are_stream_compatible(self, video_paths: list) -> bool:
+        """
+        Check with ffprobe whether clips can be joined by stream copy.
+
+        Args:
+            video_paths: List of paths to video files
+
+        Returns:
+            True if every clip has the same video stream parameters
+        """
+        # Parameters that must match for the concat demuxer to stream-copy cleanly
+        compared_fields = (
+            'codec_name', 'profile', 'width', 'height', 'pix_fmt',
+            'r_frame_rate', 'time_base', 'sample_aspect_ratio'
+        )
+
+        probes = self._probe_many(video_paths)
+
+        reference = None
+        for video_path in video_paths:
+            probe = probes.get(str(video_path))
+            if probe is None:
+                self.logger.warning("concat_probe_failed", video_path=video_path)
+                return False
+
+            streams = probe.get('streams', [])
+            video_streams = [st for st in streams if st.get('codec_type') == 'video']
+            if len(video_streams) != 1:
+                return False
+
+            params = {field: video_streams[0].get(field) for field in compared_fields}
+            params['stream_types'] = sorted(st.get('codec_type') for st in streams)
+
+            if reference is None:
+                reference = params
+            elif params != reference:
+                self.logger.info(
+                    "concat_stream_copy_unavailable",
+                    video_path=video_path,
+                    expected=reference,
+                    actual=params,
+                    action="re_encoding"
+                )
+                return False
+
+        return True
+
     def _is_video_file(self, file_path: str) -> bool:
         """
         Check if a file is a video (vs an image).
@@ -391,6 +533,199 @@ class VideoComposer:
         video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv'}
         return Path(file_path).suffix.lower() in video_extensions
 
+    def _get_clip_encoder_args(self, still_image: bool = False) -> list:
+        """
+        Get the video encoder arguments for segment clips.
+
+        The clip format decides how concatenate_videos can join the clips:
+            - standard: encoding profile H.264, clips are re-encoded on concat
+            - matched: identical H.264 parameters with strict 1s GOPs, joined by stream copy
+            - lossless: lossless x264 at ultrafast as a mezzanine, joined by stream copy
+
+        Args:
+            still_image: Whether the clip is rendered from a still image (Ken Burns)
+
+        Returns:
+            List of ffmpeg video encoder arguments
+        """
+        clip_format = self.config.clip_intermediate_format
+
+        if clip_format == "lossless":
+            return ['-c:v', 'libx264', '-preset', 'ultrafast', '-qp', '0']
+
+        encoder_args = self.encoding.video_args(still_image=still_image)
+        if clip_format == "matched":
+            # Same pixel format, timescale and GOP structure on every clip so they can be stream-copied
+            encoder_args += [
+                '-pix_fmt', 'yuv420p',
+                '-sc_threshold', '0',
+                '-video_track_timescale', '15360',
+            ]
+        return encoder_args
+
+    def _get_title_font(self, layout: str) -> str:
+        """
+        Get the font used for segment titles.
+
+        Args:
+            layout: Title layout ("image" for Ken Burns clips, "video" for pre-defined videos)
+
+        Returns:
+            Path to the font file
+        """
+        if layout == "image":
+            # Rounded, cute Korean font bundled with the project for cross-platform compatibility
+            return str(Path(__file__).parent.parent / "fonts" / "NanumSquareB.ttf")
+
+        # Korean font support on pre-defined videos (cross-platform)
+        import platform
+        if platform.system() == "Darwin":  # macOS
+            return "/System/Library/Fonts/AppleSDGothicNeo.ttc"
+        return "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc"  # Linux (Ubuntu) - Noto Sans CJK
+
+    def _get_title_overlay(
+        self,
+        segment_title: str,
+        width: int,
+        layout: str,
+        layout_scale: float = 1.0
+    ) -> Optional[Path]:
+        """
+        Get the cached pre-rendered title overlay PNG for a segment.
+
+        Args:
+            segment_title: Title to overlay (as returned by _prepare_segment_title)
+            width: Output width
+            layout: Title layout ("image" or "video")
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+
+        Returns:
+            Path to the RGBA overlay PNG, or None when titles are drawn with drawtext
+        """
+        if self.config.title_overlay_mode != "png":
+            return None
+
+        # Titles are quote-escaped for drawtext; the PNG gets the literal text
+        return self.title_overlay_cache.get(
+            title=segment_title.replace("\\'", "'"),
+            font_path=self._get_title_font(layout),
+            font_size=self._px(self.TITLE_FONT_SIZE, layout_scale),
+            width=width,
+            layout=layout,
+            scale=self.encoding.resolution_scale * layout_scale
+        )
+
+    def _get_title_filter(
+        self,
+        segment_title: str,
+        width: int,
+        layout: str,
+        layout_scale: float = 1.0,
+        enable: Optional[str] = None
+    ) -> str:
+        """
+        Build the drawbox/drawtext title chain for a layout.
+
+        Args:
+            segment_title: Title to overlay
+            width: Output width
+            layout: Title layout ("image" or "video")
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+            enable: Timeline expression limiting when the title is shown (None for always)
+
+        Returns:
+            drawbox/drawtext filter chain
+        """
+        if layout == "image":
+            return self._get_image_title_filter(segment_title, width, layout_scale, enable)
+        return self._get_video_title_filter(segment_title, width, layout_scale, enable)
+
+    def _get_clip_filter_args(self, base_filter: str, segment_title: str, width: int, layout: str) -> list:
+        """
+        Build the filter arguments of a clip encode, adding the title overlay.
+
+        With cached PNG titles the overlay is an extra input composited by a
+        single overlay filter, so these arguments must directly follow the
+        media input (before any output option such as -t).
+
+        Args:
+            base_filter: Filter chain applied to the media input before the title
+            segment_title: Title to overlay
+            width: Output width
+            layout: Title layout ("image" or "video")
+
+        Returns:
+            ffmpeg arguments (-vf, or an overlay input plus -filter_complex/-map)
+        """
+        overlay_path = self._get_title_overlay(segment_title, width, layout)
+        if overlay_path is None:
+            return ['-vf', f"{base_filter},{self._get_title_filter(segment_title, width, layout)}"]
+
+        return [
+            '-i', str(overlay_path),
+            '-filter_complex', f"[0:v]{base_filter}[base];[base][1:v]overlay=0:0[titled]",
+            '-map', '[titled]',
+        ]
+
+    def _get_video_title_filter(
+        self,
+        segment_title: str,
+        width: int,
+        layout_scale: float = 1.0,
+        enable: Optional[str] = None
+    ) -> str:
+        """
+        Build the title overlay filter used on pre-defined video clips.
+
+        Args:
+            segment_title: Title to overlay
+            width: Output width
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+            enable: Timeline expression limiting when the title is shown (None for always)
+
+        Returns:
+            drawbox/drawtext filter chain
+        """
+        font_path = self._get_title_font("video")
+        px = lambda value: self._px(value, layout_scale)
+        font_size = px(self.TITLE_FONT_SIZE)
+
+        # Escape special characters in title text for ffmpeg
+        # Colons need to be escaped as they're used as parameter separators in filters
+        escaped_title = segment_title.replace("'", "'\\''").replace(":", "\\:")
+
+        # Enhanced title for mobile visibility: larger font (80), extra tall box (260), extreme top padding
+        # Extreme top padding: text starts at ~160px from top for absolute maximum mobile visibility
+        return self._join_title_filters([
+            f"drawbox=y=0:color=black@0.8:width={width}:height={px(260)}:t=fill",
+            # Outer glow effects (yellow glow for visibility)
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=yellow@0.3:x=(w-text_w)/2:y={px(158)}:borderw=0",
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=yellow@0.2:x=(w-text_w)/2:y={px(156)}:borderw=0",
+            # Main text with bold outline for readability
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=white:x=(w-text_w)/2:y={px(162)}:borderw={px(5)}:bordercolor=black@0.9",
+            # Inner highlight layer
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=white:x=(w-text_w)/2:y={px(160)}",
+        ], enable)
+
+    def _join_title_filters(self, title_filters: list, enable: Optional[str]) -> str:
+        """
+        Join drawbox/drawtext filters into one chain, optionally timeline-gated.
+
+        Args:
+            title_filters: Individual filter strings
+            enable: Timeline expression (e.g. "between(t,0,4.5)"), or None for always on
+
+        Returns:
+            Comma-separated filter chain
+        """
+        if enable:
+            title_filters = [f"{title_filter}:enable='{enable}'" for title_filter in title_filters]
+        return ','.join(title_filters)
+
     def _prepare_video_clip(
         self,
         media_path: str,
@@ -398,7 +733,8 @@ class VideoComposer:
         output_path: Path,
         width: int,
         height: int,
-        segment_title: str
+        segment_title: str,
+        threads: int = 0
     ) -> None:
         """
         Prepare a video clip from pre-defined video, matching target duration.
@@ -410,92 +746,55 @@ class VideoComposer:
             width: Output width
             height: Output height
             segment_title: Title to overlay
+            threads: ffmpeg thread count (0 lets ffmpeg decide)
 
         Raises:
             VideoCompositionError: If preparation fails
         """
         try:
+            source_path, conformed = self._get_video_source(media_path)
+
             # Get video duration
-            video_duration = self.get_video_duration(media_path)
+            video_duration = self.get_video_duration(source_path)
 
             self.logger.info(
                 "preparing_video_clip",
                 video_duration=video_duration,
                 target_duration=target_duration,
-                will_loop=video_duration < target_duration
+                will_loop=video_duration < target_duration,
+                from_proxy=conformed
             )
 
-            # Prepare title overlay with Korean font support (cross-platform)
-            import platform
-            if platform.system() == "Darwin":  # macOS
-                font_path = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
-                font_name = "AppleSDGothicNeo-Regular"
-            else:  # Linux (Ubuntu) - use Noto Sans CJK
-                font_path = "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc"
-                font_name = "Noto Sans CJK KR"
-            
-            # Escape special characters in title text for ffmpeg
-            # Colons need to be escaped as they're used as parameter separators in filters
-            escaped_title = segment_title.replace("'", "'\\''").replace(":", "\\:")
-
-            # Enhanced title for mobile visibility: larger font (80), extra tall box (260), extreme top padding
-            # Extreme top padding: text starts at ~160px from top for absolute maximum mobile visibility
-            title_filter = (
-                f"drawbox=y=0:color=black@0.8:width={width}:height=260:t=fill,"
-                # Outer glow effects (yellow glow for visibility)
-                f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                f"fontsize=80:fontcolor=yellow@0.3:x=(w-text_w)/2:y=158:borderw=0,"
-                f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                f"fontsize=80:fontcolor=yellow@0.2:x=(w-text_w)/2:y=156:borderw=0,"
-                # Main text with bold outline for readability
-                f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                f"fontsize=80:fontcolor=white:x=(w-text_w)/2:y=162:borderw=5:bordercolor=black@0.9,"
-                # Inner highlight layer
-                f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                f"fontsize=80:fontcolor=white:x=(w-text_w)/2:y=160"
+            # Proxies already match the output geometry: only the title is drawn
+            base_filter = "null" if conformed else (
+                f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}"
             )
+            filter_args = self._get_clip_filter_args(base_filter, segment_title, width, "video")
 
             # Build ffmpeg command
             # Force keyframe at the start for smooth concatenation
-            fps = 30
+            fps = self.FPS
+            loop_args = []
             if video_duration < target_duration:
                 # Video is shorter → loop it
                 num_loops = int(target_duration / video_duration) + 1
-                subprocess.run([
-                    'ffmpeg',
-                    '-stream_loop', str(num_loops),
-                    '-i', media_path,
-                    '-t', str(target_duration),
-                    '-vf', f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},{title_filter}",
-                    '-c:v', 'libx264',
-                    '-preset', 'medium',
-                    '-crf', '23',
-                    '-r', str(fps),  # Set frame rate
-                    '-vsync', 'cfr',  # Constant frame rate
-                    '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
-                    '-keyint_min', str(fps),  # Minimum keyframe interval
-                    '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
-                    '-an',  # No audio
-                    str(output_path)
-                ], check=True, capture_output=True)
-            else:
-                # Video is longer or equal → trim it
-                subprocess.run([
-                    'ffmpeg',
-                    '-i', media_path,
-                    '-t', str(target_duration),
-                    '-vf', f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},{title_filter}",
-                    '-c:v', 'libx264',
-                    '-preset', 'medium',
-                    '-crf', '23',
-                    '-r', str(fps),  # Set frame rate
-                    '-vsync', 'cfr',  # Constant frame rate
-                    '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
-                    '-keyint_min', str(fps),  # Minimum keyframe interval
-                    '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
-                    '-an',  # No audio
-                    str(output_path)
-                ], check=True, capture_output=True)
+                loop_args = ['-stream_loop', str(num_loops)]
+            # Otherwise the video is longer or equal → trim it
+
+            run_ffmpeg(['ffmpeg'] + loop_args + [
+                '-i', source_path,
+            ] + filter_args + [
+                '-t', str(target_duration),
+            ] + self._get_clip_encoder_args() + [
+                '-threads', str(threads),  # Per-clip thread budget (clips render in parallel)
+                '-r', str(fps),  # Set frame rate
+                '-vsync', 'cfr',  # Constant frame rate
+                '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
+                '-keyint_min', str(fps),  # Minimum keyframe interval
+                '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
+                '-an',  # No audio
+                str(output_path)
+            ], logger=self.logger, step="video_clip", expected_duration=target_duration)
 
             self.logger.info("video_clip_prepared", output_path=str(output_path))
 
@@ -504,621 +803,1933 @@ class VideoComposer:
             self.logger.error("video_clip_prep_error", error=stderr_output)
             raise VideoCompositionError(f"Failed to prepare video clip: {stderr_output}")
 
-    def create_slideshow_with_subtitles(
-        self,
-        segments_data: list,
-        output_dir: str = "output"
-    ) -> str:
+    def _get_output_size(self, aspect_ratio: Optional[str] = None) -> tuple:
         """
-        Create a slideshow video from images/videos with synchronized audio and subtitles.
+        Get the output resolution for an aspect ratio.
 
         Args:
-            segments_data: List of dictionaries containing:
-                - image_path: Path to the image/video file
-                - audio_path: Path to the audio file
-                - audio_duration: Duration of the audio
-                - text: Subtitle text for this segment
-                - segment_number: Segment number
-            output_dir: Directory to save the final video
+            aspect_ratio: Aspect ratio (defaults to the configured one)
 
         Returns:
-            Path to the final slideshow video
+            Tuple of (width, height) in pixels
+        """
+        aspect_ratio = aspect_ratio or self.config.video_aspect_ratio
+        width, height = self.OUTPUT_SIZES.get(aspect_ratio, self.OUTPUT_SIZES["1:1"])
 
-        Raises:
-            VideoCompositionError: If creation fails
+        # Draft profiles render at reduced resolution (kept even for yuv420p)
+        scale = self.encoding.resolution_scale
+        return int(width * scale) // 2 * 2, int(height * scale) // 2 * 2
+
+    def _px(self, value: int, layout_scale: float = 1.0) -> int:
         """
-        if not segments_data:
-            raise VideoCompositionError("No segments provided for slideshow")
+        Scale a layout size designed for full resolution to the output resolution.
 
-        self.logger.info(
-            "creating_slideshow_with_subtitles",
-            num_segments=len(segments_data)
-        )
+        Args:
+            value: Size in full-resolution 9:16 pixels
+            layout_scale: Extra layout scale of the output variant (see _get_layout_scale)
 
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Size in output pixels
+        """
+        return max(1, round(value * self.encoding.resolution_scale * layout_scale))
 
-        import time
-        timestamp = int(time.time())
+    def _get_layout_scale(self, aspect_ratio: str) -> float:
+        """
+        Get how much the 9:16 layout (titles, frame, icon, subtitles) shrinks for an aspect ratio.
 
-        try:
-            # Step 1: Create video clips for each image with its duration
-            video_clips = []
-
-            # Define audio speed factor (used throughout video composition)
-            speed_factor = 1.2  # 1.2x speed for Korean TTS
-
-            for i, segment in enumerate(segments_data):
-                # Adjust clip duration to match sped-up audio
-                # When audio is sped up by 1.2x, actual duration is original_duration / 1.2
-                clip_duration = segment['audio_duration'] / speed_factor
-
-                media_path = segment['image_path']  # Could be image or video
-                clip_output = output_path / f"clip_{i}_{timestamp}.mp4"
-
-                # Calculate resolution based on aspect ratio
-                aspect_ratio = self.config.video_aspect_ratio
-                if aspect_ratio == "9:16":
-                    width, height = 1080, 1920  # Portrait
-                elif aspect_ratio == "16:9":
-                    width, height = 1920, 1080  # Landscape
-                else:  # 1:1
-                    width, height = 1080, 1080  # Square
-
-                # Get segment title for overlay
-                segment_title = segment.get('title', '').replace("'", "\\'")
-
-                # Truncate title if too long to prevent overflow
-                # For short-form video, keep titles concise (max 10 chars)
-                max_title_length = 10
-                if len(segment_title) > max_title_length:
-                    segment_title = segment_title[:max_title_length] + "..."
-
-                # Check if media is a video or image
-                if self._is_video_file(media_path):
-                    # Handle pre-defined video
-                    self.logger.info(
-                        "creating_video_clip_from_video",
-                        segment_number=segment['segment_number'],
-                        video_path=media_path,
-                        duration=clip_duration
-                    )
+        The layout is designed for a 1080x1920 canvas; other canvases use the
+        largest uniform scale at which it still fits (0.5625 for 16:9 and 1:1).
 
-                    self._prepare_video_clip(
-                        media_path=media_path,
-                        target_duration=clip_duration,
-                        output_path=clip_output,
-                        width=width,
-                        height=height,
-                        segment_title=segment_title
-                    )
+        Args:
+            aspect_ratio: Aspect ratio of the output variant
 
-                    video_clips.append(str(clip_output))
-                    continue
+        Returns:
+            Layout scale factor (1.0 for 9:16)
+        """
+        width, height = self.OUTPUT_SIZES.get(aspect_ratio, self.OUTPUT_SIZES["1:1"])
+        base_width, base_height = self.OUTPUT_SIZES["9:16"]
+        return min(width / base_width, height / base_height)
 
-                # Handle image with Ken Burns effect
-                self.logger.info(
-                    "creating_video_clip_from_image",
-                    segment_number=segment['segment_number'],
-                    image_path=media_path,
-                    duration=clip_duration
-                )
+    def _get_video_source(self, media_path: str) -> tuple:
+        """
+        Get the file to read a pre-defined video from, preferring its cached proxy.
 
-                # Create video clip from image with dynamic Ken Burns effect (zoom + pan)
-                fps = 30
-
-                # Calculate total frames for zoompan filter
-                total_frames = int(clip_duration * fps)
-
-                # Dynamic movement patterns: Mix of zoom-in, zoom-out, and varied panning
-                # Each pattern creates lively, engaging motion perfect for short clips
-                # Using zoompan filter with proper syntax: z='zoom+delta' or z='zoom-delta'
-                # 'on' is frame number (0, 1, 2, ...), zoom starts at initial value
-                movement_patterns = [
-                    # Pattern 0: Zoom IN (starts at zoom=1.2, increases to ~1.5) + pan right
-                    # Creates focus effect moving right
-                    f"scale=3*iw:3*ih,zoompan=z='1.2+0.001*on':x='iw/2-(iw/zoom/2)+on*1.5':y='ih/2-(ih/zoom/2)':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 1: Zoom OUT (starts at zoom=1.5, decreases to ~1.2) + pan left
-                    # Creates reveal effect moving left
-                    f"scale=3*iw:3*ih,zoompan=z='1.5-0.001*on':x='iw/2-(iw/zoom/2)-on*1.2':y='ih/2-(ih/zoom/2)':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 2: Zoom IN + diagonal pan (zoom in, move diagonally down-right)
-                    # Creates dramatic focus from top-left
-                    f"scale=3*iw:3*ih,zoompan=z='1.2+0.0012*on':x='iw/2-(iw/zoom/2)+on*1':y='ih/2-(ih/zoom/2)+on*0.7':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 3: Zoom OUT + upward pan (zoom out, move up)
-                    # Creates upward reveal effect
-                    f"scale=3*iw:3*ih,zoompan=z='1.5-0.001*on':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)-on*1.3':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 4: Strong zoom IN + slow pan right
-                    # Creates intense focus with subtle movement
-                    f"scale=3.5*iw:3.5*ih,zoompan=z='1.1+0.0015*on':x='iw/2-(iw/zoom/2)+on*0.8':y='ih/2-(ih/zoom/2)':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 5: Zoom OUT + diagonal pan (zoom out, move diagonally up-left)
-                    # Creates sweeping reveal
-                    f"scale=3*iw:3*ih,zoompan=z='1.5-0.0012*on':x='iw/2-(iw/zoom/2)-on*0.9':y='ih/2-(ih/zoom/2)-on*0.8':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 6: Moderate zoom IN + downward pan
-                    # Creates focus moving down
-                    f"scale=3*iw:3*ih,zoompan=z='1.2+0.0008*on':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)+on*1.1':d={total_frames}:s={width}x{height}:fps={fps}",
-                    
-                    # Pattern 7: Zoom OUT + horizontal sweep (zoom out, move right)
-                    # Creates wide reveal sweep
-                    f"scale=3*iw:3*ih,zoompan=z='1.5-0.001*on':x='iw/2-(iw/zoom/2)-on*1.6':y='ih/2-(ih/zoom/2)':d={total_frames}:s={width}x{height}:fps={fps}",
-                ]
-
-                # Select pattern based on segment index to add variety across the video
-                ken_burns = movement_patterns[i % len(movement_patterns)]
-
-                # Enhanced title overlay with gradient background and glow effect
-                # Prepare title overlay with rounded, cute Korean font
-                # Use project-bundled font for cross-platform compatibility
-                font_path = str(Path(__file__).parent.parent / "fonts" / "NanumSquareB.ttf")
-                font_name = "NanumSquare"
-                
-                # Escape special characters in title text for ffmpeg
-                # Colons need to be escaped as they're used as parameter separators in filters
-                escaped_title = segment_title.replace("'", "'\\''").replace(":", "\\:")
-
-                # Enhanced title for mobile visibility: larger font (80), extra tall box (440), extreme top padding
-                # Extreme top padding: text starts at ~220px from top for absolute maximum mobile visibility
-                title_filter = (
-                    # Sky blue padding at top (solid color, no opacity)
-                    f"drawbox=y=0:color=0x87CEEB:width={width}:height=40:t=fill,"
-                    # Grayish-black background bar (solid, not pure black)
-                    f"drawbox=y=40:color=0x3a3a3a:width={width}:height=360:t=fill,"
-                    # Sky blue padding at bottom of title area (solid color, no opacity)
-                    f"drawbox=y=400:color=0x87CEEB:width={width}:height=40:t=fill,"
-                    # Outer glow effect (multiple layers for smooth glow)
-                    f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                    f"fontsize=80:fontcolor=yellow@0.3:x=(w-text_w)/2:y=218:borderw=0,"
-                    f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                    f"fontsize=80:fontcolor=yellow@0.2:x=(w-text_w)/2:y=216:borderw=0,"
-                    # Main text with bold outline for readability
-                    f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                    f"fontsize=80:fontcolor=white:x=(w-text_w)/2:y=222:borderw=5:bordercolor=black@0.9,"
-                    # Inner highlight layer
-                    f"drawtext=text='{escaped_title}':fontfile={font_path}:"
-                    f"fontsize=80:fontcolor=white:x=(w-text_w)/2:y=220"
-                )
+        Args:
+            media_path: Path to the library video
 
-                # Combine Ken Burns effect with title overlay
-                full_filter = (
-                    f"{ken_burns},"
-                    f"trim=duration={clip_duration},"
-                    f"setpts=PTS-STARTPTS,"
-                    f"{title_filter}"
-                )
+        Returns:
+            Tuple of (source path, True if already conformed to output size and frame rate)
+        """
+        if not self.config.enable_media_proxies:
+            return media_path, False
 
-                # Use ffmpeg to create video from image with Ken Burns effect and title overlay
-                # Ensure consistent frame rate and keyframes for smooth concatenation
-                subprocess.run([
-                    'ffmpeg',
-                    '-loop', '1',
-                    '-i', segment['image_path'],
-                    '-c:v', 'libx264',
-                    '-t', str(clip_duration),
-                    '-pix_fmt', 'yuv420p',
-                    '-vf', full_filter,
-                    '-r', str(fps),  # Set frame rate
-                    '-vsync', 'cfr',  # Constant frame rate
-                    '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
-                    '-keyint_min', str(fps),  # Minimum keyframe interval
-                    '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
-                    '-preset', 'medium',
-                    '-crf', '23',
-                    str(clip_output)
-                ], check=True, capture_output=True)
-
-                video_clips.append(str(clip_output))
+        try:
+            return str(self.media_proxy_cache.get_proxy(media_path)), True
+        except (OSError, subprocess.CalledProcessError) as e:
+            # A missing proxy only costs speed: fall back to conforming the original
+            self.logger.warning("media_proxy_unavailable", media_path=media_path, error=str(e)[:500])
+            return media_path, False
 
-                self.logger.info(
-                    "video_clip_created",
-                    segment_number=segment['segment_number'],
-                    clip_path=str(clip_output)
-                )
+    def _prepare_segment_title(self, segment: dict) -> str:
+        """
+        Get the overlay title for a segment, truncated for short-form video.
 
-            # Step 2: Concatenate all video clips
-            self.logger.info("concatenating_video_clips")
-            concatenated_video = self.concatenate_videos(video_clips, output_dir)
+        Args:
+            segment: Segment data dictionary
 
-            # Step 3: Concatenate all audio files
-            self.logger.info("concatenating_audio_files")
-            audio_list_file = output_path / f"audio_list_{timestamp}.txt"
-            concatenated_audio = output_path / f"concatenated_audio_{timestamp}.mp3"
+        Returns:
+            Title text ready for the title overlay
+        """
+        segment_title = segment.get('title', '').replace("'", "\\'")
 
-            with open(audio_list_file, 'w') as f:
-                for segment in segments_data:
-                    abs_path = Path(segment['audio_path']).resolve()
-                    f.write(f"file '{abs_path}'\n")
+        # Truncate title if too long to prevent overflow
+        # For short-form video, keep titles concise (max 10 chars)
+        max_title_length = 10
+        if len(segment_title) > max_title_length:
+            segment_title = segment_title[:max_title_length] + "..."
 
-            subprocess.run([
-                'ffmpeg',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', str(audio_list_file),
-                '-c', 'copy',
-                str(concatenated_audio)
-            ], check=True, capture_output=True)
+        return segment_title
 
-            audio_list_file.unlink()  # Clean up
+    def _get_clip_duration(self, segment: dict) -> float:
+        """
+        Get how long a segment's clip runs on the timeline.
 
-            # Step 4: Create subtitle file (ASS format) with proper styling
-            # Note: speed_factor is already defined earlier when creating video clips
-            # Adjust subtitle timing to match sped-up audio (divide by speed_factor)
-            if self.config.enable_subtitles:
-                self.logger.info("creating_subtitle_file", speed_factor=speed_factor)
-                subtitle_file = output_path / f"subtitles_{timestamp}.ass"
+        Args:
+            segment: Segment data dictionary
 
-                # Get font name for ASS file
-                # Use rounded, cute Korean fonts for friendly appearance
-                import platform
-                if platform.system() == "Darwin":  # macOS
-                    font_name = "NanumSquare"  # Rounded, friendly font
-                else:  # Linux (Ubuntu) - install with: apt-get install fonts-nanum
-                    font_name = "NanumSquare"  # Rounded, friendly font
-
-                with open(subtitle_file, 'w', encoding='utf-8') as f:
-                    # Write ASS header with style definition
-                    f.write("[Script Info]\n")
-                    f.write("ScriptType: v4.00+\n")
-                    f.write("PlayResX: 1080\n")
-                    f.write("PlayResY: 1920\n")
-                    f.write("WrapStyle: 1\n\n")
-
-                    f.write("[V4+ Styles]\n")
-                    f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-                    # PrimaryColour=white text, OutlineColour=very dark gray outline, BackColour=very dark gray background box
-                    # Spacing=5 adds character spacing for better readability
-                    f.write(f"Style: Default,{font_name},{self.config.subtitle_font_size},&H00FFFFFF,&H000000FF,&H00282828,&H00282828,0,0,0,0,100,100,5,0,3,6,2,2,60,60,820,1\n\n")
-
-                    f.write("[Events]\n")
-                    f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-
-                    current_time = 0.0
-                    subtitle_index = 1
-
-                    for segment in segments_data:
-                        # Convert TTS-optimized text to subtitle format (numbers as symbols)
-                        subtitle_text = self._convert_tts_to_subtitle_format(segment['text'])
-
-                        # Split text into words (Korean uses spaces between phrases/clauses)
-                        words = subtitle_text.split()
-                        total_words = len(words)
-
-                        if total_words == 0:
-                            continue
-
-                        # Calculate duration per word (adjusted for audio speed)
-                        # When audio is sped up by 1.2x, the actual duration is original_duration / 1.2
-                        segment_duration = segment['audio_duration'] / speed_factor
-                        time_per_word = segment_duration / total_words
-
-                        # Group words into chunks for 2-line subtitles
-                        # Show 3-4 words total, split into 2 lines (1-2 words per line)
-                        # This makes subtitles more compact and prevents long lines
-                        words_per_line = 2  # Words per line
-                        total_words_per_subtitle = 4  # Total words for 2 lines (2 lines × 2 words)
-
-                        for i in range(0, total_words, total_words_per_subtitle):
-                            # Get words for this subtitle (up to total_words_per_subtitle)
-                            word_chunk = words[i:i + total_words_per_subtitle]
-                            chunk_word_count = len(word_chunk)
-
-                            if chunk_word_count == 0:
-                                continue
-
-                            # Split words into two groups to ensure we never break Korean words
-                            # Korean doesn't use spaces between characters, so we split at word boundaries (spaces)
-                            # Try to balance line lengths while keeping words intact
-                            mid_point = (chunk_word_count + 1) // 2  # Start with roughly half by word count
-                            line1_words = word_chunk[:mid_point]
-                            line2_words = word_chunk[mid_point:]
-                            
-                            # Join words with spaces - this ensures Korean words stay intact
-                            line1_text = ' '.join(line1_words)
-                            line2_text = ' '.join(line2_words)
-                            
-                            # Adjust split point if first line is too long (Korean: ~10-12 chars per line for compact display)
-                            # This prevents ffmpeg from breaking long lines and splitting Korean characters
-                            # Shorter lines = less space taken up in video
-                            max_chars_per_line = 12  # Maximum characters per line for Korean subtitles (compact)
-                            
-                            if len(line1_text) > max_chars_per_line and mid_point > 1:
-                                # First line too long, move words to second line
-                                while len(line1_text) > max_chars_per_line and len(line1_words) > 1:
-                                    line2_words.insert(0, line1_words.pop())
-                                    line1_text = ' '.join(line1_words)
-                                    line2_text = ' '.join(line2_words)
-                            
-                            # Only create 2-line subtitle if we have words for both lines
-                            # This prevents splitting single words across lines
-                            if line2_text and len(line1_words) > 0 and len(line2_words) > 0:
-                                chunk_text = f"{line1_text}\n{line2_text}"
-                            else:
-                                # If split would result in empty second line or only one word, keep on one line
-                                chunk_text = ' '.join(word_chunk)
-
-                            # Calculate timing for this subtitle chunk
-                            # Subtitles sync exactly with narrative voice timing
-                            start_time = current_time
-                            end_time = current_time + (time_per_word * chunk_word_count)
-
-                            # Convert newlines to ASS format (\N instead of \n)
-                            ass_text = chunk_text.replace('\n', '\\N')
-
-                            # Add padding around text using hard spaces (\h in ASS format)
-                            # This creates visual padding inside the background box
-                            ass_text = f"\\h\\h{ass_text}\\h\\h"
-
-                            # ASS format: Dialogue: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text
-                            f.write(f"Dialogue: 0,{self._format_ass_time(start_time)},{self._format_ass_time(end_time)},Default,,0,0,0,,{ass_text}\n")
-
-                            subtitle_index += 1
-                            current_time = end_time
-
-                # Step 5: Combine video, audio, and subtitles
-                self.logger.info("combining_video_audio_subtitles")
-                final_video = output_path / f"final_shorts_{timestamp}.mp4"
-
-                # Build subtitle filter for ffmpeg with proper word wrapping
-                # Position subtitles based on config
-                subtitle_y = "h-th-50" if self.config.subtitle_position == "bottom" else \
-                            "50" if self.config.subtitle_position == "top" else "(h-th)/2"
-
-                # Create subtitle style with word wrapping enabled
-                # WordWrap=1 ensures words break correctly and aren't cut off
-                # Note: FontSize is in pixels relative to PlayResY
-                # With PlayResY=1920 (full video height), font size needs to be larger for visibility
-                # Font size of 100 with PlayResY=1920 provides good readability on mobile devices
-                # Using Alignment=2 (bottom-center) with MarginV=960 to position in vertical center
-                # Combine video with audio and burn in subtitles (ASS format with embedded styling)
-                video_input = ffmpeg.input(concatenated_video)
-                audio_input = ffmpeg.input(str(concatenated_audio))
-
-                # Apply speed and volume to audio (before mixing with background music or output)
-                # speed_factor already defined earlier (before subtitle generation)
-                volume_boost = 1.5  # 50% volume increase
-                audio_volume = audio_input.filter('volume', volume_boost)
-                audio_speed = audio_volume.filter('atempo', speed_factor)
-
-                # Use subtitles filter to burn in ASS subtitles
-                # Styling is embedded in the ASS file itself
-                video_with_subs = video_input.filter('subtitles', str(subtitle_file))
-
-                # Add sky blue gradient padding bars at top and bottom of entire video
-                # This creates a frame effect around the whole video
-                aspect_ratio = self.config.video_aspect_ratio
-                if aspect_ratio == "9:16":
-                    video_height = 1920
-                elif aspect_ratio == "16:9":
-                    video_height = 1080
-                else:  # 1:1
-                    video_height = 1080
-
-                # Add sky blue padding bars on all four edges to create a frame effect
-                # Solid color (no opacity) for clearer visibility
-                padding_width = 50  # Larger padding for more prominent frame effect
-
-                # Top padding bar
-                video_with_subs = video_with_subs.filter('drawbox',
-                    x=0, y=0, w='iw', h=padding_width,
-                    color='0x87CEEB', t='fill')
-
-                # Bottom padding bar
-                video_with_subs = video_with_subs.filter('drawbox',
-                    x=0, y=video_height-padding_width, w='iw', h=padding_width,
-                    color='0x87CEEB', t='fill')
-
-                # Get video width for left/right padding
-                if aspect_ratio == "9:16":
-                    video_width = 1080
-                elif aspect_ratio == "16:9":
-                    video_width = 1920
-                else:  # 1:1
-                    video_width = 1080
-
-                # Left padding bar
-                video_with_subs = video_with_subs.filter('drawbox',
-                    x=0, y=0, w=padding_width, h='ih',
-                    color='0x87CEEB', t='fill')
-
-                # Right padding bar
-                video_with_subs = video_with_subs.filter('drawbox',
-                    x=video_width-padding_width, y=0, w=padding_width, h='ih',
-                    color='0x87CEEB', t='fill')
-
-                # Calculate total audio duration for icon animation
-                total_audio_duration = sum(seg['audio_duration'] for seg in segments_data) / speed_factor
-
-                # Add spinning business icon in bottom left corner for lively effect
-                # Position: Bottom left corner, just inside the sky blue padding
-                icon_size = 180  # Much larger size for clear visibility
-                icon_x = 70  # 70px from left edge (just inside sky blue padding)
-                icon_y = video_height - 250  # 250px from bottom (above sky blue padding)
-
-                # Create spinning icon overlay
-                # The icon rotates continuously: 1 full rotation every 3 seconds (120 degrees/second)
-                # Priority: Use channel logo from assets folder, fallback to generated icon
-                channel_logo_path = output_path.parent / 'assets' / 'channel_logo.png'
-
-                if channel_logo_path.exists():
-                    # Use custom channel logo and resize it (always regenerate to apply new size)
-                    icon_path = output_path / f'resized_channel_logo_{icon_size}.png'
-                    from PIL import Image
-                    logo = Image.open(channel_logo_path)
-                    # Resize to icon_size while maintaining aspect ratio
-                    logo.thumbnail((icon_size, icon_size), Image.Resampling.LANCZOS)
-                    logo.save(str(icon_path))
-                else:
-                    # Fallback: Create default business icon
-                    icon_path = output_path / 'business_icon.png'
-                    if not icon_path.exists():
-                        from PIL import Image, ImageDraw, ImageFont
-                        img = Image.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-                        draw = ImageDraw.Draw(img)
-                        circle_color = (135, 206, 235, 255)  # Sky blue
-                        margin = icon_size // 10
-                        draw.ellipse([margin, margin, icon_size-margin, icon_size-margin], fill=circle_color)
-                        try:
-                            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", icon_size//2)
-                        except:
-                            font = ImageFont.load_default()
-                        text = "$"
-                        bbox = draw.textbbox((0, 0), text, font=font)
-                        text_width = bbox[2] - bbox[0]
-                        text_height = bbox[3] - bbox[1]
-                        text_x = (icon_size - text_width) // 2
-                        text_y = (icon_size - text_height) // 2 - 5
-                        draw.text((text_x, text_y), text, fill='white', font=font)
-                        img.save(str(icon_path))
-
-                # Add spinning icon overlay for lively effect
-                # Using FFmpeg's rotate filter with time-based angle
-                icon_input = ffmpeg.input(str(icon_path), loop=1)
-                # Rotate icon: 360 degrees every 3 seconds = 2*PI radians every 3 seconds
-                rotated_icon = icon_input.filter('rotate', 't*2*PI/3', fillcolor='none')
-                video_with_subs = ffmpeg.overlay(
-                    video_with_subs,
-                    rotated_icon,
-                    x=icon_x,
-                    y=icon_y,
-                    shortest=1
-                )
+        Returns:
+            Clip duration in seconds: exact whole frames from the PCM narration
+            timeline when available, else the sped-up narration length
+        """
+        if 'clip_duration' in segment:
+            return segment['clip_duration']
+        # When audio is sped up by 1.2x, actual duration is original_duration / 1.2
+        return segment['audio_duration'] / self.AUDIO_SPEED_FACTOR
 
-                # Add background music if enabled
-                if self.config.enable_background_music:
-                    self.logger.info("adding_background_music")
-
-                    # Generate background music
-                    from .background_music_generator import BackgroundMusicGenerator
-                    bgm_generator = BackgroundMusicGenerator(self.config, self.logger)
-
-                    # total_audio_duration already calculated above for icon overlay
-                    
-                    try:
-                        bgm_path = bgm_generator.generate_background_music(
-                            duration=total_audio_duration,
-                            output_dir=output_dir
-                        )
-                        
-                        self.logger.info(
-                            "background_music_generated",
-                            bgm_path=bgm_path,
-                            duration=total_audio_duration,
-                            file_exists=Path(bgm_path).exists() if bgm_path else False
-                        )
-                        
-                        if not bgm_path or not Path(bgm_path).exists():
-                            self.logger.warning(
-                                "background_music_file_not_found",
-                                bgm_path=bgm_path,
-                                action="skipping_background_music"
-                            )
-                            # Fall through to no background music case
-                            raise FileNotFoundError(f"Background music file not found: {bgm_path}")
-
-                        # Mix voiceover with background music
-                        bgm_input = ffmpeg.input(bgm_path)
-                        
-                        # Apply volume to background music before mixing
-                        bgm_volume = bgm_input.filter('volume', self.config.background_music_volume)
-
-                        # Mix audio: voiceover (already has volume and speed applied) + background music at reduced volume
-                        # Use 'longest' so background music plays for full duration even if voiceover ends early (due to speed up)
-                        mixed_audio = ffmpeg.filter(
-                            [audio_speed, bgm_volume],
-                            'amix',
-                            inputs=2,
-                            duration='longest'  # Use longest to ensure background music plays full duration
-                        )
-
-                        output = ffmpeg.output(
-                            video_with_subs,
-                            mixed_audio,
-                            str(final_video),
-                            vcodec='libx264',
-                            acodec='aac',
-                            audio_bitrate='192k'
-                        )
-                    except (FileNotFoundError, VideoCompositionError, VideoGenerationError, Exception) as e:
-                        # If background music generation fails, log and fall back to voiceover only
-                        self.logger.warning(
-                            "background_music_failed_fallback",
-                            error=str(e),
-                            error_type=type(e).__name__,
-                            action="using_voiceover_only"
-                        )
-                        output = ffmpeg.output(
-                            video_with_subs,
-                            audio_speed,  # Use voiceover with volume and speed
-                            str(final_video),
-                            vcodec='libx264',
-                            acodec='aac',
-                            audio_bitrate='192k'
-                        )
-
-                    output = ffmpeg.output(
-                        video_with_subs,
-                        mixed_audio,
-                        str(final_video),
-                        vcodec='libx264',
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                else:
-                    # Use voiceover with volume and speed already applied (when no background music)
-                    output = ffmpeg.output(
-                        video_with_subs,
-                        audio_speed,  # Already has volume boost and speed applied
-                        str(final_video),
-                        vcodec='libx264',
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
+    def _get_voice_gains(self, audio_paths: list) -> list:
+        """
+        Get the gain of each narration segment.
 
-                ffmpeg.run(output, capture_stdout=True, capture_stderr=True, overwrite_output=True)
-            else:
-                # Just combine video and audio without subtitles
-                self.logger.info("combining_video_audio_no_subtitles")
-                final_video = output_path / f"final_shorts_{timestamp}.mp4"
-                final_video_str = self.combine_video_audio(concatenated_video, str(concatenated_audio), output_dir)
-                final_video = Path(final_video_str)
+        With loudness normalization every segment is brought to the voice
+        loudness target from its cached EBU R128 measurement (ElevenLabs output
+        levels vary between requests); otherwise the fixed voice boost is used.
 
-            # Verify output
-            if not final_video.exists():
-                raise VideoCompositionError("Final video was not created")
+        Args:
+            audio_paths: Narration files in timeline order
 
-            file_size = final_video.stat().st_size
-            if file_size == 0:
-                raise VideoCompositionError("Final video is empty")
+        Returns:
+            Linear gain per segment
+        """
+        if self.loudness_cache is None:
+            return [self.VOICE_VOLUME_BOOST] * len(audio_paths)
 
-            self.logger.info(
-                "slideshow_created",
-                final_video=str(final_video),
-                file_size_mb=round(file_size / (1024 * 1024), 2)
-            )
+        measurements = self.loudness_cache.measure_files(audio_paths)
+        gains = [
+            measurement.get_gain(self.config.voice_loudness_target)
+            for measurement in measurements
+        ]
+        self.logger.info(
+            "voice_loudness_gains",
+            integrated_lufs=[measurement.integrated_lufs for measurement in measurements],
+            gains_db=[round(20 * math.log10(gain), 2) for gain in gains]
+        )
+        return gains
 
-            # Clean up temporary files
-            for clip in video_clips:
-                Path(clip).unlink(missing_ok=True)
-            Path(concatenated_video).unlink(missing_ok=True)
-            Path(concatenated_audio).unlink(missing_ok=True)
-            if self.config.enable_subtitles:
-                Path(subtitle_file).unlink(missing_ok=True)
+    def _build_narration_timeline(
+        self,
+        segments_data: list,
+        output_path: Path,
+        timestamp: int
+    ) -> tuple:
+        """
+        Build the PCM narration timeline and time every clip from its sample counts.
 
-            return str(final_video)
+        Args:
+            segments_data: Segment data dictionaries
+            output_path: Output directory
+            timestamp: Timestamp used for file naming
 
-        except subprocess.CalledProcessError as e:
-            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
-            log_error(self.logger, e, "video_composer.create_slideshow_with_subtitles")
-            self.logger.error("ffmpeg_slideshow_error", error=stderr_output)
-            raise VideoCompositionError(f"Failed to create slideshow: {stderr_output}")
+        Returns:
+            Tuple of (AudioTimeline, segment copies with 'clip_duration' set)
+        """
+        audio_paths = [segment['audio_path'] for segment in segments_data]
+        narration = build_audio_timeline(
+            audio_paths,
+            output_path / f"narration_{timestamp}.wav",
+            speed_factor=self.AUDIO_SPEED_FACTOR,
+            gain=self._get_voice_gains(audio_paths),
+            logger=self.logger
+        )
 
-        except Exception as e:
-            log_error(self.logger, e, "video_composer.create_slideshow_with_subtitles")
-            raise VideoCompositionError(f"Slideshow creation failed: {str(e)}")
+        timed_segments = [
+            dict(segment, clip_duration=clip_duration)
+            for segment, clip_duration in zip(segments_data, narration.get_clip_durations(self.FPS))
+        ]
+        return narration, timed_segments
+
+    def _get_ken_burns_filter(self, index: int, clip_duration: float, width: int, height: int) -> str:
+        """
+        Build the Ken Burns (zoom + pan) filter for an image segment.
+
+        Args:
+            index: Segment index (selects the movement pattern)
+            clip_duration: Clip duration in seconds
+            width: Output width
+            height: Output height
+
+        Returns:
+            zoompan filter string
+        """
+        # Calculate total frames for zoompan filter
+        total_frames = int(clip_duration * self.FPS)
+
+        # Select pattern based on segment index to add variety across the video
+        return build_zoompan_filter(
+            get_movement_pattern(index), total_frames, width, height, self.FPS
+        )
+
+    def _get_image_title_filter(
+        self,
+        segment_title: str,
+        width: int,
+        layout_scale: float = 1.0,
+        enable: Optional[str] = None
+    ) -> str:
+        """
+        Build the title overlay filter used on image (Ken Burns) clips.
+
+        Args:
+            segment_title: Title to overlay
+            width: Output width
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+            enable: Timeline expression limiting when the title is shown (None for always)
+
+        Returns:
+            drawbox/drawtext filter chain
+        """
+        # Enhanced title overlay with gradient background and glow effect
+        font_path = self._get_title_font("image")
+        px = lambda value: self._px(value, layout_scale)
+        font_size = px(self.TITLE_FONT_SIZE)
+
+        # Escape special characters in title text for ffmpeg
+        # Colons need to be escaped as they're used as parameter separators in filters
+        escaped_title = segment_title.replace("'", "'\\''").replace(":", "\\:")
+
+        # Enhanced title for mobile visibility: larger font (80), extra tall box (440), extreme top padding
+        # Extreme top padding: text starts at ~220px from top for absolute maximum mobile visibility
+        return self._join_title_filters([
+            # Sky blue padding at top (solid color, no opacity)
+            f"drawbox=y=0:color=0x87CEEB:width={width}:height={px(40)}:t=fill",
+            # Grayish-black background bar (solid, not pure black)
+            f"drawbox=y={px(40)}:color=0x3a3a3a:width={width}:height={px(360)}:t=fill",
+            # Sky blue padding at bottom of title area (solid color, no opacity)
+            f"drawbox=y={px(400)}:color=0x87CEEB:width={width}:height={px(40)}:t=fill",
+            # Outer glow effect (multiple layers for smooth glow)
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=yellow@0.3:x=(w-text_w)/2:y={px(218)}:borderw=0",
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=yellow@0.2:x=(w-text_w)/2:y={px(216)}:borderw=0",
+            # Main text with bold outline for readability
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=white:x=(w-text_w)/2:y={px(222)}:borderw={px(5)}:bordercolor=black@0.9",
+            # Inner highlight layer
+            f"drawtext=text='{escaped_title}':fontfile={font_path}:"
+            f"fontsize={font_size}:fontcolor=white:x=(w-text_w)/2:y={px(220)}",
+        ], enable)
+
+    def _get_frame_filter(self, width: int, height: int, layout_scale: float = 1.0) -> str:
+        """
+        Build the sky blue frame drawn on all four edges of the final video.
+
+        Args:
+            width: Video width
+            height: Video height
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+
+        Returns:
+            drawbox filter chain
+        """
+        # Solid color (no opacity) for clearer visibility
+        padding = self._px(self.FRAME_PADDING, layout_scale)
+        return (
+            # Top padding bar
+            f"drawbox=x=0:y=0:w=iw:h={padding}:color=0x87CEEB:t=fill,"
+            # Bottom padding bar
+            f"drawbox=x=0:y={height - padding}:w=iw:h={padding}:color=0x87CEEB:t=fill,"
+            # Left padding bar
+            f"drawbox=x=0:y=0:w={padding}:h=ih:color=0x87CEEB:t=fill,"
+            # Right padding bar
+            f"drawbox=x={width - padding}:y=0:w={padding}:h=ih:color=0x87CEEB:t=fill"
+        )
+
+    def _escape_filter_path(self, path) -> str:
+        """
+        Escape a file path for use as a filter argument inside a filter graph.
+
+        Args:
+            path: File path
+
+        Returns:
+            Escaped absolute path
+        """
+        abs_path = str(Path(path).resolve())
+        return abs_path.replace('\\', '/').replace("'", "\\'").replace(':', '\\:')
+
+    def _write_ass_subtitles(
+        self,
+        segments_data: list,
+        subtitle_file: Path,
+        aspect_ratio: str = "9:16"
+    ) -> None:
+        """
+        Write the ASS subtitle file for all segments.
+
+        Subtitle timing is adjusted to match the sped-up narration.
+
+        Args:
+            segments_data: Segment data dictionaries
+            subtitle_file: Path of the ASS file to write
+            aspect_ratio: Aspect ratio of the video the subtitles are burned into
+        """
+        # The style is designed for a 1080x1920 canvas; other aspects keep its
+        # proportions (libass scales PlayRes coordinates to the actual video size)
+        play_res_x, play_res_y = self.OUTPUT_SIZES.get(aspect_ratio, self.OUTPUT_SIZES["9:16"])
+        layout_scale = self._get_layout_scale(aspect_ratio)
+        ass_px = lambda value: max(1, round(value * layout_scale))
+
+        # Get font name for ASS file
+        # Use rounded, cute Korean fonts for friendly appearance
+        # (Linux (Ubuntu): install with apt-get install fonts-nanum)
+        font_name = "NanumSquare"  # Rounded, friendly font
+
+        with open(subtitle_file, 'w', encoding='utf-8') as f:
+            # Write ASS header with style definition
+            f.write("[Script Info]\n")
+            f.write("ScriptType: v4.00+\n")
+            f.write(f"PlayResX: {play_res_x}\n")
+            f.write(f"PlayResY: {play_res_y}\n")
+            f.write("WrapStyle: 1\n\n")
+
+            f.write("[V4+ Styles]\n")
+            f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
+            # PrimaryColour=white text, OutlineColour=very dark gray outline, BackColour=very dark gray background box
+            # Spacing=5 adds character spacing for better readability
+            f.write(
+                f"Style: Default,{font_name},{ass_px(self.config.subtitle_font_size)},&H00FFFFFF,&H000000FF,&H00282828,&H00282828,"
+                f"0,0,0,0,100,100,{ass_px(5)},0,3,{ass_px(6)},{ass_px(2)},2,{ass_px(60)},{ass_px(60)},{ass_px(820)},1\n\n"
+            )
+
+            f.write("[Events]\n")
+            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
+
+            current_time = 0.0
+
+            for segment in segments_data:
+                # Convert TTS-optimized text to subtitle format (numbers as symbols)
+                subtitle_text = self._convert_tts_to_subtitle_format(segment['text'])
+
+                # Split text into words (Korean uses spaces between phrases/clauses)
+                words = subtitle_text.split()
+                total_words = len(words)
+
+                if total_words == 0:
+                    continue
+
+                # Calculate duration per word (adjusted for audio speed)
+                segment_duration = self._get_clip_duration(segment)
+                time_per_word = segment_duration / total_words
+
+                # Group words into chunks for 2-line subtitles
+                # Show 3-4 words total, split into 2 lines (1-2 words per line)
+                # This makes subtitles more compact and prevents long lines
+                total_words_per_subtitle = 4  # Total words for 2 lines (2 lines × 2 words)
+
+                for i in range(0, total_words, total_words_per_subtitle):
+                    # Get words for this subtitle (up to total_words_per_subtitle)
+                    word_chunk = words[i:i + total_words_per_subtitle]
+                    chunk_word_count = len(word_chunk)
+
+                    if chunk_word_count == 0:
+                        continue
+
+                    # Split words into two groups to ensure we never break Korean words
+                    # Korean doesn't use spaces between characters, so we split at word boundaries (spaces)
+                    # Try to balance line lengths while keeping words intact
+                    mid_point = (chunk_word_count + 1) // 2  # Start with roughly half by word count
+                    line1_words = word_chunk[:mid_point]
+                    line2_words = word_chunk[mid_point:]
+
+                    # Join words with spaces - this ensures Korean words stay intact
+                    line1_text = ' '.join(line1_words)
+                    line2_text = ' '.join(line2_words)
+
+                    # Adjust split point if first line is too long (Korean: ~10-12 chars per line for compact display)
+                    # This prevents ffmpeg from breaking long lines and splitting Korean characters
+                    # Shorter lines = less space taken up in video
+                    max_chars_per_line = 12  # Maximum characters per line for Korean subtitles (compact)
+
+                    if len(line1_text) > max_chars_per_line and mid_point > 1:
+                        # First line too long, move words to second line
+                        while len(line1_text) > max_chars_per_line and len(line1_words) > 1:
+                            line2_words.insert(0, line1_words.pop())
+                            line1_text = ' '.join(line1_words)
+                            line2_text = ' '.join(line2_words)
+
+                    # Only create 2-line subtitle if we have words for both lines
+                    # This prevents splitting single words across lines
+                    if line2_text and len(line1_words) > 0 and len(line2_words) > 0:
+                        chunk_text = f"{line1_text}\n{line2_text}"
+                    else:
+                        # If split would result in empty second line or only one word, keep on one line
+                        chunk_text = ' '.join(word_chunk)
+
+                    # Calculate timing for this subtitle chunk
+                    # Subtitles sync exactly with narrative voice timing
+                    start_time = current_time
+                    end_time = current_time + (time_per_word * chunk_word_count)
+
+                    # Convert newlines to ASS format (\N instead of \n)
+                    ass_text = chunk_text.replace('\n', '\\N')
+
+                    # Add padding around text using hard spaces (\h in ASS format)
+                    # This creates visual padding inside the background box
+                    ass_text = f"\\h\\h{ass_text}\\h\\h"
+
+                    # ASS format: Dialogue: Layer,Start,End,Style,Name,MarginL,MarginR,MarginV,Effect,Text
+                    f.write(f"Dialogue: 0,{self._format_ass_time(start_time)},{self._format_ass_time(end_time)},Default,,0,0,0,,{ass_text}\n")
+
+                    current_time = end_time
+
+    def _prepare_channel_icon(self, layout_scale: float = 1.0) -> list:
+        """
+        Prepare the spinning channel icon overlaid in the bottom left corner.
+
+        Uses the channel logo from the assets folder (fallback: generated
+        business icon), pre-rendered as one full turn and cached by logo
+        content and size.
+
+        Args:
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+
+        Returns:
+            ffmpeg input arguments looping the icon clip forever
+        """
+        icon_size = self._px(self.ICON_SIZE, layout_scale)
+        sprite_path = self.logo_sprite_cache.get(icon_size)
+        return ['-stream_loop', '-1', '-i', str(sprite_path)]
+
+    def _prepare_background_music(self, duration: float) -> Optional[str]:
+        """
+        Get the background music bed for the final mix.
+
+        The bed is cached, already at the mix volume and at least duration
+        seconds long; the mix filters trim it and fade it out.
+
+        Args:
+            duration: Required music duration in seconds
+
+        Returns:
+            Path to the music bed, or None to use the voiceover only
+        """
+        self.logger.info("adding_background_music")
+
+        from .background_music_generator import BackgroundMusicGenerator
+        bgm_generator = BackgroundMusicGenerator(self.config, self.logger)
+
+        try:
+            bgm_path = bgm_generator.generate_background_music(duration=duration)
+
+            self.logger.info(
+                "background_music_generated",
+                bgm_path=bgm_path,
+                duration=duration,
+                file_exists=Path(bgm_path).exists() if bgm_path else False
+            )
+
+            if not bgm_path or not Path(bgm_path).exists():
+                self.logger.warning(
+                    "background_music_file_not_found",
+                    bgm_path=bgm_path,
+                    action="skipping_background_music"
+                )
+                return None
+
+            return bgm_path
+
+        except Exception as e:
+            # If background music generation fails, log and fall back to voiceover only
+            self.logger.warning(
+                "background_music_failed_fallback",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="using_voiceover_only"
+            )
+            return None
+
+    def _build_finishing_filters(
+        self,
+        video_label: str,
+        voice_label: str,
+        icon_label: str,
+        bgm_label: Optional[str],
+        subtitle_file: Optional[Path],
+        width: int,
+        height: int,
+        voice_prepared: bool = False,
+        duration: float = 0.0
+    ) -> list:
+        """
+        Build the finishing part of the filter graph shared by all render modes:
+        ASS burn-in, sky blue frame, spinning channel icon and the audio mix.
+
+        Args:
+            video_label: Label of the concatenated video stream
+            voice_label: Label of the concatenated narration stream
+            icon_label: Label of the looped channel icon stream
+            bgm_label: Label of the background music stream (None for voiceover only)
+            subtitle_file: ASS subtitle file (None to skip subtitles)
+            width: Video width
+            height: Video height
+            voice_prepared: Narration is a PCM timeline already sped up and gained
+            duration: Video duration in seconds (the background music is trimmed to it)
+
+        Returns:
+            List of filter chains producing [vout] and [aout]
+        """
+        return self._build_video_finishing_filters(
+            video_label, icon_label, subtitle_file, width, height
+        ) + self._build_audio_mix_filters(voice_label, bgm_label, voice_prepared=voice_prepared, duration=duration)
+
+    def _build_video_finishing_filters(
+        self,
+        video_label: str,
+        icon_label: str,
+        subtitle_file: Optional[Path],
+        width: int,
+        height: int,
+        output_label: str = "vout",
+        layout_scale: float = 1.0
+    ) -> list:
+        """
+        Build the video finishing chain: ASS burn-in, sky blue frame and spinning channel icon.
+
+        Args:
+            video_label: Label of the concatenated video stream
+            icon_label: Label of the looped spinning icon stream
+            subtitle_file: ASS subtitle file (None to skip subtitles)
+            width: Video width
+            height: Video height
+            output_label: Label of the finished video stream
+            layout_scale: Extra layout scale of the output variant (1.0 for 9:16)
+
+        Returns:
+            List of filter chains producing [output_label]
+        """
+        video_filters = []
+
+        # Use subtitles filter to burn in ASS subtitles
+        # Styling is embedded in the ASS file itself
+        if subtitle_file is not None:
+            video_filters.append(f"subtitles={self._escape_filter_path(subtitle_file)}")
+
+        # Add sky blue padding bars on all four edges to create a frame effect
+        video_filters.append(self._get_frame_filter(width, height, layout_scale))
+
+        # Add spinning business icon in bottom left corner for lively effect
+        # Position: Bottom left corner, just inside the sky blue padding
+        icon_x = self._px(70, layout_scale)  # 70px from left edge (just inside sky blue padding)
+        icon_y = height - self._px(250, layout_scale)  # 250px from bottom (above sky blue padding)
+
+        return [
+            f"[{video_label}]{','.join(video_filters)}[framed_{output_label}]",
+            # The icon input is a pre-rendered turn (360 degrees every 3 seconds) looped forever
+            f"[framed_{output_label}][{icon_label}]overlay=x={icon_x}:y={icon_y}:shortest=1[{output_label}]",
+        ]
+
+    def _build_audio_mix_filters(
+        self,
+        voice_label: str,
+        bgm_label: Optional[str],
+        output_label: str = "aout",
+        voice_prepared: bool = False,
+        duration: float = 0.0
+    ) -> list:
+        """
+        Build the audio chain: sped-up, boosted narration mixed with the background music.
+
+        Args:
+            voice_label: Label of the concatenated narration stream
+            bgm_label: Label of the background music stream (None for voiceover only)
+            output_label: Label of the mixed audio stream
+            voice_prepared: Narration is a PCM timeline already sped up and gained
+            duration: Video duration in seconds (the background music and the mix are trimmed to it)
+
+        Returns:
+            List of filter chains producing [output_label]
+        """
+        if voice_prepared:
+            # Speed and gain were applied once when the narration timeline was built
+            voice_chain = f"[{voice_label}]anull"
+        else:
+            # Apply speed and volume to audio (before mixing with background music or output)
+            voice_chain = f"[{voice_label}]volume={self.VOICE_VOLUME_BOOST},atempo={self.AUDIO_SPEED_FACTOR}"
+
+        if not bgm_label:
+            return [f"{voice_chain}[{output_label}]"]
+
+        # Mix audio: voiceover (volume and speed applied) + background music bed (already at reduced volume)
+        # Use 'longest' so background music plays for full duration even if voiceover ends early (due to speed up)
+        # The cached bed is longer than the video: trim it and fade out over the last 2 seconds
+        # Loudness-normalized inputs are summed as is (amix would otherwise halve both)
+        # The mix is capped at the video duration so narration running long cannot outlast the picture
+        amix_options = ":normalize=0" if voice_prepared and self.loudness_cache is not None else ""
+        return [
+            f"{voice_chain}[voice]",
+            f"[{bgm_label}]atrim=duration={duration:.3f},afade=t=out:st={max(duration - 2, 0):.3f}:d=2[bgm]",
+            f"[voice][bgm]amix=inputs=2:duration=longest{amix_options},atrim=duration={duration:.3f}[{output_label}]",
+        ]
+
+    def _get_final_output_args(
+        self,
+        output_file: Path,
+        video_label: str = "vout",
+        audio_label: str = "aout"
+    ) -> list:
+        """
+        Get the encoder arguments for the final Shorts output.
+
+        Args:
+            output_file: Path of the final video
+            video_label: Filter graph label of the video stream
+            audio_label: Filter graph label of the audio stream
+
+        Returns:
+            List of ffmpeg output arguments
+        """
+        return [
+            '-map', f'[{video_label}]',
+            '-map', f'[{audio_label}]',
+        ] + self.encoding.video_args() + [
+            '-pix_fmt', 'yuv420p',
+            '-c:a', 'aac',
+            '-b:a', self.encoding.audio_bitrate,
+        ] + self.encoding.thread_args() + [
+            '-movflags', '+faststart',
+            str(output_file)
+        ]
+
+    def _render_single_pass(
+        self,
+        segments_data: list,
+        output_path: Path,
+        timestamp: int,
+        subtitle_file: Optional[Path],
+        narration: Optional[AudioTimeline] = None
+    ) -> Path:
+        """
+        Render the whole Short with one ffmpeg filter graph and a single encode.
+
+        Every image/video input gets its Ken Burns or trim and title overlay,
+        then the clips are concatenated and finished (subtitles, frame, icon,
+        audio mix) in the same graph, so the video is encoded exactly once.
+
+        Args:
+            segments_data: Segment data dictionaries
+            output_path: Output directory
+            timestamp: Timestamp used for file naming
+            subtitle_file: ASS subtitle file (None to skip subtitles)
+            narration: PCM narration timeline (None to concatenate the segment audio files)
+
+        Returns:
+            Path to the final video
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        width, height = self._get_output_size()
+        fps = self.FPS
+        num_segments = len(segments_data)
+
+        input_args = []
+        filters = []
+        media_chains = []
+
+        # Media inputs (0 .. N-1) with per-segment Ken Burns or trim
+        for i, segment in enumerate(segments_data):
+            clip_duration = self._get_clip_duration(segment)
+            media_path = segment['image_path']
+            segment_title = self._prepare_segment_title(segment)
+
+            if self._is_video_file(media_path):
+                source_path, conformed = self._get_video_source(media_path)
+                video_duration = self.get_video_duration(source_path)
+                if video_duration < clip_duration:
+                    # Video is shorter → loop it
+                    num_loops = int(clip_duration / video_duration) + 1
+                    input_args += ['-stream_loop', str(num_loops)]
+                input_args += ['-i', source_path]
+                conform_filter = "" if conformed else (
+                    f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},"
+                )
+                media_filter = (
+                    f"{conform_filter}"
+                    f"fps={fps},"
+                    f"trim=duration={clip_duration},"
+                    f"setpts=PTS-STARTPTS"
+                )
+                layout = "video"
+            else:
+                # A single decoded still is enough: zoompan emits every output frame from it
+                input_args += ['-i', media_path]
+                media_filter = (
+                    f"{self._get_ken_burns_filter(i, clip_duration, width, height)},"
+                    f"trim=duration={clip_duration},"
+                    f"setpts=PTS-STARTPTS"
+                )
+                layout = "image"
+
+            media_chains.append((media_filter, segment_title, layout))
+
+        # Narration inputs: the PCM timeline (N), or one file per segment (N .. 2N-1)
+        narration_paths = [narration.path] if narration else [seg['audio_path'] for seg in segments_data]
+        for audio_path in narration_paths:
+            input_args += ['-i', str(Path(audio_path).resolve())]
+
+        # Channel icon input (after the narration)
+        input_args += self._prepare_channel_icon()
+        icon_index = num_segments + len(narration_paths)
+
+        # Background music input (after the icon)
+        total_duration = sum(self._get_clip_duration(seg) for seg in segments_data)
+        bgm_label = None
+        if self.config.enable_background_music:
+            bgm_path = self._prepare_background_music(total_duration)
+            if bgm_path:
+                input_args += ['-i', bgm_path]
+                bgm_label = f"{icon_index + 1}:a"
+
+        # Title overlays: cached PNG inputs after the audio, or drawtext chains
+        next_input = icon_index + (2 if bgm_label else 1)
+        for i, (media_filter, segment_title, layout) in enumerate(media_chains):
+            overlay_path = self._get_title_overlay(segment_title, width, layout)
+            if overlay_path is None:
+                title_filter = self._get_title_filter(segment_title, width, layout)
+                filters.append(f"[{i}:v]{media_filter},{title_filter},setsar=1,format=yuv420p[v{i}]")
+            else:
+                input_args += ['-i', str(overlay_path)]
+                filters.append(f"[{i}:v]{media_filter}[base{i}]")
+                filters.append(f"[base{i}][{next_input}:v]overlay=0:0,setsar=1,format=yuv420p[v{i}]")
+                next_input += 1
+
+        video_labels = ''.join(f"[v{i}]" for i in range(num_segments))
+        filters.append(f"{video_labels}concat=n={num_segments}:v=1:a=0[vcat]")
+
+        if narration is None:
+            audio_labels = ''.join(f"[{num_segments + i}:a]" for i in range(num_segments))
+            filters.append(f"{audio_labels}concat=n={num_segments}:v=0:a=1[narration]")
+
+        filters += self._build_finishing_filters(
+            video_label="vcat",
+            voice_label="narration" if narration is None else f"{num_segments}:a",
+            icon_label=f"{icon_index}:v",
+            bgm_label=bgm_label,
+            subtitle_file=subtitle_file,
+            width=width,
+            height=height,
+            voice_prepared=narration is not None,
+            duration=total_duration
+        )
+
+        final_video = output_path / f"final_shorts_{timestamp}.mp4"
+
+        self.logger.info(
+            "rendering_single_pass",
+            num_segments=num_segments,
+            with_background_music=bgm_label is not None,
+            output_path=str(final_video)
+        )
+
+        run_ffmpeg(
+            ['ffmpeg', '-y']
+            + input_args
+            + ['-filter_complex', ';'.join(filters), '-r', str(fps)]
+            + self._get_final_output_args(final_video),
+            logger=self.logger,
+            step="single_pass",
+            expected_duration=total_duration
+        )
+
+        return final_video
+
+    def _render_variants(
+        self,
+        segments_data: list,
+        output_path: Path,
+        timestamp: int,
+        aspect_ratios: list,
+        subtitle_files: dict,
+        narration: Optional[AudioTimeline] = None
+    ) -> dict:
+        """
+        Render several aspect ratio variants of the Short with one ffmpeg process.
+
+        Every input is decoded and conformed once onto a master canvas large
+        enough for all variants. After concatenation the master is split, and
+        each branch is cropped and scaled to its aspect ratio and gets its own
+        layout (titles, subtitles, frame, icon) sized for that canvas. Audio is
+        mixed once and split. All variants are encoded by the same process.
+
+        Args:
+            segments_data: Segment data dictionaries
+            output_path: Output directory
+            timestamp: Timestamp used for file naming
+            aspect_ratios: Aspect ratios to render (e.g. ["9:16", "16:9", "1:1"])
+            subtitle_files: ASS subtitle file of each aspect ratio (missing to skip subtitles)
+            narration: PCM narration timeline (None to concatenate the segment audio files)
+
+        Returns:
+            Dict mapping each aspect ratio to its final video path
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        fps = self.FPS
+        num_segments = len(segments_data)
+        num_variants = len(aspect_ratios)
+
+        sizes = {aspect_ratio: self._get_output_size(aspect_ratio) for aspect_ratio in aspect_ratios}
+        master_width = max(width for width, _ in sizes.values())
+        master_height = max(height for _, height in sizes.values())
+
+        input_args = []
+        filters = []
+        titles = []
+
+        # Media inputs (0 .. N-1) conformed to the master canvas, without titles
+        clip_start = 0.0
+        for i, segment in enumerate(segments_data):
+            clip_duration = self._get_clip_duration(segment)
+            media_path = segment['image_path']
+
+            if self._is_video_file(media_path):
+                # Proxies are conformed to a single output size, so the original is used here
+                video_duration = self.get_video_duration(media_path)
+                if video_duration < clip_duration:
+                    # Video is shorter → loop it
+                    num_loops = int(clip_duration / video_duration) + 1
+                    input_args += ['-stream_loop', str(num_loops)]
+                input_args += ['-i', media_path]
+                media_filter = (
+                    f"scale={master_width}:{master_height}:force_original_aspect_ratio=increase,"
+                    f"crop={master_width}:{master_height},"
+                    f"fps={fps}"
+                )
+                layout = "video"
+            else:
+                input_args += ['-i', media_path]
+                media_filter = self._get_ken_burns_filter(i, clip_duration, master_width, master_height)
+                layout = "image"
+
+            filters.append(
+                f"[{i}:v]{media_filter},trim=duration={clip_duration},setpts=PTS-STARTPTS,"
+                f"setsar=1,format=yuv420p[v{i}]"
+            )
+
+            # Titles are drawn per variant on the concatenated timeline
+            enable = f"gte(t,{clip_start:.3f})*lt(t,{clip_start + clip_duration:.3f})"
+            titles.append((self._prepare_segment_title(segment), layout, enable))
+            clip_start += clip_duration
+
+        # Narration inputs: the PCM timeline (N), or one file per segment (N .. 2N-1)
+        narration_paths = [narration.path] if narration else [seg['audio_path'] for seg in segments_data]
+        for audio_path in narration_paths:
+            input_args += ['-i', str(Path(audio_path).resolve())]
+
+        # Channel icon inputs (one per variant, sized for it)
+        icon_index = num_segments + len(narration_paths)
+        for aspect_ratio in aspect_ratios:
+            input_args += self._prepare_channel_icon(self._get_layout_scale(aspect_ratio))
+
+        # Background music input (after the icons)
+        total_duration = clip_start
+        bgm_label = None
+        if self.config.enable_background_music:
+            bgm_path = self._prepare_background_music(total_duration)
+            if bgm_path:
+                input_args += ['-i', bgm_path]
+                bgm_label = f"{icon_index + num_variants}:a"
+
+        video_labels = ''.join(f"[v{i}]" for i in range(num_segments))
+        filters.append(f"{video_labels}concat=n={num_segments}:v=1:a=0[vcat]")
+        split_labels = ''.join(f"[master{k}]" for k in range(num_variants))
+        filters.append(f"[vcat]split={num_variants}{split_labels}")
+
+        if narration is None:
+            audio_labels = ''.join(f"[{num_segments + i}:a]" for i in range(num_segments))
+            filters.append(f"{audio_labels}concat=n={num_segments}:v=0:a=1[narration]")
+        filters += self._build_audio_mix_filters(
+            "narration" if narration is None else f"{num_segments}:a",
+            bgm_label,
+            "amix",
+            voice_prepared=narration is not None,
+            duration=total_duration
+        )
+        audio_split_labels = ''.join(f"[aout{k}]" for k in range(num_variants))
+        filters.append(f"[amix]asplit={num_variants}{audio_split_labels}")
+
+        next_input = icon_index + num_variants + (1 if bgm_label else 0)
+        output_args = []
+        final_videos = {}
+
+        for k, aspect_ratio in enumerate(aspect_ratios):
+            width, height = sizes[aspect_ratio]
+            layout_scale = self._get_layout_scale(aspect_ratio)
+
+            # Largest centered crop of the master with the variant's aspect ratio
+            crop_width = min(master_width, int(master_height * width / height)) // 2 * 2
+            crop_height = min(master_height, int(crop_width * height / width)) // 2 * 2
+            filters.append(
+                f"[master{k}]crop={crop_width}:{crop_height},scale={width}:{height},setsar=1[crop{k}]"
+            )
+
+            # Title overlays: cached PNG inputs enabled per segment, or drawtext chains
+            title_label = f"crop{k}"
+            for i, (segment_title, layout, enable) in enumerate(titles):
+                overlay_path = self._get_title_overlay(segment_title, width, layout, layout_scale)
+                if overlay_path is None:
+                    title_filter = self._get_title_filter(segment_title, width, layout, layout_scale, enable)
+                    filters.append(f"[{title_label}]{title_filter}[titled{k}_{i}]")
+                else:
+                    input_args += ['-i', str(overlay_path)]
+                    filters.append(
+                        f"[{title_label}][{next_input}:v]overlay=0:0:enable='{enable}'[titled{k}_{i}]"
+                    )
+                    next_input += 1
+                title_label = f"titled{k}_{i}"
+
+            filters += self._build_video_finishing_filters(
+                video_label=title_label,
+                icon_label=f"{icon_index + k}:v",
+                subtitle_file=subtitle_files.get(aspect_ratio),
+                width=width,
+                height=height,
+                output_label=f"vout{k}",
+                layout_scale=layout_scale
+            )
+
+            final_video = output_path / f"final_shorts_{timestamp}_{aspect_ratio.replace(':', 'x')}.mp4"
+            output_args += ['-r', str(fps)] + self._get_final_output_args(
+                final_video, video_label=f"vout{k}", audio_label=f"aout{k}"
+            )
+            final_videos[aspect_ratio] = final_video
+
+        self.logger.info(
+            "rendering_variants",
+            num_segments=num_segments,
+            aspect_ratios=aspect_ratios,
+            master_size=f"{master_width}x{master_height}",
+            with_background_music=bgm_label is not None
+        )
+
+        run_ffmpeg(
+            ['ffmpeg', '-y']
+            + input_args
+            + ['-filter_complex', ';'.join(filters)]
+            + output_args,
+            logger=self.logger,
+            step="variants",
+            expected_duration=total_duration
+        )
+
+        return final_videos
+
+    def create_slideshow_with_subtitles(
+        self,
+        segments_data: list,
+        output_dir: str = "output",
+        render_mode: Optional[str] = None,
+        prerendered_clips: Optional[dict] = None
+    ) -> str:
+        """
+        Create a slideshow video from images/videos with synchronized audio and subtitles.
+
+        Two render modes are supported (Config.render_mode):
+            - multi_pass: encode each clip, concatenate, then run a final finishing pass
+            - single_pass: build one filter graph for the whole timeline and encode once
+
+        With the clip cache enabled, a render manifest is saved next to the final
+        video (see get_manifest_path) and multi_pass reuses previously encoded
+        clips whose inputs are unchanged.
+
+        Args:
+            segments_data: List of dictionaries containing:
+                - image_path: Path to the image/video file
+                - audio_path: Path to the audio file
+                - audio_duration: Duration of the audio
+                - text: Subtitle text for this segment
+                - segment_number: Segment number
+            output_dir: Directory to save the final video
+            render_mode: Render mode override (defaults to Config.render_mode)
+            prerendered_clips: multi_pass clips rendered ahead of time by position,
+                (clip_duration, clip path) (see start_clip_session)
+
+        Returns:
+            Path to the final slideshow video
+
+        Raises:
+            VideoCompositionError: If creation fails
+        """
+        if not segments_data:
+            raise VideoCompositionError("No segments provided for slideshow")
+
+        render_mode = render_mode or self.config.render_mode
+
+        self.logger.info(
+            "creating_slideshow_with_subtitles",
+            num_segments=len(segments_data),
+            render_mode=render_mode
+        )
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        import time
+        timestamp = int(time.time())
+
+        # Temporary files removed once the final video is verified
+        temp_files = []
+
+        try:
+            # Decode the narration once to PCM; clip lengths follow its exact sample counts
+            narration = None
+            if self.config.audio_assembly == "pcm":
+                narration, segments_data = self._build_narration_timeline(segments_data, output_path, timestamp)
+                temp_files.append(narration.path)
+
+            # Create subtitle file (ASS format) with proper styling
+            subtitle_file = None
+            if self.config.enable_subtitles:
+                self.logger.info("creating_subtitle_file", speed_factor=self.AUDIO_SPEED_FACTOR)
+                subtitle_file = output_path / f"subtitles_{timestamp}.ass"
+                self._write_ass_subtitles(segments_data, subtitle_file)
+                temp_files.append(subtitle_file)
+
+            if self.probe_cache is not None:
+                # Probe every pre-defined video up front in one batch (cached across runs)
+                self._probe_many([
+                    seg['image_path'] for seg in segments_data if self._is_video_file(seg['image_path'])
+                ])
+
+            manifest = None
+            if self.clip_cache is not None:
+                manifest = self._build_render_manifest(segments_data, output_path)
+
+            if render_mode == "single_pass":
+                final_video = self._render_single_pass(
+                    segments_data, output_path, timestamp, subtitle_file, narration
+                )
+            else:
+                final_video = self._render_multi_pass(
+                    segments_data, output_path, timestamp, subtitle_file, temp_files,
+                    clip_hashes=[segment['clip_hash'] for segment in manifest.segments] if manifest else None,
+                    narration=narration,
+                    prerendered_clips=prerendered_clips
+                )
+
+            # Verify output
+            if not final_video.exists():
+                raise VideoCompositionError("Final video was not created")
+
+            file_size = final_video.stat().st_size
+            if file_size == 0:
+                raise VideoCompositionError("Final video is empty")
+
+            self.logger.info(
+                "slideshow_created",
+                final_video=str(final_video),
+                file_size_mb=round(file_size / (1024 * 1024), 2)
+            )
+
+            if manifest is not None:
+                manifest.save(self.get_manifest_path(final_video))
+
+            # Clean up temporary files
+            for temp_file in temp_files:
+                Path(temp_file).unlink(missing_ok=True)
+
+            return str(final_video)
+
+        except subprocess.CalledProcessError as e:
+            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
+            log_error(self.logger, e, "video_composer.create_slideshow_with_subtitles")
+            self.logger.error("ffmpeg_slideshow_error", error=stderr_output)
+            raise VideoCompositionError(f"Failed to create slideshow: {stderr_output}")
+
+        except Exception as e:
+            log_error(self.logger, e, "video_composer.create_slideshow_with_subtitles")
+            raise VideoCompositionError(f"Slideshow creation failed: {str(e)}")
+
+    def start_clip_session(self, num_segments: int, output_dir: str = "output") -> ClipRenderSession:
+        """
+        Start rendering multi_pass clips while the segments are still being generated.
+
+        Args:
+            num_segments: Number of segments of the video
+            output_dir: Directory for the clips and the final video
+
+        Returns:
+            ClipRenderSession (feed it with add_audio/add_media, then call finish)
+        """
+        return ClipRenderSession(self, num_segments, output_dir, logger=self.logger)
+
+    def get_manifest_path(self, video_path: str) -> Path:
+        """
+        Get where the render manifest of a final video is saved.
+
+        Args:
+            video_path: Path to the final video
+
+        Returns:
+            Path of the manifest JSON next to the video
+        """
+        return Path(video_path).with_suffix(".manifest.json")
+
+    def _get_clip_settings(self, width: int, height: int) -> dict:
+        """
+        Get the render settings that affect every segment clip (part of each clip hash).
+
+        Args:
+            width: Output width
+            height: Output height
+
+        Returns:
+            JSON-serializable settings dictionary
+        """
+        return {
+            "width": width,
+            "height": height,
+            "fps": self.FPS,
+            "encoding": asdict(self.encoding),
+            "clip_intermediate_format": self.config.clip_intermediate_format,
+            "ken_burns_engine": self.config.ken_burns_engine,
+            "title_overlay_mode": self.config.title_overlay_mode,
+            "title_font_size": self.TITLE_FONT_SIZE,
+        }
+
+    def _build_render_manifest(self, segments_data: list, output_path: Path) -> RenderManifest:
+        """
+        Hash each segment's inputs and build the render manifest.
+
+        Inputs that live in the render's output directory (generated images
+        and narration in a job workspace) are copied into the clip cache, so
+        the manifest still points at them after the workspace is removed.
+
+        Args:
+            segments_data: Segment data dictionaries
+            output_path: Output directory of the current render
+
+        Returns:
+            RenderManifest with one entry (including clip_hash) per segment
+        """
+        width, height = self._get_output_size()
+        settings = self._get_clip_settings(width, height)
+        render_dir = output_path.resolve()
+
+        def keep(file_path: str, digest: str) -> str:
+            if Path(file_path).resolve().is_relative_to(render_dir):
+                return str(self.clip_cache.store_asset(file_path, digest))
+            return file_path
+
+        segments = []
+        for i, segment in enumerate(segments_data):
+            media_path = segment['image_path']
+            media_digest = file_digest(media_path)
+            audio_digest = file_digest(segment['audio_path'])
+            clip_hash = self._get_clip_hash(i, segment, media_digest, settings)
+
+            segments.append({
+                "segment_number": segment['segment_number'],
+                "text": segment['text'],
+                "title": segment.get('title', ''),
+                "image_path": keep(media_path, media_digest),
+                "audio_path": keep(segment['audio_path'], audio_digest),
+                "audio_duration": segment['audio_duration'],
+                "media_digest": media_digest,
+                "audio_digest": audio_digest,
+                "clip_hash": clip_hash,
+            })
+
+        return RenderManifest(segments=segments, settings=settings)
+
+    def _get_clip_hash(self, index: int, segment: dict, media_digest: str, settings: dict) -> str:
+        """
+        Hash everything that affects the pixels of a segment's clip.
+
+        Args:
+            index: Position of the segment on the timeline (selects the Ken Burns pattern)
+            segment: Segment data dictionary
+            media_digest: Content digest of the segment's media
+            settings: Clip settings (see _get_clip_settings)
+
+        Returns:
+            Clip cache key
+        """
+        is_video = self._is_video_file(segment['image_path'])
+
+        # Narration is concatenated separately, so its content is not part of the clip hash
+        return segment_hash({
+            "media": media_digest,
+            "is_video": is_video,
+            "title": self._prepare_segment_title(segment),
+            "clip_duration": round(self._get_clip_duration(segment), 6),
+            "motion_pattern": None if is_video else asdict(get_movement_pattern(index)),
+            "settings": settings,
+        })
+
+    def rerender_slideshow(
+        self,
+        manifest_path: str,
+        segment_updates: Optional[dict] = None,
+        output_dir: str = "output"
+    ) -> str:
+        """
+        Re-render a slideshow from its manifest, re-encoding only edited segments.
+
+        Clips whose inputs are unchanged come from the clip cache; only the
+        edited segments are encoded before the concat and finishing pass.
+
+        Args:
+            manifest_path: Render manifest saved next to the original video
+            segment_updates: Changes per segment number, e.g. {3: {"title": "...", "image_path": "..."}}
+            output_dir: Directory to save the new video
+
+        Returns:
+            Path to the re-rendered video
+
+        Raises:
+            VideoCompositionError: If the manifest or updates are invalid, or rendering fails
+        """
+        try:
+            manifest = RenderManifest.load(manifest_path)
+        except (OSError, ValueError) as e:
+            raise VideoCompositionError(f"Cannot read render manifest {manifest_path}: {e}")
+
+        segments_data = manifest.get_segments_data()
+        segment_updates = segment_updates or {}
+
+        unknown = set(segment_updates) - {segment['segment_number'] for segment in segments_data}
+        if unknown:
+            raise VideoCompositionError(f"Unknown segment numbers: {sorted(unknown)}")
+
+        for segment in segments_data:
+            updates = segment_updates.get(segment['segment_number'])
+            if not updates:
+                continue
+            segment.update(updates)
+            if 'audio_path' in updates and 'audio_duration' not in updates:
+                # New narration: the clip length follows its duration
+                segment['audio_duration'] = self.get_audio_duration(segment['audio_path'])
+
+        if self.clip_cache is None:
+            self.logger.warning("clip_cache_disabled", action="rendering_all_clips")
+
+        self.logger.info(
+            "rerendering_slideshow",
+            manifest_path=str(manifest_path),
+            edited_segments=sorted(segment_updates)
+        )
+
+        # Only multi_pass encodes clips separately, so only it can reuse them
+        return self.create_slideshow_with_subtitles(segments_data, output_dir, render_mode="multi_pass")
+
+    def create_slideshow_variants(
+        self,
+        segments_data: list,
+        aspect_ratios: Optional[list] = None,
+        output_dir: str = "output"
+    ) -> dict:
+        """
+        Create the slideshow in several aspect ratios (e.g. 9:16 Shorts plus 16:9 and 1:1).
+
+        All variants come from one decode and one ffmpeg process (see
+        _render_variants); each gets its own crop, title/icon layout and
+        subtitle styling.
+
+        Args:
+            segments_data: Segment data dictionaries (see create_slideshow_with_subtitles)
+            aspect_ratios: Aspect ratios to render (defaults to Config.get_output_aspect_ratios())
+            output_dir: Directory to save the final videos
+
+        Returns:
+            Dict mapping each aspect ratio to its final video path
+
+        Raises:
+            VideoCompositionError: If creation fails
+        """
+        if not segments_data:
+            raise VideoCompositionError("No segments provided for slideshow")
+
+        aspect_ratios = list(dict.fromkeys(aspect_ratios or self.config.get_output_aspect_ratios()))
+        unknown = [aspect_ratio for aspect_ratio in aspect_ratios if aspect_ratio not in self.OUTPUT_SIZES]
+        if unknown:
+            raise VideoCompositionError(f"Unsupported aspect ratios: {', '.join(unknown)}")
+
+        self.logger.info(
+            "creating_slideshow_variants",
+            num_segments=len(segments_data),
+            aspect_ratios=aspect_ratios
+        )
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        import time
+        timestamp = int(time.time())
+
+        # Temporary files removed once the final videos are verified
+        temp_files = []
+
+        try:
+            # Decode the narration once to PCM; clip lengths follow its exact sample counts
+            narration = None
+            if self.config.audio_assembly == "pcm":
+                narration, segments_data = self._build_narration_timeline(segments_data, output_path, timestamp)
+                temp_files.append(narration.path)
+
+            # One ASS file per variant: PlayRes and style sizes follow each canvas
+            subtitle_files = {}
+            if self.config.enable_subtitles:
+                for aspect_ratio in aspect_ratios:
+                    subtitle_file = output_path / f"subtitles_{timestamp}_{aspect_ratio.replace(':', 'x')}.ass"
+                    self._write_ass_subtitles(segments_data, subtitle_file, aspect_ratio)
+                    subtitle_files[aspect_ratio] = subtitle_file
+                    temp_files.append(subtitle_file)
+
+            if self.probe_cache is not None:
+                # Probe every pre-defined video up front in one batch (cached across runs)
+                self._probe_many([
+                    seg['image_path'] for seg in segments_data if self._is_video_file(seg['image_path'])
+                ])
+
+            final_videos = self._render_variants(
+                segments_data, output_path, timestamp, aspect_ratios, subtitle_files, narration
+            )
+
+            # Verify outputs
+            for aspect_ratio, final_video in final_videos.items():
+                if not final_video.exists() or final_video.stat().st_size == 0:
+                    raise VideoCompositionError(f"Final {aspect_ratio} video was not created")
+
+            self.logger.info(
+                "slideshow_variants_created",
+                final_videos={aspect_ratio: str(path) for aspect_ratio, path in final_videos.items()},
+                file_sizes_mb={
+                    aspect_ratio: round(path.stat().st_size / (1024 * 1024), 2)
+                    for aspect_ratio, path in final_videos.items()
+                }
+            )
+
+            # Clean up temporary files
+            for temp_file in temp_files:
+                Path(temp_file).unlink(missing_ok=True)
+
+            return {aspect_ratio: str(path) for aspect_ratio, path in final_videos.items()}
+
+        except subprocess.CalledProcessError as e:
+            stderr_output = e.stderr.decode('utf-8') if e.stderr else "No error output"
+            log_error(self.logger, e, "video_composer.create_slideshow_variants")
+            self.logger.error("ffmpeg_variants_error", error=stderr_output)
+            raise VideoCompositionError(f"Failed to create slideshow variants: {stderr_output}")
+
+        except VideoCompositionError:
+            raise
+
+        except Exception as e:
+            log_error(self.logger, e, "video_composer.create_slideshow_variants")
+            raise VideoCompositionError(f"Slideshow variants creation failed: {str(e)}")
+
+    def _get_clip_render_budget(self, num_clips: int) -> tuple:
+        """
+        Split the available CPU cores between parallel clip encodes.
+
+        Args:
+            num_clips: Number of clips to render
+
+        Returns:
+            Tuple of (worker count, ffmpeg threads per clip)
+        """
+        cpu_count = os.cpu_count() or 1
+
+        workers = self.config.clip_render_workers
+        if workers <= 0:
+            # x264 scales poorly on short clips, so favour more clips with fewer threads each
+            workers = max(1, cpu_count // 2)
+        workers = max(1, min(workers, num_clips))
+
+        threads = self.config.ffmpeg_threads_per_clip
+        if threads <= 0:
+            threads = max(1, cpu_count // workers)
+            if self.encoding.threads:
+                # The encoding profile's thread limit also caps each clip encode
+                threads = min(threads, self.encoding.threads)
+
+        return workers, threads
+
+    def _render_clip(self, job: dict, width: int, height: int, threads: int) -> str:
+        """
+        Render one segment clip from an image (Ken Burns) or a pre-defined video.
+
+        Args:
+            job: Clip job (index, segment_number, media_path, clip_duration, clip_output, segment_title)
+            width: Output width
+            height: Output height
+            threads: ffmpeg thread count for this clip
+
+        Returns:
+            Path to the rendered clip
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+            VideoCompositionError: If video clip preparation fails
+        """
+        media_path = job['media_path']
+        clip_duration = job['clip_duration']
+        clip_output = job['clip_output']
+
+        # Check if media is a video or image
+        if self._is_video_file(media_path):
+            # Handle pre-defined video
+            self.logger.info(
+                "creating_video_clip_from_video",
+                segment_number=job['segment_number'],
+                video_path=media_path,
+                duration=clip_duration
+            )
+
+            self._prepare_video_clip(
+                media_path=media_path,
+                target_duration=clip_duration,
+                output_path=clip_output,
+                width=width,
+                height=height,
+                segment_title=job['segment_title'],
+                threads=threads
+            )
+            return str(clip_output)
+
+        # Handle image with Ken Burns effect
+        self.logger.info(
+            "creating_video_clip_from_image",
+            segment_number=job['segment_number'],
+            image_path=media_path,
+            duration=clip_duration,
+            ken_burns_engine=self.config.ken_burns_engine
+        )
+
+        if self.config.ken_burns_engine == "fast":
+            self._create_ken_burns_clip_fast(job, width, height, threads)
+            return str(clip_output)
+
+        fps = self.FPS
+
+        # Combine Ken Burns effect with title overlay
+        filter_args = self._get_clip_filter_args(
+            f"{self._get_ken_burns_filter(job['index'], clip_duration, width, height)},"
+            f"trim=duration={clip_duration},"
+            f"setpts=PTS-STARTPTS",
+            job['segment_title'], width, "image"
+        )
+
+        # Use ffmpeg to create video from image with Ken Burns effect and title overlay
+        # Ensure consistent frame rate and keyframes for smooth concatenation
+        run_ffmpeg([
+            'ffmpeg',
+            '-loop', '1',
+            '-i', media_path,
+        ] + filter_args + [
+            '-t', str(clip_duration),
+            '-pix_fmt', 'yuv420p',
+        ] + self._get_clip_encoder_args(still_image=True) + [
+            '-threads', str(threads),  # Per-clip thread budget (clips render in parallel)
+            '-r', str(fps),  # Set frame rate
+            '-vsync', 'cfr',  # Constant frame rate
+            '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
+            '-keyint_min', str(fps),  # Minimum keyframe interval
+            '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
+            str(clip_output)
+        ], logger=self.logger, step="image_clip", expected_duration=clip_duration)
+
+        self.logger.info(
+            "video_clip_created",
+            segment_number=job['segment_number'],
+            clip_path=str(clip_output)
+        )
+
+        return str(clip_output)
+
+    def _create_ken_burns_clip_fast(self, job: dict, width: int, height: int, threads: int) -> None:
+        """
+        Create an image clip with the fast Ken Burns renderer.
+
+        The still is decoded once and every frame is cropped and scaled at output
+        resolution in Python, then streamed to ffmpeg as raw video for the title
+        overlay and encode. Produces the same motion as the zoompan patterns.
+
+        Args:
+            job: Clip job (index, segment_number, media_path, clip_duration, clip_output, segment_title)
+            width: Output width
+            height: Output height
+            threads: ffmpeg thread count for this clip
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        fps = self.FPS
+        total_frames = int(job['clip_duration'] * fps)
+        renderer = KenBurnsRenderer(job['media_path'], width, height)
+        pattern = get_movement_pattern(job['index'])
+
+        command = [
+            'ffmpeg',
+            '-y',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'rgb24',
+            '-s', f"{width}x{height}",
+            '-r', str(fps),
+            '-i', 'pipe:0',
+        ] + self._get_clip_filter_args("null", job['segment_title'], width, "image") + [
+            '-pix_fmt', 'yuv420p',
+        ] + self._get_clip_encoder_args(still_image=True) + [
+            '-threads', str(threads),  # Per-clip thread budget (clips render in parallel)
+            '-g', str(fps),  # Keyframe interval = 1 second (force keyframe at start)
+            '-keyint_min', str(fps),  # Minimum keyframe interval
+            '-force_key_frames', 'expr:gte(t,0)',  # Force keyframe at t=0
+            str(job['clip_output'])
+        ]
+
+        run_ffmpeg(
+            command,
+            logger=self.logger,
+            step="image_clip_fast",
+            expected_duration=job['clip_duration'],
+            stdin_chunks=renderer.render_frames(pattern, total_frames, workers=threads)
+        )
+
+        self.logger.info(
+            "video_clip_created",
+            segment_number=job['segment_number'],
+            clip_path=str(job['clip_output']),
+            frames=total_frames
+        )
+
+    def _build_clip_job(self, index: int, segment: dict, clip_output: Path) -> dict:
+        """
+        Describe the clip of one segment for _render_clip.
+
+        Args:
+            index: Position of the segment on the timeline
+            segment: Segment data dictionary
+            clip_output: Path of the clip to render
+
+        Returns:
+            Clip job (index, segment_number, media_path, clip_duration, clip_output, segment_title)
+        """
+        return {
+            'index': index,
+            'segment_number': segment['segment_number'],
+            'media_path': segment['image_path'],  # Could be image or video
+            # Adjust clip duration to match sped-up audio
+            'clip_duration': self._get_clip_duration(segment),
+            'clip_output': clip_output,
+            # Get segment title for overlay
+            'segment_title': self._prepare_segment_title(segment),
+        }
+
+    def _render_clips(self, clip_jobs: list, width: int, height: int) -> list:
+        """
+        Render segment clips concurrently, one ffmpeg process per worker.
+
+        Args:
+            clip_jobs: Clip jobs in timeline order
+            width: Output width
+            height: Output height
+
+        Returns:
+            Clip paths in timeline order (ready for concatenation)
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+            VideoCompositionError: If video clip preparation fails
+        """
+        workers, threads = self._get_clip_render_budget(len(clip_jobs))
+
+        self.logger.info(
+            "rendering_clips",
+            clip_count=len(clip_jobs),
+            workers=workers,
+            threads_per_clip=threads
+        )
+
+        video_clips = [None] * len(clip_jobs)
+
+        # Threads are enough here: each worker just waits on its own ffmpeg child process
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._render_clip, job, width, height, threads): position
+                for position, job in enumerate(clip_jobs)
+            }
+            try:
+                for future in as_completed(futures):
+                    video_clips[futures[future]] = future.result()
+            except Exception:
+                # Don't start clips that are still queued once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return video_clips
+
+    def _render_multi_pass(
+        self,
+        segments_data: list,
+        output_path: Path,
+        timestamp: int,
+        subtitle_file: Optional[Path],
+        temp_files: list,
+        clip_hashes: Optional[list] = None,
+        narration: Optional[AudioTimeline] = None,
+        prerendered_clips: Optional[dict] = None
+    ) -> Path:
+        """
+        Render the Short clip by clip: encode each segment, concatenate the clips
+        and the narration, then run the finishing pass.
+
+        Args:
+            segments_data: Segment data dictionaries
+            output_path: Output directory
+            timestamp: Timestamp used for file naming
+            subtitle_file: ASS subtitle file (None to skip subtitles)
+            temp_files: List collecting intermediate files for cleanup
+            clip_hashes: Clip cache key of each segment (None to render every clip)
+            narration: PCM narration timeline (None to concatenate the segment audio files)
+            prerendered_clips: Clips already rendered by a ClipRenderSession, by
+                position: (clip_duration, clip path); used when the duration matches
+
+        Returns:
+            Path to the final video
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        output_dir = str(output_path)
+        width, height = self._get_output_size()
+
+        # Step 1: Create video clips for each image with its duration (rendered in parallel)
+        clip_jobs = [
+            self._build_clip_job(i, segment, output_path / f"clip_{i}_{timestamp}.mp4")
+            for i, segment in enumerate(segments_data)
+        ]
+
+        # Reuse clips rendered while the segments were generated, or unchanged since an earlier render
+        prerendered_clips = prerendered_clips or {}
+        video_clips = [None] * len(clip_jobs)
+        pending = []
+        for position, job in enumerate(clip_jobs):
+            prerendered = prerendered_clips.get(position)
+            if prerendered is not None and abs(prerendered[0] - job['clip_duration']) < 1e-6:
+                video_clips[position] = prerendered[1]
+                continue
+            cached_clip = self.clip_cache.get(clip_hashes[position]) if clip_hashes else None
+            if cached_clip is not None:
+                video_clips[position] = str(cached_clip)
+            else:
+                pending.append(position)
+
+        if clip_hashes or prerendered_clips:
+            self.logger.info("clip_cache_lookup", reused=len(clip_jobs) - len(pending), to_render=len(pending))
+
+        if pending:
+            rendered_clips = self._render_clips([clip_jobs[position] for position in pending], width, height)
+            temp_files.extend(rendered_clips)
+            for position, clip_path in zip(pending, rendered_clips):
+                video_clips[position] = clip_path
+                if clip_hashes:
+                    self.clip_cache.put(clip_hashes[position], clip_path)
+
+        # Step 2: Concatenate all video clips
+        self.logger.info("concatenating_video_clips")
+        concatenated_video = self.concatenate_videos(
+            video_clips,
+            output_dir,
+            stream_copy=self.config.clip_intermediate_format != "standard"
+        )
+        temp_files.append(concatenated_video)
+
+        # Step 3: Concatenate all audio files (already done by the PCM timeline)
+        if narration is not None:
+            concatenated_audio = narration.path
+        else:
+            self.logger.info("concatenating_audio_files")
+            audio_list_file = output_path / f"audio_list_{timestamp}.txt"
+            concatenated_audio = output_path / f"concatenated_audio_{timestamp}.mp3"
+
+            with open(audio_list_file, 'w') as f:
+                for segment in segments_data:
+                    abs_path = Path(segment['audio_path']).resolve()
+                    f.write(f"file '{abs_path}'\n")
+
+            run_ffmpeg([
+                'ffmpeg',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', str(audio_list_file),
+                '-c', 'copy',
+                str(concatenated_audio)
+            ], logger=self.logger, step="concatenate_audio")
+
+            audio_list_file.unlink()  # Clean up
+            temp_files.append(concatenated_audio)
+
+        if subtitle_file is None:
+            # Just combine video and audio without subtitles
+            self.logger.info("combining_video_audio_no_subtitles")
+            final_video_str = self.combine_video_audio(concatenated_video, str(concatenated_audio), output_dir)
+            return Path(final_video_str)
+
+        # Step 4: Combine video, audio, and subtitles in the finishing pass
+        self.logger.info("combining_video_audio_subtitles")
+        final_video = output_path / f"final_shorts_{timestamp}.mp4"
+
+        # Total duration of the sped-up narration (background music length, progress ETA)
+        total_duration = sum(self._get_clip_duration(seg) for seg in segments_data)
+
+        # Add background music if enabled
+        bgm_path = None
+        if self.config.enable_background_music:
+            bgm_path = self._prepare_background_music(total_duration)
+
+        chunk_count = self._get_final_encode_chunk_count(total_duration)
+        if chunk_count > 1:
+            return self._render_finishing_chunks(
+                concatenated_video, concatenated_audio, bgm_path, subtitle_file, final_video,
+                total_duration, chunk_count, narration is not None, temp_files
+            )
+
+        input_args = [
+            '-i', concatenated_video,
+            '-i', str(concatenated_audio),
+        ] + self._prepare_channel_icon()  # Spinning icon: 1 full rotation every 3 seconds
+
+        bgm_label = None
+        if bgm_path:
+            input_args += ['-i', bgm_path]
+            bgm_label = "3:a"
+
+        filters = self._build_finishing_filters(
+            video_label="0:v",
+            voice_label="1:a",
+            icon_label="2:v",
+            bgm_label=bgm_label,
+            subtitle_file=subtitle_file,
+            width=width,
+            height=height,
+            voice_prepared=narration is not None,
+            duration=total_duration
+        )
+
+        run_ffmpeg(
+            ['ffmpeg', '-y']
+            + input_args
+            + ['-filter_complex', ';'.join(filters)]
+            + self._get_final_output_args(final_video),
+            logger=self.logger,
+            step="finishing_pass",
+            expected_duration=total_duration
+        )
+
+        return final_video
+
+    def _get_final_encode_chunk_count(self, duration: float) -> int:
+        """
+        Get how many chunks the multi_pass finishing encode is split into.
+
+        Args:
+            duration: Video duration in seconds
+
+        Returns:
+            Chunk count (1 = encode in one process)
+        """
+        chunks = self.config.final_encode_chunks
+        if chunks <= 0:
+            # One chunk per ffmpeg slot when governed, otherwise per core
+            governor = get_ffmpeg_governor()
+            chunks = governor.max_slots if governor else (os.cpu_count() or 1)
+
+        # Chunks are whole seconds (GOP aligned); never more chunks than seconds
+        return max(1, min(chunks, int(duration)))
+
+    def _get_finishing_chunk_starts(self, duration: float, chunk_count: int) -> tuple:
+        """
+        Split the finishing encode on whole seconds.
+
+        A last chunk starting less than MIN_FINAL_CHUNK_SECONDS before the end
+        is folded into the previous one. Otherwise a concatenation a few frames
+        shorter than the nominal duration would leave that chunk's seek past
+        the last frame, giving an empty chunk.
+
+        Args:
+            duration: Video duration in seconds
+            chunk_count: Requested number of chunks
+
+        Returns:
+            Tuple of (seconds per chunk, list of chunk start seconds); the last
+            chunk runs to the end of the video
+        """
+        chunk_seconds = math.ceil(duration / chunk_count)
+        starts = list(range(0, math.ceil(duration), chunk_seconds))
+        if len(starts) > 1 and duration - starts[-1] < self.MIN_FINAL_CHUNK_SECONDS:
+            starts.pop()
+        return chunk_seconds, starts
+
+    def _render_finishing_chunks(
+        self,
+        concatenated_video: str,
+        concatenated_audio: Path,
+        bgm_path: Optional[str],
+        subtitle_file: Path,
+        final_video: Path,
+        total_duration: float,
+        chunk_count: int,
+        voice_prepared: bool,
+        temp_files: list
+    ) -> Path:
+        """
+        Run the finishing pass as parallel chunk encodes joined by stream copy.
+
+        The timeline is split on whole seconds (1 second GOP), and each chunk is
+        encoded in its own ffmpeg process. Chunk frames are shifted back to
+        their global timestamps before the ASS burn-in, so every subtitle event
+        lands where it would in one encode. The spinning icon starts at the
+        rotation phase of the chunk's first frame. The audio mix is encoded
+        once, then the chunks are concatenated without re-encoding and muxed
+        with it.
+
+        Args:
+            concatenated_video: Concatenated clips
+            concatenated_audio: Narration (PCM timeline or concatenated MP3)
+            bgm_path: Background music bed (None for voiceover only)
+            subtitle_file: ASS subtitle file
+            final_video: Path of the final video
+            total_duration: Video duration in seconds
+            chunk_count: Number of chunks
+            voice_prepared: Narration is a PCM timeline already sped up and gained
+            temp_files: List collecting intermediate files for cleanup
+
+        Returns:
+            Path to the final video
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg fails
+        """
+        fps = self.FPS
+        width, height = self._get_output_size()
+        sprite_frames = fps * ROTATION_PERIOD
+
+        # Whole-second chunk boundaries; the last chunk runs to the end of the video
+        chunk_seconds, starts = self._get_finishing_chunk_starts(total_duration, chunk_count)
+        workers = len(starts) + 1  # Chunks plus the audio encode
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        if self.encoding.threads:
+            threads = min(threads, self.encoding.threads)
+
+        self.logger.info(
+            "chunked_finishing_started",
+            chunks=len(starts),
+            chunk_seconds=chunk_seconds,
+            threads_per_chunk=threads
+        )
+
+        def encode_chunk(index: int, start: int) -> Path:
+            chunk_file = final_video.with_name(f"{final_video.stem}_chunk{index}.mp4")
+            is_last = index == len(starts) - 1
+            phase_frame = (start * fps) % sprite_frames
+            filters = [
+                # Global timestamps for the subtitles, icon rotation continuing from the previous chunk
+                f"[0:v]setpts=PTS+{start}/TB[chunk_in]",
+                f"[1:v]trim=start_frame={phase_frame},setpts=PTS-STARTPTS+{start}/TB[chunk_icon]",
+            ] + self._build_video_finishing_filters(
+                "chunk_in", "chunk_icon", subtitle_file, width, height, output_label="chunk_out"
+            ) + [
+                "[chunk_out]setpts=PTS-STARTPTS[vout]",
+            ]
+            frame_args = [] if is_last else ['-frames:v', str(chunk_seconds * fps)]
+
+            run_ffmpeg(
+                ['ffmpeg', '-y', '-ss', str(start), '-i', str(concatenated_video)]
+                + self._prepare_channel_icon()
+                + ['-filter_complex', ';'.join(filters), '-map', '[vout]']
+                + frame_args
+                + self.encoding.video_args()
+                + ['-r', str(fps), '-pix_fmt', 'yuv420p', '-threads', str(threads), '-an', str(chunk_file)],
+                logger=self.logger,
+                step="finishing_chunk",
+                expected_duration=(total_duration - start) if is_last else chunk_seconds
+            )
+            return chunk_file
+
+        def encode_audio() -> Path:
+            audio_file = final_video.with_name(f"{final_video.stem}_audio.m4a")
+            input_args = ['-i', str(concatenated_audio)]
+            bgm_label = None
+            if bgm_path:
+                input_args += ['-i', bgm_path]
+                bgm_label = "1:a"
+            filters = self._build_audio_mix_filters(
+                "0:a", bgm_label, voice_prepared=voice_prepared, duration=total_duration
+            )
+            run_ffmpeg(
+                ['ffmpeg', '-y'] + input_args + [
+                    '-filter_complex', ';'.join(filters),
+                    '-map', '[aout]',
+                    '-c:a', 'aac',
+                    '-b:a', self.encoding.audio_bitrate,
+                    str(audio_file)
+                ],
+                logger=self.logger,
+                step="finishing_audio",
+                expected_duration=total_duration
+            )
+            return audio_file
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            audio_future = executor.submit(encode_audio)
+            chunk_futures = [executor.submit(encode_chunk, i, start) for i, start in enumerate(starts)]
+            chunk_files = [future.result() for future in chunk_futures]
+            audio_file = audio_future.result()
+        temp_files.extend(chunk_files + [audio_file])
+
+        # Join the chunks by stream copy and mux the audio
+        chunk_list_file = final_video.with_name(f"{final_video.stem}_chunks.txt")
+        with open(chunk_list_file, 'w') as f:
+            for chunk_file in chunk_files:
+                f.write(f"file '{chunk_file.resolve()}'\n")
+        temp_files.append(chunk_list_file)
+
+        run_ffmpeg([
+            'ffmpeg', '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(chunk_list_file),
+            '-i', str(audio_file),
+            '-map', '0:v',
+            '-map', '1:a',
+            '-c', 'copy',
+            '-movflags', '+faststart',
+            str(final_video)
+        ], logger=self.logger, step="finishing_concat")
+
+        return final_video
 
     def _format_srt_time(self, seconds: float) -> str:
         """
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test that the final audio ends with the video when background music is mixed in.
+
+Renders a short slideshow from generated images and narration with the
+background music enabled, in both render modes, and compares the decoded
+length of the final audio stream with the video stream. One render uses
+narration files that run longer than their recorded durations, which must
+be cut at the end of the picture too. Needs ffmpeg, but no API calls.
+"""
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+from src.config import Config
+from src.video_composer import VideoComposer
+
+
+SEGMENT_COUNT = 3
+NARRATION_SECONDS = 2.4
+TOLERANCE_SECONDS = 0.1  # AAC frames and the last video frame
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def make_inputs(work_dir: Path) -> list:
+    """Generate a still image and a sine-tone narration per segment."""
+    segments = []
+    for i in range(SEGMENT_COUNT):
+        image_path = work_dir / f"image_{i}.png"
+        audio_path = work_dir / f"narration_{i}.mp3"
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', f'color=c=0x{i * 40:02x}3060:s=540x960',
+             '-frames:v', '1', str(image_path)],
+            check=True
+        )
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', f'sine=frequency={300 + i * 100}:sample_rate=44100',
+             '-t', str(NARRATION_SECONDS), '-c:a', 'libmp3lame', str(audio_path)],
+            check=True
+        )
+        segments.append({
+            'segment_number': i + 1,
+            'text': f'테스트 자막 {i + 1}',
+            'title': f'제목 {i + 1}',
+            'image_path': str(image_path),
+            'audio_path': str(audio_path),
+            'audio_duration': NARRATION_SECONDS,
+        })
+    return segments
+
+
+def stream_seconds(video_path: str, stream: str) -> float:
+    """Decode one stream of a file and return how long it runs."""
+    result = subprocess.run(
+        ['ffmpeg', '-hide_banner', '-i', video_path, '-map', f'0:{stream}', '-f', 'null', '-'],
+        capture_output=True, text=True, check=True
+    )
+    hours, minutes, seconds = re.findall(r"time=(\d+):(\d+):([\d.]+)", result.stderr)[-1]
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Background Music Mix Length Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        segments = make_inputs(work_dir)
+
+        # Narration recorded shorter than the files: the concatenated narration outlasts the clips
+        stale_durations = [dict(segment, audio_duration=NARRATION_SECONDS - 0.6) for segment in segments]
+
+        cases = [
+            ("multi_pass", "pcm", segments),
+            ("single_pass", "pcm", segments),
+            ("multi_pass", "concat", stale_durations),
+        ]
+        for render_mode, audio_assembly, segments_data in cases:
+            name = f"{render_mode}, {audio_assembly} narration"
+            if segments_data is stale_durations:
+                name += " running long"
+            config = Config(
+                claude_api_key="test", google_api_key="test", elevenlabs_api_key="test",
+                render_mode=render_mode, audio_assembly=audio_assembly, encoding_profile="draft",
+                title_overlay_mode="png", enable_background_music=True, enable_clip_cache=False,
+                enable_ffmpeg_governor=False, cache_dir=str(work_dir / "cache")
+            )
+            composer = VideoComposer(config)
+            video_path = composer.create_slideshow_with_subtitles(
+                [dict(segment) for segment in segments_data],
+                output_dir=str(work_dir / f"output_{render_mode}_{audio_assembly}")
+            )
+
+            video_seconds = stream_seconds(video_path, 'v')
+            audio_seconds = stream_seconds(video_path, 'a')
+            all_passed &= check(
+                f"Audio ends with the video ({name})",
+                abs(audio_seconds - video_seconds) <= TOLERANCE_SECONDS,
+                f"audio {audio_seconds:.2f}s, video {video_seconds:.2f}s"
+            )
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test the frame-rounded clip cuts of the PCM narration timeline.
+
+Checks that get_clip_durations places every cut on the frame nearest to its
+audio boundary (no drift across segments), keeps every clip at least one
+frame long, and gives the same durations for a prefix of the timeline as for
+the whole timeline (streaming renders time clips before the rest exists).
+No ffmpeg or API calls are needed.
+"""
+import random
+
+from src.audio_timeline import AudioTimeline, get_clip_durations
+
+
+SAMPLE_RATE = 48000
+FPS = 30
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Audio Timeline Clip Duration Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    rng = random.Random(42)
+
+    # Exact whole-frame segments stay untouched
+    durations = get_clip_durations([SAMPLE_RATE * 2, SAMPLE_RATE // 2], SAMPLE_RATE, FPS)
+    all_passed &= check("Whole-frame segments keep their length", durations == [2.0, 0.5], str(durations))
+
+    # Random segment lengths: cuts never drift from the audio boundaries
+    worst_error = 0.0
+    whole_frames = True
+    for _ in range(500):
+        samples = [rng.randint(SAMPLE_RATE // 2, SAMPLE_RATE * 12) for _ in range(rng.randint(1, 12))]
+        durations = get_clip_durations(samples, SAMPLE_RATE, FPS)
+
+        cut = 0.0
+        audio_boundary = 0
+        for segment_samples, duration in zip(samples, durations):
+            whole_frames &= abs(duration * FPS - round(duration * FPS)) < 1e-9
+            cut += duration
+            audio_boundary += segment_samples
+            worst_error = max(worst_error, abs(cut - audio_boundary / SAMPLE_RATE))
+
+    all_passed &= check("Every clip is a whole number of frames", whole_frames)
+    all_passed &= check(
+        "Cuts stay within half a frame of the audio boundary",
+        worst_error <= 0.5 / FPS + 1e-9,
+        f"worst error {worst_error * 1000:.2f} ms (limit {500 / FPS:.2f} ms)"
+    )
+
+    # Per-segment rounding would drift; cumulative rounding must not
+    samples = [SAMPLE_RATE // FPS + SAMPLE_RATE // (FPS * 2) + 1] * 40  # 1.5 frames + 1 sample each
+    total_frames = round(sum(get_clip_durations(samples, SAMPLE_RATE, FPS)) * FPS)
+    expected_frames = round(sum(samples) * FPS / SAMPLE_RATE)
+    all_passed &= check(
+        "No accumulated drift over 40 segments of 1.5 frames",
+        total_frames == expected_frames,
+        f"{total_frames} frames, expected {expected_frames}"
+    )
+
+    # A segment shorter than a frame still gets one
+    durations = get_clip_durations([SAMPLE_RATE * 3, 10, SAMPLE_RATE], SAMPLE_RATE, FPS)
+    all_passed &= check("Sub-frame segment gets at least one frame", min(durations) >= 1 / FPS, str(durations))
+
+    # Durations of a prefix are final (the streaming render relies on it)
+    prefix_stable = True
+    for _ in range(200):
+        samples = [rng.randint(1000, SAMPLE_RATE * 8) for _ in range(8)]
+        durations = get_clip_durations(samples, SAMPLE_RATE, FPS)
+        for known in range(1, len(samples)):
+            prefix_stable &= get_clip_durations(samples[:known], SAMPLE_RATE, FPS) == durations[:known]
+    all_passed &= check("Durations of a timeline prefix never change", prefix_stable)
+
+    # The timeline object uses the same cuts
+    timeline = AudioTimeline(path=None, sample_rate=SAMPLE_RATE, segment_samples=samples)
+    all_passed &= check(
+        "AudioTimeline.get_clip_durations matches the module function",
+        timeline.get_clip_durations(FPS) == get_clip_durations(samples, SAMPLE_RATE, FPS)
+    )
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
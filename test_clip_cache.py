@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test the segment clip cache and clip hashes used by incremental re-renders.
+
+Checks ClipCache hits, misses, LRU eviction and atomic stores, and that
+VideoComposer._get_clip_hash is stable for unchanged inputs but changes
+whenever something that affects the clip's pixels changes. No ffmpeg or API
+calls are needed.
+"""
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.config import Config
+from src.render_manifest import ClipCache
+from src.video_composer import VideoComposer
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def make_clip(directory: Path, name: str, content: bytes) -> Path:
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+def check_clip_cache(work_dir: Path) -> bool:
+    print("ClipCache")
+    print("-" * 70)
+    all_passed = True
+    source_dir = work_dir / "rendered"
+    source_dir.mkdir()
+    cache = ClipCache(str(work_dir / "clips"), max_entries=3)
+
+    all_passed &= check("Miss on an empty cache", cache.get("a" * 64) is None)
+
+    clip = make_clip(source_dir, "clip0.mp4", b"clip zero")
+    cached = cache.put("hash0", str(clip))
+    all_passed &= check("Stored clip is a copy (source left in place)", clip.exists() and cached != clip)
+    all_passed &= check("Hit returns the stored content", cache.get("hash0").read_bytes() == b"clip zero")
+
+    # Overwriting a hash replaces the content atomically, leaving no temp files
+    cache.put("hash0", str(make_clip(source_dir, "clip0b.mp4", b"clip zero, re-rendered")))
+    temp_files = [p.name for p in cache.cache_dir.iterdir() if p.name.startswith(".")]
+    all_passed &= check("Store replaces the clip", cache.get("hash0").read_bytes() == b"clip zero, re-rendered")
+    all_passed &= check("No temp files left behind", not temp_files, str(temp_files))
+
+    # Fill the cache with entries of increasing age, then touch the oldest
+    base = time.time() - 1000
+    for i in range(1, 3):
+        cache.put(f"hash{i}", str(make_clip(source_dir, f"clip{i}.mp4", f"clip {i}".encode())))
+    for i in range(3):
+        os.utime(cache.cache_dir / f"hash{i}.mp4", (base + i, base + i))
+    cache.get("hash0")  # Recently used: must survive the next eviction
+
+    cache.put("hash3", str(make_clip(source_dir, "clip3.mp4", b"clip 3")))
+    kept = sorted(p.stem for p in cache.cache_dir.glob("*.mp4"))
+    all_passed &= check(
+        "LRU eviction drops the least recently used clip",
+        kept == ["hash0", "hash2", "hash3"],
+        f"kept {kept}"
+    )
+
+    # Render inputs are stored once per content digest
+    asset = make_clip(source_dir, "narration.MP3", b"narration")
+    first = cache.store_asset(str(asset), "digest1")
+    second = cache.store_asset(str(asset), "digest1")
+    all_passed &= check(
+        "Assets are stored once per digest (lowercase suffix)",
+        first == second and first.name == "digest1.mp3" and first.read_bytes() == b"narration"
+    )
+
+    print()
+    return all_passed
+
+
+def check_clip_hash(work_dir: Path) -> bool:
+    print("VideoComposer._get_clip_hash")
+    print("-" * 70)
+    all_passed = True
+
+    def composer(**overrides):
+        config = Config(
+            claude_api_key="test", google_api_key="test", elevenlabs_api_key="test",
+            cache_dir=str(work_dir / "cache"), enable_ffmpeg_governor=False, **overrides
+        )
+        return VideoComposer(config)
+
+    default = composer()
+    settings = default._get_clip_settings(*default._get_output_size())
+    segment = {
+        'segment_number': 1,
+        'text': '테슬라 주가가 상승했습니다',
+        'title': '테슬라 급등',
+        'image_path': '/media/segment_1.png',
+        'audio_path': '/media/segment_1.mp3',
+        'audio_duration': 4.8,
+    }
+
+    def clip_hash(index=0, media_digest="media-a", changes=None, video_composer=None, clip_settings=None):
+        video_composer = video_composer or default
+        return video_composer._get_clip_hash(
+            index, dict(segment, **(changes or {})), media_digest, clip_settings or settings
+        )
+
+    reference = clip_hash()
+    all_passed &= check("Same inputs give the same hash", reference == clip_hash())
+    all_passed &= check(
+        "Hash is stable across composer instances",
+        reference == clip_hash(video_composer=composer())
+    )
+    all_passed &= check(
+        "Narration content is not part of the hash",
+        reference == clip_hash(changes={'audio_path': '/other/narration.mp3', 'text': '다른 자막'})
+    )
+
+    changed = {
+        "media content": clip_hash(media_digest="media-b"),
+        "title": clip_hash(changes={'title': '테슬라 급락'}),
+        "narration length": clip_hash(changes={'audio_duration': 5.2}),
+        "frame-exact clip duration": clip_hash(changes={'clip_duration': 4.1}),
+        "Ken Burns pattern (timeline position)": clip_hash(index=1),
+        "output size": clip_hash(clip_settings=dict(settings, width=1920, height=1080)),
+        "encoding profile": clip_hash(
+            clip_settings=composer(encoding_profile="draft")._get_clip_settings(*default._get_output_size())
+        ),
+    }
+    for name, value in changed.items():
+        all_passed &= check(f"Changing the {name} changes the hash", value != reference)
+
+    # Pre-defined videos have no Ken Burns motion, so their position does not matter
+    video = {'image_path': '/media/clip.mp4'}
+    all_passed &= check(
+        "Video media hash ignores the timeline position",
+        clip_hash(index=0, changes=video) == clip_hash(index=1, changes=video)
+    )
+
+    print()
+    return all_passed
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Clip Cache Test")
+    print("=" * 70 + "\n")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        all_passed = check_clip_cache(work_dir)
+        all_passed &= check_clip_hash(work_dir)
+
+    print("=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test the stream-copy decision of VideoComposer.concatenate_videos.
+
+Clips are only joined with -c copy when ffprobe reports identical video
+stream parameters for all of them; any mismatch, a failed probe or an odd
+stream layout falls back to re-encoding. Probe results are supplied directly
+and the ffmpeg call is recorded instead of run, so no ffmpeg is needed.
+"""
+import tempfile
+from pathlib import Path
+
+import src.video_composer as video_composer_module
+from src.config import Config
+from src.video_composer import VideoComposer
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def probe(with_audio=True, **video_overrides):
+    video = {
+        'codec_type': 'video', 'codec_name': 'h264', 'profile': 'High', 'width': 1080, 'height': 1920,
+        'pix_fmt': 'yuv420p', 'r_frame_rate': '30/1', 'time_base': '1/15360', 'sample_aspect_ratio': '1:1',
+    }
+    video.update(video_overrides)
+    streams = [video]
+    if with_audio:
+        streams.append({'codec_type': 'audio', 'codec_name': 'aac'})
+    return {'streams': streams}
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Concat Stream Copy Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        config = Config(
+            claude_api_key="test", google_api_key="test", elevenlabs_api_key="test",
+            cache_dir=str(work_dir / "cache"), enable_ffmpeg_governor=False
+        )
+        composer = VideoComposer(config)
+        clips = []
+        for i in range(3):
+            clip = work_dir / f"clip_{i}.mp4"
+            clip.write_bytes(b"clip")
+            clips.append(str(clip))
+
+        def compatible(probes):
+            composer._probe_many = lambda paths: {path: result for path, result in zip(paths, probes) if result}
+            return composer._clips_are_stream_compatible(clips)
+
+        cases = [
+            ("Identical clips can be stream-copied", [probe(), probe(), probe()], True),
+            ("Different resolution", [probe(), probe(width=1920, height=1080), probe()], False),
+            ("Different frame rate", [probe(), probe(), probe(r_frame_rate='25/1')], False),
+            ("Different time base", [probe(), probe(time_base='1/12800'), probe()], False),
+            ("Different H.264 profile", [probe(), probe(profile='Main'), probe()], False),
+            ("Different pixel format", [probe(pix_fmt='yuv444p'), probe(), probe()], False),
+            ("Clip without audio among clips with audio", [probe(), probe(with_audio=False), probe()], False),
+            ("Failed probe", [probe(), None, probe()], False),
+            ("Clip with two video streams", [probe(), {'streams': probe()['streams'] * 2}, probe()], False),
+        ]
+        for name, probes, expected in cases:
+            result = compatible(probes)
+            all_passed &= check(f"{name} → {'copy' if expected else 're-encode'}", result == expected)
+
+        # The concat command follows the decision
+        commands = []
+
+        def record_ffmpeg(command, **kwargs):
+            commands.append(command)
+            Path(command[-1]).write_bytes(b"joined")
+
+        original_run_ffmpeg = video_composer_module.run_ffmpeg
+        video_composer_module.run_ffmpeg = record_ffmpeg
+        try:
+            composer._probe_many = lambda paths: {path: probe() for path in paths}
+            composer.concatenate_videos(clips, output_dir=str(work_dir / "out"), stream_copy=True)
+            copied = commands[-1]
+
+            composer._probe_many = lambda paths: {path: probe(width=720) if path == clips[1] else probe() for path in paths}
+            composer.concatenate_videos(clips, output_dir=str(work_dir / "out"), stream_copy=True)
+            fallback = commands[-1]
+
+            composer._probe_many = lambda paths: {path: probe() for path in paths}
+            composer.concatenate_videos(clips, output_dir=str(work_dir / "out"), stream_copy=False)
+            not_requested = commands[-1]
+        finally:
+            video_composer_module.run_ffmpeg = original_run_ffmpeg
+
+        def is_copy(command):
+            return ['-c', 'copy'] == command[command.index('-i') + 2:command.index('-i') + 4]
+
+        all_passed &= check("Compatible clips are joined with -c copy", is_copy(copied), ' '.join(copied))
+        all_passed &= check(
+            "Mismatched clips fall back to re-encoding",
+            not is_copy(fallback) and '-c:v' in fallback,
+            ' '.join(fallback)
+        )
+        all_passed &= check("Without stream_copy the clips are re-encoded", not is_copy(not_requested))
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test how the ffmpeg governor fits commands into a slot's thread budget.
+
+Checks that FfmpegGovernor.apply_threads caps existing -threads values,
+gives every output of a multi-output command its own -threads (input
+options do not count), bounds -filter_complex graphs with
+-filter_complex_threads, and leaves option values alone. The last check runs
+a governed two-output command through ffmpeg to make sure it is still valid.
+"""
+import subprocess
+import tempfile
+from pathlib import Path
+
+from src.utils.ffmpeg_governor import FfmpegGovernor
+
+
+BUDGET = 4
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def output_threads(command: list) -> dict:
+    """Map each output file of a command to the -threads value given for it."""
+    threads = {}
+    current = None
+    i = 1
+    while i < len(command):
+        arg = command[i]
+        if arg == '-i':
+            current = None
+            i += 2
+        elif arg == '-threads':
+            current = command[i + 1]
+            i += 2
+        elif arg.startswith('-') and len(arg) > 1:
+            i += 1 if arg in FfmpegGovernor.VALUELESS_OPTIONS else 2
+        else:
+            threads[arg] = current
+            current = None
+            i += 1
+    return threads
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("ffmpeg Governor Thread Budget Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    governor = FfmpegGovernor(lock_dir=tempfile.mkdtemp(), max_slots=2, cpu_count=8)
+
+    def apply(command):
+        return governor.apply_threads(command, BUDGET)
+
+    # One output
+    command = apply(['ffmpeg', '-y', '-i', 'in.mp4', '-c:v', 'libx264', '-an', 'out.mp4'])
+    all_passed &= check(
+        "Output without -threads gets the budget",
+        command[-3:] == ['-threads', '4', 'out.mp4'] and output_threads(command) == {'out.mp4': '4'},
+        ' '.join(command)
+    )
+    for requested, expected in (('0', '4'), ('16', '4'), ('2', '2')):
+        command = apply(['ffmpeg', '-i', 'in.mp4', '-threads', requested, 'out.mp4'])
+        all_passed &= check(
+            f"-threads {requested} becomes {expected}",
+            command.count('-threads') == 1 and output_threads(command) == {'out.mp4': expected},
+            ' '.join(command)
+        )
+
+    # Decoder threads of an input do not cover the output
+    command = apply(['ffmpeg', '-threads', '12', '-i', 'in.mp4', 'out.mp4'])
+    all_passed &= check(
+        "Input -threads is capped and the output still gets its own",
+        command[1:3] == ['-threads', '4'] and output_threads(command) == {'out.mp4': '4'},
+        ' '.join(command)
+    )
+
+    # Multi-output commands (aspect-ratio variants, audio timeline plus cut points)
+    command = apply([
+        'ffmpeg', '-y', '-i', 'clips.txt', '-stream_loop', '-1', '-i', 'icon.mov',
+        '-filter_complex', '[0:v]split=2[a][b]',
+        '-map', '[a]', '-c:v', 'libx264', '-threads', '0', 'shorts.mp4',
+        '-map', '[b]', '-c:v', 'libx264', 'landscape.mp4',
+        '-map', '0:a', '-f', 'wav', 'audio.wav',
+    ])
+    all_passed &= check(
+        "Every output of a multi-output command gets the budget",
+        output_threads(command) == {'shorts.mp4': '4', 'landscape.mp4': '4', 'audio.wav': '4'},
+        ' '.join(command)
+    )
+    all_passed &= check(
+        "Option values are not mistaken for outputs",
+        command[command.index('-stream_loop') + 1] == '-1' and 'clips.txt' not in output_threads(command)
+    )
+    all_passed &= check(
+        "Filter graph gets -filter_complex_threads",
+        command[command.index('-filter_complex_threads') + 1] == '4',
+        ' '.join(command)
+    )
+
+    command = apply(['ffmpeg', '-filter_complex_threads', '0', '-i', 'in.mp4', '-filter_complex', 'null', 'out.mp4'])
+    all_passed &= check(
+        "Existing -filter_complex_threads is capped, not repeated",
+        command.count('-filter_complex_threads') == 1
+        and command[command.index('-filter_complex_threads') + 1] == '4',
+        ' '.join(command)
+    )
+
+    # The governed command still runs
+    with tempfile.TemporaryDirectory() as temp_dir:
+        outputs = [str(Path(temp_dir) / name) for name in ('first.mp4', 'second.mp4')]
+        command = apply([
+            'ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=10',
+            '-filter_complex', '[0:v]split=2[a][b]',
+            '-map', '[a]', outputs[0],
+            '-map', '[b]', '-threads', '1', outputs[1],
+        ])
+        result = subprocess.run(command, capture_output=True, text=True)
+        all_passed &= check(
+            "Governed two-output command runs in ffmpeg",
+            result.returncode == 0 and all(Path(path).stat().st_size > 0 for path in outputs),
+            result.stderr.strip() or ' '.join(command)
+        )
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
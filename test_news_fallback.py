@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent fallback news search of VideoPipeline.
+
+Checks that _search_fallback_news takes results in priority order (a slow
+higher-priority hit beats a fast lower-priority one), cancels searches still
+queued once a result is taken, respects the concurrency cap, treats failed
+searches as empty and only raises when nothing is found. The news fetcher is
+a scripted stand-in, so no API calls are needed.
+"""
+import threading
+import time
+
+import structlog
+
+from src.config import Config
+from src.pipeline import VideoPipeline
+from src.utils.error_handler import NewsAPIError
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+class ScriptedFetcher:
+    """Answers each keyword after a delay with articles, nothing, or an error."""
+
+    def __init__(self, answers: dict, default_delay: float = 0.2):
+        self.answers = answers  # keyword -> (delay, result); result is a list or an exception
+        self.default_delay = default_delay
+        self.called = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch_top_business_news(self, keyword=None):
+        with self._lock:
+            self.called.append(keyword)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        delay, result = self.answers.get(keyword, (self.default_delay, []))
+        try:
+            time.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_pipeline(fetcher, concurrency=4):
+    pipeline = VideoPipeline.__new__(VideoPipeline)  # Only the news search is exercised
+    pipeline.config = Config(
+        claude_api_key="test", google_api_key="test", elevenlabs_api_key="test",
+        news_search_concurrency=concurrency
+    )
+    pipeline.logger = structlog.get_logger()
+    pipeline.news_fetcher = fetcher
+    return pipeline
+
+
+def search(fetcher, keywords, concurrency=4):
+    started = time.monotonic()
+    try:
+        result = make_pipeline(fetcher, concurrency)._search_fallback_news(keywords)
+    except Exception as e:
+        result = e
+    return result, time.monotonic() - started
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Fallback News Search Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    keywords = VideoPipeline.FALLBACK_KEYWORDS + [None]
+
+    # A slow hit on a higher-priority keyword wins over a fast lower-priority hit
+    fetcher = ScriptedFetcher({
+        'cryptocurrency': (0.5, ["crypto article"]),
+        'stock market': (0.05, ["stock article"]),
+    })
+    result, _ = search(fetcher, keywords)
+    all_passed &= check(
+        "Result is taken in priority order",
+        result == ('cryptocurrency', ["crypto article"]),
+        str(result)
+    )
+
+    # Searches run concurrently: one round-trip instead of one per keyword
+    fetcher = ScriptedFetcher({None: (0.2, ["headline"])})
+    result, seconds = search(fetcher, keywords, concurrency=len(keywords))
+    all_passed &= check(
+        "Keywordless fetch is the last resort",
+        result == (None, ["headline"]),
+        str(result)
+    )
+    all_passed &= check(
+        "All searches share one round-trip",
+        seconds < 0.2 * 2,
+        f"{seconds:.2f}s for {len(keywords)} searches of 0.2s"
+    )
+
+    # The cap bounds concurrent searches, and queued searches are cancelled after a hit
+    fetcher = ScriptedFetcher({'Bitcoin': (0.1, ["bitcoin article"])}, default_delay=0.3)
+    result, _ = search(fetcher, keywords, concurrency=2)
+    all_passed &= check("Concurrency cap is respected", fetcher.max_active <= 2, f"max {fetcher.max_active}")
+    all_passed &= check("First keyword hit is used", result == ('Bitcoin', ["bitcoin article"]), str(result))
+    all_passed &= check(
+        "Queued searches are cancelled after the hit",
+        len(fetcher.called) < len(keywords),
+        f"{len(fetcher.called)} of {len(keywords)} searches started: {fetcher.called}"
+    )
+
+    # Failed searches count as empty while another keyword finds articles
+    fetcher = ScriptedFetcher({
+        'Bitcoin': (0.05, NewsAPIError("quota exceeded")),
+        'AI': (0.1, ["ai article"]),
+    })
+    result, _ = search(fetcher, keywords)
+    all_passed &= check("Failed search is skipped", result == ('AI', ["ai article"]), str(result))
+
+    # Nothing found: empty result, or the first error when a search failed
+    result, _ = search(ScriptedFetcher({}, default_delay=0.01), keywords)
+    all_passed &= check("No articles anywhere gives an empty result", result == (None, []), str(result))
+
+    fetcher = ScriptedFetcher({'economy': (0.01, NewsAPIError("quota exceeded"))}, default_delay=0.01)
+    result, _ = search(fetcher, keywords)
+    all_passed &= check(
+        "No articles and a failed search raises its error",
+        isinstance(result, NewsAPIError),
+        repr(result)
+    )
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
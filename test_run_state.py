@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test the run checkpoints behind `main.py --resume`.
+
+Checks that RunState survives a save/load round-trip, that steps and
+segment content are recorded per article, that kept assets come back as
+workspace copies (pre-defined media is used in place), that incompatible or
+missing runs are rejected, and that old runs are pruned. No API calls are
+needed.
+"""
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.news_fetcher import NewsArticle
+from src.run_state import RunState, article_from_dict, article_to_dict
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Run State Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        runs_dir = str(work_dir / "runs")
+
+        # Articles survive JSON
+        article = NewsArticle(
+            title="Tesla shares jump", description="desc", content="content", url="https://example.com",
+            source="Example", published_at=datetime(2026, 10, 16, 9, 30)
+        )
+        restored_article = article_from_dict(json.loads(json.dumps(article_to_dict(article))))
+        all_passed &= check("Article round-trips through JSON", restored_article == article)
+
+        # Record a run that stopped during the render
+        run_state = RunState(runs_dir)
+        run_state.complete_step("fetch_news", keyword="Tesla", articles=[article_to_dict(article)])
+        run_state.complete_step("generate_script", 1, korean_script="테슬라 주가가 올랐습니다")
+        run_state.complete_step("generate_script", 1, korean_script="테슬라 주가가 올랐습니다")  # Repeated
+        run_state.update_segment(1, 1, title="테슬라 급등", image_prompt="prompt")
+        run_state.update_segment(1, 1, audio_duration=4.2)
+
+        workspace = work_dir / "workspace"
+        workspace.mkdir()
+        narration = workspace / "segment_1.mp3"
+        narration.write_bytes(b"narration bytes")
+        kept_narration = run_state.keep_asset(str(narration))
+        all_passed &= check(
+            "Kept asset is a copy in the run's assets",
+            Path(kept_narration).parent == run_state.assets_dir
+            and Path(kept_narration).read_bytes() == b"narration bytes"
+        )
+        all_passed &= check("Same content is kept once", run_state.keep_asset(str(narration)) == kept_narration)
+        run_state.update_segment(1, 1, audio_path=kept_narration)
+
+        # Resume from disk
+        resumed = RunState.load(runs_dir, run_state.run_id)
+        all_passed &= check("Run-level step is recorded", resumed.is_completed("fetch_news"))
+        all_passed &= check("Per-article step is recorded", resumed.is_completed("generate_script", 1))
+        all_passed &= check("Steps of another article are separate", not resumed.is_completed("generate_script", 2))
+        all_passed &= check(
+            "Repeated step is recorded once",
+            resumed.get_steps_completed(1) == ["generate_script"],
+            str(resumed.get_steps_completed(1))
+        )
+        all_passed &= check(
+            "Results are restored",
+            resumed.get("keyword") == "Tesla" and resumed.get("korean_script", 1) == "테슬라 주가가 올랐습니다"
+        )
+        all_passed &= check(
+            "Segment fields are merged",
+            resumed.get_segment(1, 1) == {
+                "title": "테슬라 급등", "image_prompt": "prompt", "audio_duration": 4.2, "audio_path": kept_narration
+            },
+            str(resumed.get_segment(1, 1))
+        )
+        all_passed &= check("Unknown segment is empty", resumed.get_segment(1, 7) == {})
+
+        # The original workspace is gone on resume: the asset comes back as a fresh copy
+        narration.unlink()
+        new_workspace = work_dir / "workspace_resumed"
+        new_workspace.mkdir()
+        restored = resumed.restore_asset(resumed.get_segment(1, 1)["audio_path"], new_workspace)
+        all_passed &= check(
+            "Kept asset is restored into the new workspace",
+            restored is not None and Path(restored).parent == new_workspace
+            and Path(restored).read_bytes() == b"narration bytes",
+            str(restored)
+        )
+
+        predefined = work_dir / "predefined.mp4"
+        predefined.write_bytes(b"video")
+        all_passed &= check(
+            "Pre-defined media is used in place",
+            resumed.restore_asset(str(predefined), new_workspace) == str(predefined)
+        )
+        all_passed &= check(
+            "Missing asset restores as None",
+            resumed.restore_asset(str(work_dir / "gone.png"), new_workspace) is None
+        )
+        all_passed &= check("Unrecorded asset restores as None", resumed.restore_asset(None, new_workspace) is None)
+
+        # No temp files are left next to the state
+        leftovers = [p.name for p in run_state.run_dir.rglob(".*")]
+        all_passed &= check("State and assets are written atomically", not leftovers, str(leftovers))
+
+        # Unknown or incompatible runs are rejected
+        try:
+            RunState.load(runs_dir, "missing_run")
+            missing_rejected = False
+        except FileNotFoundError:
+            missing_rejected = True
+        all_passed &= check("Missing run raises FileNotFoundError", missing_rejected)
+
+        old_run = RunState(runs_dir, "old_format")
+        old_run.data["version"] = 0
+        old_run.save()
+        try:
+            RunState.load(runs_dir, "old_format")
+            version_rejected = False
+        except ValueError:
+            version_rejected = True
+        all_passed &= check("Incompatible state version raises ValueError", version_rejected)
+
+        # Pruning keeps the newest runs and the current one
+        prune_dir = str(work_dir / "prune")
+        base = time.time() - 1000
+        for i in range(5):
+            state = RunState(prune_dir, f"run_{i}")
+            state.save()
+            os.utime(state.state_path, (base + i, base + i))
+        current = RunState(prune_dir, "current")
+        current.save()
+        os.utime(current.state_path, (base - 100, base - 100))  # Oldest, but in use
+
+        removed = RunState.prune(prune_dir, 3, keep="current")
+        kept = sorted(path.name for path in Path(prune_dir).iterdir())
+        all_passed &= check(
+            "Pruning removes the least recently updated runs",
+            removed == 3 and kept == ["current", "run_3", "run_4"],
+            f"removed {removed}, kept {kept}"
+        )
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test concurrent segment content generation in VideoPipeline.
+
+Checks that _generate_segment_content keeps each provider within its own
+concurrency limit, starts Gemini title and image work right away even while
+narration requests queue for ElevenLabs, assembles segments in order, and
+surfaces a failed segment as an error. The API clients are scripted
+stand-ins, so no API calls are needed.
+"""
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import structlog
+
+from src.config import Config
+from src.pipeline import VideoPipeline
+from src.run_state import RunState
+from src.script_segmenter import ScriptSegment
+from src.utils.error_handler import VideoGenerationError
+
+
+def check(name, passed, detail=""):
+    print(f"{'✓ PASS' if passed else '✗ FAIL'}   {name}")
+    if not passed and detail:
+        print(f"         {detail}")
+    return passed
+
+
+class ProviderMonitor:
+    """Records concurrent calls and first start time per provider."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.active = {}
+        self.max_active = {}
+        self.first_call = {}
+        self._lock = threading.Lock()
+
+    def call(self, provider: str, seconds: float):
+        with self._lock:
+            self.first_call.setdefault(provider, time.monotonic() - self.started)
+            self.active[provider] = self.active.get(provider, 0) + 1
+            self.max_active[provider] = max(self.max_active.get(provider, 0), self.active[provider])
+        try:
+            time.sleep(seconds)
+        finally:
+            with self._lock:
+                self.active[provider] -= 1
+
+
+def make_pipeline(config: Config, monitor: ProviderMonitor, failing_segment=None):
+    pipeline = VideoPipeline.__new__(VideoPipeline)  # Only segment content generation is exercised
+    pipeline.config = config
+    pipeline.logger = structlog.get_logger()
+
+    def generate_title(segment, context=""):
+        monitor.call("gemini_text", 0.02)
+        if segment.segment_number == failing_segment:
+            return None
+        return f"title {segment.segment_number}"
+
+    def generate_image_prompt(segment, context=""):
+        monitor.call("gemini_text", 0.02)
+        return f"prompt {segment.segment_number}"
+
+    def generate_image(prompt, output_dir, aspect_ratio):
+        monitor.call("gemini_image", 0.1)
+        path = Path(output_dir) / f"{prompt.replace(' ', '_')}.png"
+        path.write_bytes(prompt.encode())
+        return str(path)
+
+    def generate_segment_audio(script_text, segment_number, output_dir):
+        monitor.call("elevenlabs", 0.2)
+        path = Path(output_dir) / f"narration_{segment_number}.mp3"
+        path.write_bytes(script_text.encode())
+        return str(path), 3.0
+
+    pipeline.title_generator = SimpleNamespace(generate_title=generate_title)
+    pipeline.image_prompt_generator = SimpleNamespace(generate_image_prompt=generate_image_prompt)
+    pipeline.image_generator = SimpleNamespace(generate_image=generate_image)
+    pipeline.audio_generator = SimpleNamespace(generate_segment_audio=generate_segment_audio)
+    pipeline.media_matcher = SimpleNamespace(find_matching_media=lambda text, title, used_media: None)
+    return pipeline
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Segment Content Concurrency Test")
+    print("=" * 70 + "\n")
+
+    all_passed = True
+    config = Config(
+        claude_api_key="test", google_api_key="test", elevenlabs_api_key="test",
+        gemini_text_concurrency=3, gemini_image_concurrency=2, elevenlabs_concurrency=2
+    )
+    segments = [
+        ScriptSegment(text=f"segment text {i}", segment_number=i, estimated_duration=3.0, word_count=3)
+        for i in range(1, 13)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+
+        def generate(monitor, failing_segment=None, name="run"):
+            workspace = SimpleNamespace(path=work_dir / name)
+            workspace.path.mkdir()
+            run_state = RunState(str(work_dir / "runs"), run_id=name)
+            pipeline = make_pipeline(config, monitor, failing_segment)
+            return pipeline._generate_segment_content(segments, "context", workspace, run_state, 1)
+
+        monitor = ProviderMonitor()
+        started = time.monotonic()
+        segments_data = generate(monitor)
+        seconds = time.monotonic() - started
+
+        limits = {
+            "gemini_text": config.gemini_text_concurrency,
+            "gemini_image": config.gemini_image_concurrency,
+            "elevenlabs": config.elevenlabs_concurrency,
+        }
+        for provider, limit in limits.items():
+            all_passed &= check(
+                f"{provider} stays within its limit of {limit}",
+                0 < monitor.max_active.get(provider, 0) <= limit,
+                f"max {monitor.max_active.get(provider)} concurrent calls"
+            )
+
+        # Narration saturates ElevenLabs, but must not hold back the Gemini work
+        all_passed &= check(
+            "Titles start while narration is queued",
+            monitor.first_call["gemini_text"] < 0.1,
+            f"first title call at {monitor.first_call['gemini_text']:.2f}s"
+        )
+        all_passed &= check(
+            "Images start before the narration is done",
+            monitor.first_call["gemini_image"] < 0.5,
+            f"first image call at {monitor.first_call['gemini_image']:.2f}s"
+        )
+        narration_bound = len(segments) * 0.2 / config.elevenlabs_concurrency
+        all_passed &= check(
+            "Stage takes about as long as the narration alone",
+            seconds < narration_bound + 0.5,
+            f"{seconds:.2f}s (narration needs {narration_bound:.2f}s)"
+        )
+
+        all_passed &= check(
+            "Segments are assembled in order",
+            [data['segment_number'] for data in segments_data] == [s.segment_number for s in segments]
+            and all(data['title'] == f"title {data['segment_number']}" for data in segments_data)
+            and all(Path(data['audio_path']).name == f"narration_{data['segment_number']}.mp3"
+                    for data in segments_data)
+        )
+
+        # A failed segment fails the whole stage
+        try:
+            generate(ProviderMonitor(), failing_segment=5, name="failing")
+            failure_raised = False
+        except VideoGenerationError as e:
+            failure_raised = "segment 5" in str(e)
+        all_passed &= check("Failed segment raises VideoGenerationError", failure_raised)
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
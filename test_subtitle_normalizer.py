@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test and benchmark the single-pass subtitle number normalizer.
+
+Checks known conversions, compares the compiled normalizer with the previous
+rule-by-rule re.sub implementation on random token mixes, and times both.
+"""
+import random
+import re
+import time
+
+from src.subtitle_normalizer import normalize_subtitle_text
+
+
+# Previous implementation: every rule applied one after another
+SEQUENTIAL_RULES = [
+    (r'퍼센트', '%'),
+    (r'(\d+)\s*달러(?=\s|[,.]|$)', r'\1$'),
+    (r'(\d+)\s*원(?=\s|[,.]|$)', r'\1₩'),
+    (r'(억|만|천|백)\s*원(?=\s|[,.]|$)', r'\1₩'),
+    (r'일점오', '1.5'),
+    (r'이점오', '2.5'),
+    (r'삼점오', '3.5'),
+    (r'사점오', '4.5'),
+    (r'오점오', '5.5'),
+    (r'육점오', '6.5'),
+    (r'칠점오', '7.5'),
+    (r'팔점오', '8.5'),
+    (r'구점오', '9.5'),
+    (r'(\d+)\s*억', r'\1억'),
+    (r'(\d+)\s*만', r'\1만'),
+    (r'(?<!\S)일\s*분기', '1분기'),
+    (r'(?<!\S)이\s*분기', '2분기'),
+    (r'(?<!\S)삼\s*분기', '3분기'),
+    (r'(?<!\S)사\s*분기', '4분기'),
+    (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)십억', '10억'),
+    (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)백억', '100억'),
+    (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)천억', '1000억'),
+    (r'(?<!일|이|삼|사|오|육|칠|팔|구|십|백|천)일조', '1조'),
+]
+
+
+def sequential_normalize(text):
+    for pattern, replacement in SEQUENTIAL_RULES:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("Subtitle Normalizer Test")
+    print("=" * 70 + "\n")
+
+    test_cases = [
+        ("테슬라 주가가 이점오 퍼센트 상승했습니다", "테슬라 주가가 2.5 % 상승했습니다"),
+        ("삼 분기 실적이 십억 원을 기록했습니다", "3분기 실적이 10억 원을 기록했습니다"),
+        ("투자 규모는 백억 원입니다", "투자 규모는 100억 원입니다"),
+        ("약 천억 정도", "약 1000억 정도"),
+        ("삼백억", "삼백억"),
+        ("100 달러, 50 원.", "100$, 50₩."),
+        ("5 억 원", "5억₩"),
+        ("1만원", "1만₩"),
+        ("100원입니다", "100원입니다"),
+        ("근원적인", "근원적인"),
+        ("작년일분기", "작년일분기"),
+        ("일점오 억 원", "1.5억₩"),
+        ("일조 달러", "1조 달러"),
+    ]
+
+    all_passed = True
+    for tts_text, expected in test_cases:
+        result = normalize_subtitle_text(tts_text)
+        passed = result == expected
+        all_passed = all_passed and passed
+        print(f"{'✓ PASS' if passed else '✗ FAIL'}   {tts_text:<24} → {result}")
+        if not passed:
+            print(f"         Expected: {expected}")
+
+    # Random token mixes: the single scan must match the sequential rules
+    # ("X점오점오" chains are skipped: the old result depended on rule order)
+    tokens = ["일", "이", "삼", "사", "오", "육", "구", "점오", "십", "백", "천", "억", "만", "조",
+              "원", "달러", "퍼센트", "분기", " ", "5", "12", ",", ".", "을", "가"]
+    rng = random.Random(42)
+    mismatches = 0
+    checked = 0
+    while checked < 50000:
+        text = ''.join(rng.choice(tokens) for _ in range(rng.randint(1, 8)))
+        if "점오점오" in text:
+            continue
+        checked += 1
+        if normalize_subtitle_text(text) != sequential_normalize(text):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"✗ MISMATCH {text!r}: {normalize_subtitle_text(text)!r} != {sequential_normalize(text)!r}")
+    all_passed = all_passed and mismatches == 0
+    print(f"\nEquivalence with sequential rules: {checked - mismatches}/{checked} random texts match")
+
+    # Benchmark on subtitle-sized lines
+    lines = [
+        "테슬라 주가가 이점오 퍼센트 상승하며 시가총액 일조 달러를 회복했습니다",
+        "삼 분기 매출은 오천억 원으로 전년 대비 십억 원 늘었습니다",
+        "엔비디아는 이번 분기 백억 달러 규모의 자사주 매입을 발표했습니다",
+    ] * 2000
+
+    started = time.perf_counter()
+    for line in lines:
+        sequential_normalize(line)
+    sequential_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for line in lines:
+        normalize_subtitle_text(line)
+    single_pass_seconds = time.perf_counter() - started
+
+    print(f"\nBenchmark ({len(lines)} lines):")
+    print(f"  Sequential re.sub rules: {sequential_seconds * 1000:8.1f} ms")
+    print(f"  Single-pass normalizer:  {single_pass_seconds * 1000:8.1f} ms")
+    print(f"  Speedup:                 {sequential_seconds / single_pass_seconds:8.1f}x")
+
+    print("\n" + "=" * 70)
+    print("✓ All tests passed!" if all_passed else "✗ Some tests failed")
+    print("=" * 70)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
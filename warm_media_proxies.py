@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Pre-transcode the predefined media library videos into the proxy cache.
+
+Each video is conformed once to the output geometry (crop, 30fps CFR,
+1 second GOP) so renders with ENABLE_MEDIA_PROXIES=true only trim or loop it.
+"""
+import argparse
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from src.media_proxy import MediaProxyCache
+from src.utils.ffmpeg_governor import configure_ffmpeg_governor
+from src.video_composer import VideoComposer
+
+
+def warm_media_proxies(media_dir: str, aspect_ratio: str, cache_dir: str):
+    """Create missing proxies for every video in the media library."""
+    media_path = Path(media_dir)
+
+    if not media_path.exists():
+        print(f"❌ {media_dir}/ folder not found")
+        return
+
+    videos = sorted(
+        path for path in media_path.rglob("*")
+        if path.is_file() and path.suffix.lower() in {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv'}
+    )
+
+    width, height = VideoComposer.OUTPUT_SIZES.get(aspect_ratio, VideoComposer.OUTPUT_SIZES["1:1"])
+    cache = MediaProxyCache(
+        cache_dir=str(Path(cache_dir) / "media_proxies"),
+        width=width,
+        height=height,
+        fps=VideoComposer.FPS
+    )
+
+    print("=" * 60)
+    print("🎞️  MEDIA PROXY CACHE")
+    print("=" * 60)
+    print(f"Videos: {len(videos)}  |  Proxy size: {width}x{height} @ {VideoComposer.FPS}fps")
+    print(f"Cache: {cache.cache_dir}")
+    print()
+
+    result = cache.warm(videos)
+
+    print("-" * 60)
+    print(f"✓ Created:       {len(result['created'])}")
+    print(f"○ Already cached: {len(result['cached'])}")
+    print(f"✗ Failed:        {len(result['failed'])}")
+    for failed in result['failed']:
+        print(f"  • {failed}")
+    print("-" * 60)
+    print()
+    print("💡 TIP: Set ENABLE_MEDIA_PROXIES=true to render from these proxies")
+    print()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Warm the predefined media proxy cache")
+    parser.add_argument("--media-dir", default="predefined_media", help="Media library folder")
+    parser.add_argument(
+        "--aspect-ratio",
+        default=os.getenv("VIDEO_ASPECT_RATIO", "9:16"),
+        help="Output aspect ratio (9:16, 16:9 or 1:1)"
+    )
+    parser.add_argument("--cache-dir", default=os.getenv("CACHE_DIR", ".cache"), help="Cache folder")
+    args = parser.parse_args()
+
+    # Proxy transcodes run as background work behind renders of other pipeline processes
+    configure_ffmpeg_governor(
+        enabled=os.getenv("ENABLE_FFMPEG_GOVERNOR", "true").lower() == "true",
+        lock_dir=os.getenv("FFMPEG_GOVERNOR_DIR") or None,
+        max_slots=int(os.getenv("FFMPEG_MAX_CONCURRENT", "0"))
+    )
+
+    warm_media_proxies(args.media_dir, args.aspect_ratio, args.cache_dir)